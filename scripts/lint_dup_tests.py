@@ -0,0 +1,95 @@
+"""Lint check that rejects copy-pasted test functions.
+
+Walks every ``test_*.py`` file under a test root, parses with ``ast``, and
+fingerprints each ``test_*`` function by its enclosing class name, its own
+name, and the AST dump of its decorators plus body. Two functions sharing a
+fingerprint in different places are the same test collected twice — pytest
+runs both, doubling the cost without adding coverage.
+
+Keying on the class and test name keeps intentional look-alikes apart: the
+same assertion under a class with different fixtures, or a parametrized body
+reused with other cases, produces a different fingerprint. Run via
+``make lint`` (chained off the ``lint-dup-tests`` target) or directly:
+``python scripts/lint_dup_tests.py [path ...]``.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import sys
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+_MIN_ARGV_FOR_PATHS = 2
+
+Location = tuple[Path, int, str]
+
+
+def iter_test_files(root: Path) -> Iterator[Path]:
+    """Yield every ``test_*.py`` file beneath *root*, sorted for stable output."""
+    yield from sorted(root.rglob("test_*.py"))
+
+
+def _fingerprint(fn: ast.FunctionDef | ast.AsyncFunctionDef, owner: str) -> str:
+    """Hash *fn*'s owner, name, decorators and body (line numbers excluded)."""
+    parts = [owner, fn.name]
+    parts.extend(ast.dump(node) for node in fn.decorator_list)
+    parts.extend(ast.dump(node) for node in fn.body)
+    return hashlib.sha1("\0".join(parts).encode()).hexdigest()
+
+
+def iter_tests(path: Path) -> Iterator[tuple[str, int, str]]:
+    """Yield ``(fingerprint, lineno, qualname)`` for each test in *path*."""
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+
+    def walk(body: Iterable[ast.stmt], owner: str) -> Iterator[tuple[str, int, str]]:
+        for stmt in body:
+            if isinstance(stmt, ast.ClassDef):
+                yield from walk(stmt.body, f"{owner}{stmt.name}.")
+            elif isinstance(
+                stmt, ast.FunctionDef | ast.AsyncFunctionDef
+            ) and stmt.name.startswith("test_"):
+                yield (
+                    _fingerprint(stmt, owner),
+                    stmt.lineno,
+                    f"{owner}{stmt.name}",
+                )
+
+    yield from walk(tree.body, "")
+
+
+def find_duplicates(roots: Iterable[Path]) -> list[list[Location]]:
+    """Return groups of identical tests, each group sorted by location."""
+    seen: dict[str, list[Location]] = {}
+    for root in roots:
+        for path in iter_test_files(root):
+            for fingerprint, lineno, qualname in iter_tests(path):
+                seen.setdefault(fingerprint, []).append((path, lineno, qualname))
+    return [group for group in seen.values() if len(group) > 1]
+
+
+def main(argv: list[str]) -> int:
+    """CLI entry point: print duplicate groups and exit non-zero if any."""
+    if len(argv) < _MIN_ARGV_FOR_PATHS:
+        repo_root = Path(__file__).resolve().parent.parent
+        roots = [repo_root / "tests"]
+    else:
+        roots = [Path(arg).resolve() for arg in argv[1:]]
+    groups = find_duplicates(roots)
+    if not groups:
+        print("lint-dup-tests: no duplicated tests.")
+        return 0
+    for group in groups:
+        first, *rest = group
+        for path, lineno, qualname in rest:
+            print(
+                f"{path}:{lineno}: {qualname} duplicates "
+                f"{first[0]}:{first[1]} {first[2]}"
+            )
+    print(f"\nlint-dup-tests: {len(groups)} duplicated test(s).")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -249,7 +249,7 @@ async def shutdown_runtime() -> None:
         logger.info("Status polling stopped")
 
     if session_monitor is not None:
-        session_monitor.stop()
+        await session_monitor.stop()
         logger.info("Session monitor stopped")
         session_monitor = None
     clear_active_monitor()
@@ -0,0 +1,180 @@
+"""Edge-triggered wakeups for the session monitor poll loop.
+
+On Linux, watches a set of files with inotify (through ctypes, no extra
+dependency) and lets the poll loop sleep until one of them is written,
+created or moved in — or until the poll interval elapses, which remains
+the heartbeat. inotify watches the parent directories; events for other
+names in them (state files the monitor itself saves) are filtered out.
+Watches the kernel drops because a directory was deleted are forgotten,
+so the directory is watched again if it reappears. Elsewhere, or when
+inotify is unavailable, ``wait()`` is a plain sleep, so the loop keeps its
+polling behavior.
+
+Key class: DirWatcher.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+from collections.abc import Iterable
+
+import structlog
+
+logger = structlog.get_logger()
+
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+
+# struct inotify_event header: wd, mask, cookie, len (name follows)
+_EVENT_HEADER = struct.Struct("iIII")
+
+# Minimum gap before a change wakes the loop: coalesces a burst of appends
+# into one poll instead of one poll per write.
+_MIN_WAKE_GAP = 0.1
+_READ_CHUNK = 65536
+
+
+def _load_libc() -> ctypes.CDLL | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        for name in ("inotify_init1", "inotify_add_watch", "inotify_rm_watch"):
+            getattr(libc, name)
+    except OSError, AttributeError:
+        return None
+    return libc
+
+
+class DirWatcher:
+    """Wakes the poll loop early when watched files change."""
+
+    def __init__(self) -> None:
+        self._libc: ctypes.CDLL | None = None
+        self._fd = -1
+        self._watches: dict[str, int] = {}  # directory -> watch descriptor
+        self._names: dict[int, frozenset[bytes]] = {}  # wd -> watched file names
+        self._changed = asyncio.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def active(self) -> bool:
+        return self._fd >= 0
+
+    def start(self) -> bool:
+        """Create the inotify instance on the running loop; False if unavailable."""
+        if self.active:
+            return True
+        libc = _load_libc()
+        if libc is None:
+            return False
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            logger.debug("inotify unavailable: %s", os.strerror(ctypes.get_errno()))
+            return False
+        self._libc = libc
+        self._fd = fd
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(fd, self._drain)
+        return True
+
+    def watch(self, files: Iterable[str]) -> None:
+        """Make the watched set equal to ``files`` (missing directories skipped)."""
+        if self._libc is None or not self.active:
+            return
+        wanted: dict[str, set[bytes]] = {}
+        for path in files:
+            directory, name = os.path.split(path)
+            wanted.setdefault(directory, set()).add(os.fsencode(name))
+        for directory in self._watches.keys() - wanted.keys():
+            wd = self._watches.pop(directory)
+            self._names.pop(wd, None)
+            self._libc.inotify_rm_watch(self._fd, wd)
+        for directory, names in wanted.items():
+            wd = self._watches.get(directory)
+            if wd is None:
+                wd = self._libc.inotify_add_watch(
+                    self._fd, os.fsencode(directory), _WATCH_MASK
+                )
+                if wd < 0:
+                    continue
+                self._watches[directory] = wd
+            self._names[wd] = frozenset(names)
+
+    async def wait(self, timeout: float) -> bool:
+        """Sleep until a watched file changes or ``timeout`` elapses.
+
+        Returns True when woken by a change, False on timeout.
+        """
+        if not self.active:
+            await asyncio.sleep(timeout)
+            return False
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        await asyncio.sleep(min(_MIN_WAKE_GAP, timeout))
+        remaining = deadline - loop.time()
+        if not self._changed.is_set() and remaining > 0:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._changed.wait(), remaining)
+        woke = self._changed.is_set()
+        self._changed.clear()
+        return woke
+
+    def close(self) -> None:
+        """Stop watching and release the inotify fd."""
+        if not self.active:
+            return
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.remove_reader(self._fd)
+        self._loop = None
+        os.close(self._fd)
+        self._fd = -1
+        self._watches.clear()
+        self._names.clear()
+
+    def _drain(self) -> None:
+        changed = False
+        try:
+            while chunk := os.read(self._fd, _READ_CHUNK):
+                changed |= self._scan(chunk)
+        except BlockingIOError:
+            pass
+        except OSError:
+            logger.debug("inotify read failed", exc_info=True)
+        if changed:
+            self._changed.set()
+
+    def _scan(self, chunk: bytes) -> bool:
+        """Consume one read's worth of events; True if a watched file changed."""
+        changed = False
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(chunk):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(chunk, offset)
+            offset += _EVENT_HEADER.size
+            name = chunk[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & _IN_Q_OVERFLOW:
+                changed = True
+            elif mask & _IN_IGNORED:
+                self._forget(wd)
+            elif name in self._names.get(wd, ()):
+                changed = True
+        return changed
+
+    def _forget(self, wd: int) -> None:
+        # The kernel already dropped this watch (directory deleted or unmounted).
+        self._names.pop(wd, None)
+        for directory, watched in list(self._watches.items()):
+            if watched == wd:
+                del self._watches[directory]
@@ -4,67 +4,111 @@ Pure I/O: reads new lines from events.jsonl by byte offset, parses them as
 HookEvent objects, and returns both the events and the new offset. The caller
 is responsible for persisting the offset (e.g., in MonitorState).
 
-Key function: read_new_events().
+Key class: EventLogReader (read_new_events(), with the fd cached across polls).
 """
 
+import contextlib
 import json
+import os
 from pathlib import Path
 
-import aiofiles
 import structlog
 
+from . import fast_json
 from .providers.base import HookEvent
+from .utils import to_thread_settled
 
 logger = structlog.get_logger()
 
 
-async def read_new_events(
-    path: Path, current_offset: int
-) -> tuple[list[HookEvent], int]:
-    """Read new hook events from events.jsonl starting at current_offset.
+def _parse_events(chunk: bytes, start: int) -> tuple[list[HookEvent], int]:
+    """Parse the complete lines of ``chunk`` (read at ``start``).
 
-    Returns (events, new_offset). On error returns ([], current_offset).
-    Detects file truncation and resets offset to 0 automatically.
+    Returns (events, offset past the last newline). A trailing partial write
+    is left unconsumed.
     """
-    if not path.exists():
-        return [], current_offset
+    complete, sep, _ = chunk.rpartition(b"\n")
+    if not sep:
+        return [], start
 
     events: list[HookEvent] = []
-    new_offset = current_offset
-
-    try:
-        async with aiofiles.open(path, "r", encoding="utf-8") as f:
-            await f.seek(0, 2)
-            file_size = await f.tell()
-            if current_offset > file_size:
-                current_offset = 0
-                new_offset = 0
-            await f.seek(current_offset)
-
-            async for line in f:
-                line = line.strip()
-                if not line:
-                    new_offset = await f.tell()
-                    continue
-                try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
-                    logger.debug("Skipping malformed event line")
-                    new_offset = await f.tell()
-                    continue
-
-                events.append(
-                    HookEvent(
-                        event_type=data.get("event", ""),
-                        window_key=data.get("window_key", ""),
-                        session_id=data.get("session_id", ""),
-                        data=data.get("data", {}),
-                        timestamp=data.get("ts", 0.0),
-                    )
-                )
-                new_offset = await f.tell()
-
-    except OSError:
-        logger.debug("Could not read events file %s", path)
-
-    return events, new_offset
+    for line in complete.split(b"\n"):
+        if not line.strip():
+            continue
+        try:
+            data = fast_json.loads(line)
+        except json.JSONDecodeError, UnicodeDecodeError:
+            logger.debug("Skipping malformed event line")
+            continue
+
+        events.append(
+            HookEvent(
+                event_type=data.get("event", ""),
+                window_key=data.get("window_key", ""),
+                session_id=data.get("session_id", ""),
+                data=data.get("data", {}),
+                timestamp=data.get("ts", 0.0),
+            )
+        )
+
+    return events, start + len(complete) + 1
+
+
+class EventLogReader:
+    """Polls events.jsonl through one fd kept open across calls.
+
+    Each call costs a single ``stat`` of the path when nothing was appended;
+    new bytes are fetched with ``pread`` on the cached fd. A changed inode
+    (the log was replaced) reopens the file and reads it from the start; a
+    size below the offset (truncation) also restarts from 0.
+    """
+
+    def __init__(self) -> None:
+        self._fd = -1
+        self._ino = 0
+
+    async def read_new_events(
+        self, path: Path, current_offset: int
+    ) -> tuple[list[HookEvent], int]:
+        """Read new hook events from ``path`` starting at ``current_offset``.
+
+        Returns (events, new_offset). A missing file or read error returns
+        ([], current_offset). Only newline-terminated lines are consumed; a
+        trailing partial write is left for the next call.
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            self.close()
+            return [], current_offset
+
+        replaced = self._ino != 0 and st.st_ino != self._ino
+        if replaced:
+            self.close()
+        self._ino = st.st_ino
+        start = 0 if replaced or current_offset > st.st_size else current_offset
+        if st.st_size == start:
+            return [], start
+
+        try:
+            if self._fd < 0:
+                self._fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+            chunk = await to_thread_settled(
+                os.pread, self._fd, st.st_size - start, start
+            )
+        except OSError:
+            logger.debug("Could not read events file %s", path)
+            self.close()
+            return [], current_offset
+
+        return _parse_events(chunk, start)
+
+    def close(self) -> None:
+        """Release the cached fd (reopened on the next read).
+
+        The inode is remembered so a log recreated meanwhile is read from 0.
+        """
+        if self._fd >= 0:
+            with contextlib.suppress(OSError):
+                os.close(self._fd)
+            self._fd = -1
@@ -0,0 +1,37 @@
+"""JSON decoding for the transcript and hook-event hot paths.
+
+Uses orjson when the optional ``fast-json`` extra is installed and falls
+back to the stdlib otherwise. Module-level conditional import, same as the
+edge-tts backend: the choice is made once at import time.
+
+orjson is stricter than the stdlib: it rejects lone-surrogate escapes
+(``"\\ud83d"``, emitted by JS for a split emoji) and ``NaN``. Any input
+orjson refuses is retried with json.loads, so the fast path never rejects
+a line the stdlib would accept. A line that is really malformed still
+raises json.JSONDecodeError (orjson's error subclasses it). Both backends
+accept ``str`` and ``bytes``.
+
+Key function: loads().
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+loads: Callable[[str | bytes | bytearray], Any] = json.loads
+
+try:
+    import orjson
+except ImportError:
+    pass
+else:
+
+    def _orjson_loads(data: str | bytes | bytearray) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+    loads = _orjson_loads
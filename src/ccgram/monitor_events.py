@@ -1,9 +1,12 @@
 """Event data types for the session monitor subsystem.
 
 Dependency-free dataclasses shared between transcript_reader, session_monitor,
-and handler modules. Keeping these in a dedicated module breaks the import
-cycles that arise when transcript_reader and session_monitor each import the
-other to access these types.
+and handler modules. They are slotted: one is built per detected message or
+window, so skipping the per-instance ``__dict__`` keeps them small.
+
+Keeping these in a dedicated module breaks the import cycles that arise when
+transcript_reader and session_monitor each import the other to access these
+types.
 
 All three types are re-exported from session_monitor for backward-compatible
 imports — external code should continue importing from session_monitor.
@@ -15,7 +18,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionInfo:
     """Information about a Claude Code session file."""
 
@@ -23,7 +26,7 @@ class SessionInfo:
     file_path: Path
 
 
-@dataclass
+@dataclass(slots=True)
 class NewMessage:
     """A new message detected by the monitor."""
 
@@ -37,7 +40,7 @@ class NewMessage:
     tool_name: str | None = None  # For tool_use messages, the tool name
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NewWindowEvent:
     """A new tmux window detected via session_map changes."""
 
@@ -8,8 +8,10 @@ Key classes: MonitorState, TrackedSession.
 """
 
 import json
+import time
+
 import structlog
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -18,7 +20,7 @@ from .utils import atomic_write_json
 logger = structlog.get_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackedSession:
     """State for a tracked Claude Code session."""
 
@@ -28,7 +30,11 @@ class TrackedSession:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dict for JSON serialization."""
-        return asdict(self)
+        return {
+            "session_id": self.session_id,
+            "file_path": self.file_path,
+            "last_byte_offset": self.last_byte_offset,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "TrackedSession":
@@ -47,12 +53,18 @@ class MonitorState:
     Stores tracking information for all monitored sessions
     and the events.jsonl byte offset to prevent replaying
     historical hook events after restarts.
+
+    ``flush_interval`` makes ``save_if_dirty`` write-behind: mutations
+    only mark the state dirty, and at most one write happens per interval
+    (the default 0 writes on every dirty call). ``save()`` always writes immediately.
     """
 
     state_file: Path
     tracked_sessions: dict[str, TrackedSession] = field(default_factory=dict)
     events_offset: int = 0
+    flush_interval: float = 0.0
     _dirty: bool = field(default=False, repr=False)
+    _last_save: float | None = field(default=None, repr=False)
 
     def load(self) -> None:
         """Load state from file."""
@@ -86,6 +98,7 @@ class MonitorState:
         try:
             atomic_write_json(self.state_file, data)
             self._dirty = False
+            self._last_save = time.monotonic()
         except OSError:
             logger.exception("Failed to save state file")
 
@@ -104,7 +117,18 @@ class MonitorState:
             del self.tracked_sessions[session_id]
             self._dirty = True
 
-    def save_if_dirty(self) -> None:
-        """Save state only if it has been modified."""
-        if self._dirty:
-            self.save()
+    def save_if_dirty(self, *, force: bool = False) -> None:
+        """Save state only if it has been modified.
+
+        Within ``flush_interval`` of the last save the write is deferred
+        (the dirty flag stays set) unless ``force`` is True.
+        """
+        if not self._dirty:
+            return
+        if (
+            not force
+            and self._last_save is not None
+            and time.monotonic() - self._last_save < self.flush_interval
+        ):
+            return
+        self.save()
@@ -20,6 +20,7 @@ Base class:
 import json
 from typing import Any, ClassVar, cast
 
+from ccgram import fast_json
 from ccgram.providers.base import (
     AgentMessage,
     ContentType,
@@ -37,7 +38,7 @@ def parse_jsonl_line(line: str) -> dict[str, Any] | None:
     if not line or not line.strip():
         return None
     try:
-        result = json.loads(line)
+        result = fast_json.loads(line)
         return result if isinstance(result, dict) else None
     except json.JSONDecodeError:
         return None
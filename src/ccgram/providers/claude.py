@@ -7,7 +7,9 @@ that translates between the provider protocol and existing module APIs.
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Awaitable, Callable
+from pathlib import Path
 from typing import Any, cast
 
 import structlog
@@ -308,22 +310,21 @@ class ClaudeProvider:
         transcript_path: str,
     ) -> None:
         """Seed Claude task-tracking state by reading the full transcript once."""
-        # Lazy: aiofiles is heavy; defer until the JSONL reader actually opens a file
-        import aiofiles
-
         # Lazy: claude_task_state ↔ claude provider cycle
         from ccgram.claude_task_state import claude_task_state
 
         entries: list[dict] = []
         try:
-            async with aiofiles.open(transcript_path, "r", encoding="utf-8") as f:
-                async for line in f:
-                    data = self.parse_transcript_line(line)
-                    if data:
-                        entries.append(data)
+            content = await asyncio.to_thread(
+                Path(transcript_path).read_text, encoding="utf-8"
+            )
         except OSError:
             _log.exception("seed_task_state: error reading %s", transcript_path)
             return
+        for line in content.split("\n"):
+            data = self.parse_transcript_line(line)
+            if data:
+                entries.append(data)
         claude_task_state.rebuild_from_entries(window_id, session_id, entries)
 
     def apply_task_entries(
@@ -7,11 +7,20 @@ Used by terminal_parser.py for robust status and interactive UI detection.
 Key class: ScreenBuffer — create, feed raw text, read rendered lines.
 """
 
+import re
+
 import structlog
 import pyte
+from pyte.screens import wcwidth
 
 logger = structlog.get_logger()
 
+# Anything pyte's stream would dispatch to a control handler, except the
+# CR/LF pair that the plain-text fast path replays itself.
+_CONTROL_RE = re.compile(r"[\x00-\x09\x0b\x0c\x0e-\x1f\x7f\x9b\x9d]")
+
+_WIDE_CHAR_WIDTH = 2
+
 
 class ScreenBuffer:
     """Virtual terminal screen backed by pyte.
@@ -34,17 +43,66 @@ class ScreenBuffer:
         return self._screen.lines
 
     def feed(self, raw_text: str) -> None:
-        """Feed raw terminal text (with ANSI escapes) into the screen."""
+        """Feed raw terminal text (with ANSI escapes) into the screen.
+
+        Escape-free text (plain captures, pasted logs) skips pyte's parser
+        state machine and is drawn directly, with CR/LF replayed as cursor
+        moves — only when the stream is not mid-sequence from a prior feed.
+        That state is pyte's private ``Stream._taking_plain_text``; pyte is
+        pinned below 0.9 and a test asserts the attribute still behaves.
+        """
         try:
-            self._stream.feed(raw_text)
+            if _CONTROL_RE.search(raw_text) is None and self._stream._taking_plain_text:
+                self._draw_plain(raw_text)
+            else:
+                self._stream.feed(raw_text)
         except TypeError, ValueError, KeyError, IndexError, UnicodeDecodeError:
             logger.debug("pyte feed error, resetting screen", exc_info=True)
             self._screen.reset()
 
+    def _draw_plain(self, text: str) -> None:
+        screen = self._screen
+        for i, line in enumerate(text.split("\n")):
+            if i:
+                screen.linefeed()
+            for j, segment in enumerate(line.split("\r")):
+                if j:
+                    screen.carriage_return()
+                if segment:
+                    screen.draw(segment)
+
+    def get_line(self, row: int) -> str:
+        """Rendered text of one screen row with trailing whitespace stripped.
+
+        Reads pyte's sparse buffer directly: only populated cells are
+        visited (gaps render as spaces), instead of densifying every column
+        the way ``pyte.Screen.display`` does. Wide characters swallow the
+        stub cell that follows them, matching pyte's rendering.
+        """
+        if row < 0 or row >= self._screen.lines:
+            return ""
+        line = self._screen.buffer.get(row)
+        if not line:
+            return ""
+        columns = self._screen.columns
+        parts: list[str] = []
+        col = 0
+        for x in sorted(line):
+            if x >= columns:
+                break
+            if x < col:  # stub cell of a preceding wide character
+                continue
+            if x > col:
+                parts.append(" " * (x - col))
+            data = line[x].data
+            parts.append(data)
+            col = x + 2 if data and wcwidth(data[0]) == _WIDE_CHAR_WIDTH else x + 1
+        return "".join(parts).rstrip()
+
     @property
     def display(self) -> list[str]:
         """Rendered lines with trailing whitespace stripped."""
-        return [line.rstrip() for line in self._screen.display]
+        return [self.get_line(row) for row in range(self._screen.lines)]
 
     @property
     def rendered_text(self) -> str:
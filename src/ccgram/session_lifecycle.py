@@ -47,6 +47,8 @@ class SessionLifecycle:
 
     def __init__(self) -> None:
         self._last_session_map: dict[str, dict[str, str]] = {}
+        # window_id (full key or any ":"-suffix of it) -> session_id
+        self._window_index: dict[str, str | None] = {}
 
     @property
     def last_session_map(self) -> dict[str, dict[str, str]]:
@@ -54,10 +56,24 @@ class SessionLifecycle:
 
     def resolve_session_id(self, window_id: str) -> str | None:
         """Return the session_id for window_id from the last known session_map."""
-        for wid, details in self._last_session_map.items():
-            if wid.endswith(f":{window_id}") or wid == window_id:
-                return details.get("session_id")
-        return None
+        return self._window_index.get(window_id)
+
+    def _set_last_session_map(self, session_map: dict[str, dict[str, str]]) -> None:
+        """Store the map and rebuild the window_id reverse index.
+
+        A key like ``ccgram:@5`` resolves by its full name and by each
+        ``:``-suffix (``@5``); the first key in map order wins.
+        """
+        index: dict[str, str | None] = {}
+        for wid, details in session_map.items():
+            session_id = details.get("session_id")
+            index.setdefault(wid, session_id)
+            start = wid.find(":")
+            while start >= 0:
+                index.setdefault(wid[start + 1 :], session_id)
+                start = wid.find(":", start + 1)
+        self._last_session_map = session_map
+        self._window_index = index
 
     def reconcile(
         self,
@@ -71,42 +87,41 @@ class SessionLifecycle:
         clean up its own per-session state dicts.
         """
         result = ReconcileResult(current_map=current_map)
+        last_map = self._last_session_map
 
-        old_windows = set(self._last_session_map.keys())
-        current_windows = set(current_map.keys())
-
-        # Session changed: window in both maps but session_id differs
-        for window_id, old_details in self._last_session_map.items():
+        # One pass over the old map: each window costs a single lookup in the
+        # new one, instead of building key sets and diffing them.
+        for window_id, old_details in last_map.items():
             new_details = current_map.get(window_id)
-            if new_details and new_details["session_id"] != old_details["session_id"]:
+            old_sid = old_details["session_id"]
+            if new_details is None:
+                # Deleted: window in old map but not current
+                logger.info(
+                    "Window '%s' deleted, removing session %s",
+                    window_id,
+                    old_sid,
+                )
+            elif new_details["session_id"] != old_sid:
+                # Session changed: window in both maps but session_id differs
                 logger.info(
                     "Window '%s' session changed: %s -> %s",
                     window_id,
-                    old_details["session_id"],
+                    old_sid,
                     new_details["session_id"],
                 )
-                result.sessions_to_remove.add(old_details["session_id"])
                 result.changed_windows[window_id] = new_details
-                idle_tracker.clear_session(old_details["session_id"])
-                claude_task_state.clear_window(window_id)
-
-        # Deleted: window in old map but not current
-        for window_id in old_windows - current_windows:
-            old_sid = self._last_session_map[window_id]["session_id"]
-            logger.info(
-                "Window '%s' deleted, removing session %s",
-                window_id,
-                old_sid,
-            )
+            else:
+                continue
             result.sessions_to_remove.add(old_sid)
             idle_tracker.clear_session(old_sid)
             claude_task_state.clear_window(window_id)
 
         # New windows
-        for window_id in current_windows - old_windows:
-            result.new_windows[window_id] = current_map[window_id]
+        for window_id, details in current_map.items():
+            if window_id not in last_map:
+                result.new_windows[window_id] = details
 
-        self._last_session_map = current_map
+        self._set_last_session_map(current_map)
         return result
 
     def handle_subagent_start(self, window_id: str, subagent_id: str, name: str) -> int:
@@ -147,7 +162,7 @@ class SessionLifecycle:
 
     def initialize(self, session_map: dict[str, dict[str, str]]) -> None:
         """Set initial session_map (called once at monitor startup)."""
-        self._last_session_map = session_map
+        self._set_last_session_map(session_map)
 
 
 session_lifecycle = SessionLifecycle()
@@ -31,8 +31,6 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any, cast
 
-import aiofiles
-
 from .config import config
 from .utils import atomic_write_json
 from .window_resolver import EMDASH_SESSION_PREFIX, is_foreign_window, is_window_id
@@ -204,11 +202,8 @@ class SessionMapSync:
         Also cleans up window_states entries not in current session_map.
         Updates window_display_names from the "window_name" field in values.
         """
-        if not config.session_map_file.exists():
-            return
         try:
-            async with aiofiles.open(config.session_map_file, "r") as f:
-                content = await f.read()
+            content = await asyncio.to_thread(config.session_map_file.read_bytes)
             session_map = json.loads(content)
         except (json.JSONDecodeError, OSError):  # fmt: skip
             return
@@ -346,8 +341,9 @@ class SessionMapSync:
         while loop.time() < deadline:
             try:
                 if config.session_map_file.exists():
-                    async with aiofiles.open(config.session_map_file, "r") as f:
-                        content = await f.read()
+                    content = await asyncio.to_thread(
+                        config.session_map_file.read_bytes
+                    )
                     session_map = json.loads(content)
                     info = session_map.get(key, {})
                     if info.get("session_id"):
@@ -386,13 +382,20 @@ class SessionMapSync:
             return
 
         prefix = f"{config.tmux_session_name}:"
+        # Live keys are formatted once; the common case (entry alive) is a
+        # single set lookup instead of a slice + validation per key.
+        live_keys = {f"{prefix}{wid}" for wid in live_window_ids}
+        kept: dict[str, Any] = {}
         dead_entries: list[tuple[str, str]] = []  # (map_key, window_id)
-        for key in raw:
-            if not key.startswith(prefix):
+        for key, info in raw.items():
+            if key in live_keys or not key.startswith(prefix):
+                kept[key] = info
                 continue
             window_id = key[len(prefix) :]
-            if is_window_id(window_id) and window_id not in live_window_ids:
+            if is_window_id(window_id):
                 dead_entries.append((key, window_id))
+            else:
+                kept[key] = info
 
         if not dead_entries:
             return
@@ -402,12 +405,11 @@ class SessionMapSync:
             logger.info(
                 "Pruning dead session_map entry: %s (window %s)", key, window_id
             )
-            del raw[key]
             if window_store.has_window(window_id):
                 window_store.remove_window(window_id)
                 changed_state = True
 
-        atomic_write_json(config.session_map_file, raw)
+        atomic_write_json(config.session_map_file, kept)
         if changed_state:
             self._schedule_save()
 
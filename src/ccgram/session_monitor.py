@@ -5,8 +5,10 @@ Orchestrates the session-monitoring subsystem:
   2. Reconciles session_map changes via SessionLifecycle.
   3. Reads transcript updates via TranscriptReader.
   4. Emits NewMessage / NewWindowEvent to registered callbacks.
+  5. Sleeps until a watched file changes or the poll interval elapses.
 
 All heavy logic lives in the extracted modules:
+  - dir_watcher.py    — inotify wakeups for the poll loop (Linux)
   - event_reader.py   — reads events.jsonl incrementally
   - idle_tracker.py   — per-session idle timers
   - session_lifecycle.py — session-map diff, claude_task_state authority
@@ -17,15 +19,18 @@ Re-exported from transcript_reader for backward-compatible imports.
 """
 
 import asyncio
+import contextlib
+import os
+import time
 import structlog
 from collections.abc import Awaitable, Callable
 from pathlib import Path
-from typing import Any
 
 from telegram.error import TelegramError
 
 from .config import config
-from .event_reader import read_new_events
+from .dir_watcher import DirWatcher
+from .event_reader import EventLogReader
 from .idle_tracker import IdleTracker
 from .monitor_state import MonitorState
 from .providers import get_provider_for_window, registry  # noqa: F401 (used by test patches)
@@ -36,7 +41,6 @@ from .monitor_events import NewMessage, NewWindowEvent, SessionInfo
 from .transcript_reader import TranscriptReader
 from .utils import task_done_callback
 
-import aiofiles
 import json
 
 # Re-export for backward-compatible imports from other modules
@@ -55,6 +59,11 @@ _LoopError = (OSError, RuntimeError, json.JSONDecodeError, ValueError, TelegramE
 _BACKOFF_MIN = 2.0
 _BACKOFF_MAX = 30.0
 _MSG_PREVIEW_LENGTH = 80
+# Offsets advance on nearly every poll; coalesce monitor_state.json writes.
+_STATE_FLUSH_INTERVAL = 5.0
+# Sessions in flight per poll (see _process_sessions).
+_POLL_BATCH_MIN = 4
+_POLL_BATCH_MAX = 32
 
 logger = structlog.get_logger()
 
@@ -82,7 +91,10 @@ class SessionMonitor:
             poll_interval if poll_interval is not None else config.monitor_poll_interval
         )
 
-        self.state = MonitorState(state_file=state_file or config.monitor_state_file)
+        self.state = MonitorState(
+            state_file=state_file or config.monitor_state_file,
+            flush_interval=_STATE_FLUSH_INTERVAL,
+        )
         self.state.load()
 
         self._running = False
@@ -100,6 +112,12 @@ class SessionMonitor:
 
         self._idle_tracker = IdleTracker()
         self._transcript_reader = TranscriptReader(self.state, self._idle_tracker)
+        # Bound straight to the reader (no delegating coroutine per session);
+        # instance attributes, so tests can still replace them with spies.
+        self._process_session_file = self._transcript_reader._process_session_file
+        self._read_new_lines = self._transcript_reader._read_new_lines
+        self._dir_watcher = DirWatcher()
+        self._event_log = EventLogReader()
 
     # Delegation properties for backward-compatible test access
     @property
@@ -145,68 +163,122 @@ class SessionMonitor:
         if session_id:
             self._idle_tracker.record_activity(session_id)
 
-    async def check_for_updates(self, current_map: dict) -> list[NewMessage]:
+    async def check_for_updates(
+        self, current_map: dict, *, include_fallback: bool = True
+    ) -> list[NewMessage]:
         """Check all sessions for new assistant messages.
 
         Routes sessions to _process_session_file (allowing test spying) and
         delegates the actual I/O to TranscriptReader. Uses _get_active_cwds()
-        for fallback session discovery so tests can stub tmux calls.
+        for fallback session discovery so tests can stub tmux calls;
+        ``include_fallback=False`` skips that discovery (file-change wakes).
         """
         new_messages: list[NewMessage] = []
         sid_to_wid = {v["session_id"]: wid for wid, v in current_map.items()}
 
         direct_sessions: list[tuple[str, Path]] = []
         fallback_session_ids: set[str] = set()
+        # One stat per transcript: the existence probe here is reused by
+        # TranscriptReader for mtime/size change detection.
+        stats: dict[str, os.stat_result] = {}
 
         for details in current_map.values():
             session_id = details["session_id"]
             transcript_path = details.get("transcript_path", "")
             if transcript_path:
                 path = Path(transcript_path)
-                if path.exists():
+                try:
+                    stats[str(path)] = path.stat()
+                except OSError:
+                    pass
+                else:
                     direct_sessions.append((session_id, path))
                     continue
             fallback_session_ids.add(session_id)
-
-        for session_id, file_path in direct_sessions:
-            try:
-                await self._process_session_file(
-                    session_id,
-                    file_path,
+        self._transcript_reader.prime_stats(stats, time.monotonic())
+        try:
+            await self._process_sessions(direct_sessions, sid_to_wid, new_messages)
+
+            if fallback_session_ids and include_fallback:
+                active_cwds = await self._get_active_cwds()
+                sessions = self._scan_projects_sync(active_cwds) if active_cwds else []
+                await self._process_sessions(
+                    [
+                        (info.session_id, info.file_path)
+                        for info in sessions
+                        if info.session_id in fallback_session_ids
+                    ],
+                    sid_to_wid,
                     new_messages,
-                    window_id=sid_to_wid.get(session_id, ""),
                 )
-            except Exception:
-                logger.exception("Error processing session %s", session_id)
+        finally:
+            self._transcript_reader.end_poll()
 
-        if fallback_session_ids:
-            active_cwds = await self._get_active_cwds()
-            sessions = self._scan_projects_sync(active_cwds) if active_cwds else []
-            for session_info in sessions:
-                if session_info.session_id not in fallback_session_ids:
-                    continue
-                try:
-                    await self._process_session_file(
-                        session_info.session_id,
-                        session_info.file_path,
-                        new_messages,
-                        window_id=sid_to_wid.get(session_info.session_id, ""),
+        self.state.save_if_dirty()
+        return new_messages
+
+    async def _process_sessions(
+        self,
+        sessions: list[tuple[str, Path]],
+        sid_to_wid: dict[str, str],
+        new_messages: list[NewMessage],
+    ) -> None:
+        """Process session files concurrently through a sliding window.
+
+        At most half the pending sessions, clamped to
+        [_POLL_BATCH_MIN, _POLL_BATCH_MAX], are in flight at once: a busy poll
+        overlaps one session's read with another's parse without flooding the
+        default executor, and a slot freed by a finished session is refilled
+        immediately rather than waiting for the slowest one in a batch.
+        Messages are appended in session order regardless of completion
+        order; a session listed twice is processed once so two reads never
+        race on the same offset.
+        """
+        unique: dict[str, Path] = {}
+        for session_id, file_path in sessions:
+            unique.setdefault(session_id, file_path)
+        if not unique:
+            return
+        pending = list(unique.items())
+        window = min(_POLL_BATCH_MAX, max(_POLL_BATCH_MIN, len(pending) // 2))
+        outputs: list[list[NewMessage]] = [[] for _ in pending]
+        if len(pending) <= window:
+            await asyncio.gather(
+                *(
+                    self._process_session_safe(
+                        sid, path, outputs[i], sid_to_wid.get(sid, "")
                     )
-                except Exception:
-                    logger.exception(
-                        "Error processing session %s", session_info.session_id
+                    for i, (sid, path) in enumerate(pending)
+                )
+            )
+        else:
+            slots = asyncio.Semaphore(window)
+
+            async def run(i: int, sid: str, path: Path) -> None:
+                async with slots:
+                    await self._process_session_safe(
+                        sid, path, outputs[i], sid_to_wid.get(sid, "")
                     )
 
-        self.state.save_if_dirty()
-        return new_messages
+            await asyncio.gather(
+                *(run(i, sid, path) for i, (sid, path) in enumerate(pending))
+            )
+        for out in outputs:
+            new_messages.extend(out)
 
-    async def _process_session_file(
-        self, session_id: str, file_path: Path, new_messages: list, window_id: str = ""
+    async def _process_session_safe(
+        self,
+        session_id: str,
+        file_path: Path,
+        new_messages: list[NewMessage],
+        window_id: str,
     ) -> None:
-        """Process a single session file (delegates to TranscriptReader)."""
-        await self._transcript_reader._process_session_file(
-            session_id, file_path, new_messages, window_id=window_id
-        )
+        try:
+            await self._process_session_file(
+                session_id, file_path, new_messages, window_id=window_id
+            )
+        except Exception:
+            logger.exception("Error processing session %s", session_id)
 
     def _scan_projects_sync(self, active_cwds: set) -> list:
         """Scan projects synchronously (delegates to TranscriptReader)."""
@@ -218,21 +290,13 @@ class SessionMonitor:
         """Get normalized cwds of all active tmux windows (delegates to TranscriptReader)."""
         return await self._transcript_reader._get_active_cwds()
 
-    async def _read_new_lines(
-        self, session: Any, file_path: Path, window_id: str = ""
-    ) -> list:
-        """Read new lines from session file (delegates to TranscriptReader)."""
-        return await self._transcript_reader._read_new_lines(
-            session, file_path, window_id
-        )
-
     async def _read_hook_events(self) -> None:
         """Read new lines from events.jsonl and dispatch via callback."""
         if not self._hook_event_callback:
             return
 
         offset_before = self.state.events_offset
-        events, new_offset = await read_new_events(
+        events, new_offset = await self._event_log.read_new_events(
             config.events_file, self.state.events_offset
         )
         self.state.events_offset = new_offset
@@ -247,16 +311,13 @@ class SessionMonitor:
 
     async def _load_current_session_map(self) -> dict[str, dict[str, str]]:
         """Load current session_map and return window_key -> details mapping."""
-        if config.session_map_file.exists():
-            try:
-                async with aiofiles.open(config.session_map_file, "r") as f:
-                    content = await f.read()
-                raw = json.loads(content)
-                prefix = f"{config.tmux_session_name}:"
-                return parse_session_map(raw, prefix)
-            except _SessionMapError:
-                pass
-        return {}
+        try:
+            content = await asyncio.to_thread(config.session_map_file.read_bytes)
+            raw = json.loads(content)
+        except _SessionMapError:
+            return {}
+        prefix = f"{config.tmux_session_name}:"
+        return parse_session_map(raw, prefix)
 
     async def _cleanup_all_stale_sessions(self) -> None:
         """Clean up all tracked sessions not in current session_map (startup)."""
@@ -273,7 +334,7 @@ class SessionMonitor:
             for session_id in stale_sessions:
                 self._transcript_reader.clear_session(session_id)
                 self._idle_tracker.clear_session(session_id)
-            self.state.save_if_dirty()
+            self.state.save_if_dirty(force=True)
 
     async def _detect_and_cleanup_changes(self) -> dict[str, dict[str, str]]:
         """Reconcile session_map; clean up replaced/removed sessions; fire new-window events."""
@@ -319,92 +380,129 @@ class SessionMonitor:
 
         return result.current_map
 
-    async def _monitor_loop(self) -> None:
-        """Background poll loop."""
-        logger.info("Session monitor started, polling every %ss", self.poll_interval)
+    @staticmethod
+    def _watch_files(current_map: dict[str, dict[str, str]]) -> set[str]:
+        """Files whose writes should wake the loop for an early read."""
+        files = {str(config.events_file)}
+        for details in current_map.values():
+            transcript_path = details.get("transcript_path")
+            if transcript_path:
+                files.add(transcript_path)
+        return files
 
+    async def _reconcile_windows(self) -> dict[str, dict[str, str]]:
+        """Heartbeat pass: sync session_map with tmux and announce new windows."""
         # Lazy: session_map imports session_monitor types via shared
         # state cycle; keep at call site.
         # Lazy: proxies wired by SessionManager constructor
         from .session_map import session_map_sync
 
+        await session_map_sync.load_session_map()
+
+        current_map = await self._detect_and_cleanup_changes()
+
+        all_windows = await tmux_manager.list_windows()
+        external_windows = await tmux_manager.discover_external_sessions()
+        all_windows = all_windows + external_windows
+        live_window_ids = {w.window_id for w in all_windows}
+        session_map_sync.prune_session_map(live_window_ids)
+        bound_window_ids: set[str] | None = None
+        for window in all_windows:
+            if window.window_id in current_map:
+                continue
+            if bound_window_ids is None:
+                # Lazy: same cycle as the earlier thread_router import.
+                from .thread_router import thread_router
+
+                bound_window_ids = {
+                    wid for _, _, wid in thread_router.iter_thread_bindings()
+                }
+            already_bound = window.window_id in bound_window_ids
+            if not already_bound and self._new_window_callback:
+                event = NewWindowEvent(
+                    window_id=window.window_id,
+                    session_id="",
+                    window_name=window.window_name,
+                    cwd=window.cwd,
+                )
+                try:
+                    await self._new_window_callback(event)
+                except _CallbackError:
+                    logger.exception(
+                        "New window callback error for %s",
+                        window.window_id,
+                    )
+        return current_map
+
+    async def _dispatch_messages(self, new_messages: list[NewMessage]) -> None:
+        for msg in new_messages:
+            structlog.contextvars.clear_contextvars()
+            structlog.contextvars.bind_contextvars(session_id=msg.session_id)
+            status = "complete" if msg.is_complete else "streaming"
+            preview = msg.text[:_MSG_PREVIEW_LENGTH] + (
+                "..." if len(msg.text) > _MSG_PREVIEW_LENGTH else ""
+            )
+            logger.debug("[%s] session=%s: %s", status, msg.session_id, preview)
+            if self._message_callback:
+                try:
+                    await self._message_callback(msg)
+                except _CallbackError:
+                    logger.exception(
+                        "Message callback error for session=%s",
+                        msg.session_id,
+                    )
+
+    async def _monitor_loop(self) -> None:
+        """Background poll loop.
+
+        Every ``poll_interval`` a heartbeat pass reconciles the session map
+        with tmux and reads all sessions. A watched file change in between
+        wakes a light pass that only reads hook events and the transcripts
+        already mapped, so a streaming transcript never triggers tmux calls.
+        """
+        logger.info("Session monitor started, polling every %ss", self.poll_interval)
+
         await self._cleanup_all_stale_sessions()
         initial_map = await self._load_current_session_map()
         session_lifecycle.initialize(initial_map)
+        self._dir_watcher.start()
 
+        loop = asyncio.get_running_loop()
+        current_map: dict[str, dict[str, str]] = {}
+        next_heartbeat = loop.time()
+        woke = False
         error_streak = 0
         while self._running:
             try:
                 await self._read_hook_events()
-                await session_map_sync.load_session_map()
-
-                current_map = await self._detect_and_cleanup_changes()
-
-                all_windows = await tmux_manager.list_windows()
-                external_windows = await tmux_manager.discover_external_sessions()
-                all_windows = all_windows + external_windows
-                live_window_ids = {w.window_id for w in all_windows}
-                session_map_sync.prune_session_map(live_window_ids)
-                known_window_ids = set(current_map.keys())
-                for window in all_windows:
-                    if window.window_id in known_window_ids:
-                        continue
-                    # Lazy: same cycle as the earlier thread_router import.
-                    from .thread_router import thread_router
-
-                    already_bound = any(
-                        wid == window.window_id
-                        for _, _, wid in thread_router.iter_thread_bindings()
-                    )
-                    if not already_bound and self._new_window_callback:
-                        event = NewWindowEvent(
-                            window_id=window.window_id,
-                            session_id="",
-                            window_name=window.window_name,
-                            cwd=window.cwd,
-                        )
-                        try:
-                            await self._new_window_callback(event)
-                        except _CallbackError:
-                            logger.exception(
-                                "New window callback error for %s",
-                                window.window_id,
-                            )
-
-                new_messages = await self.check_for_updates(current_map)
-
-                for msg in new_messages:
-                    structlog.contextvars.clear_contextvars()
-                    structlog.contextvars.bind_contextvars(session_id=msg.session_id)
-                    status = "complete" if msg.is_complete else "streaming"
-                    preview = msg.text[:_MSG_PREVIEW_LENGTH] + (
-                        "..." if len(msg.text) > _MSG_PREVIEW_LENGTH else ""
+                if not woke or loop.time() >= next_heartbeat:
+                    next_heartbeat = loop.time() + self.poll_interval
+                    current_map = await self._reconcile_windows()
+                    new_messages = await self.check_for_updates(current_map)
+                    self._dir_watcher.watch(self._watch_files(current_map))
+                else:
+                    new_messages = await self.check_for_updates(
+                        current_map, include_fallback=False
                     )
-                    logger.debug("[%s] session=%s: %s", status, msg.session_id, preview)
-                    if self._message_callback:
-                        try:
-                            await self._message_callback(msg)
-                        except _CallbackError:
-                            logger.exception(
-                                "Message callback error for session=%s",
-                                msg.session_id,
-                            )
+                await self._dispatch_messages(new_messages)
 
             except _LoopError:
                 logger.exception("Monitor loop error")
                 backoff_delay = min(_BACKOFF_MAX, _BACKOFF_MIN * (2**error_streak))
                 error_streak += 1
+                woke = False
                 await asyncio.sleep(backoff_delay)
                 continue
             except Exception:
                 logger.exception("Unexpected error in monitor loop")
                 backoff_delay = min(_BACKOFF_MAX, _BACKOFF_MIN * (2**error_streak))
                 error_streak += 1
+                woke = False
                 await asyncio.sleep(backoff_delay)
                 continue
 
             error_streak = 0
-            await asyncio.sleep(self.poll_interval)
+            woke = await self._dir_watcher.wait(max(0.0, next_heartbeat - loop.time()))
 
         logger.info("Session monitor stopped")
 
@@ -416,11 +514,17 @@ class SessionMonitor:
         self._task = asyncio.create_task(self._monitor_loop())
         self._task.add_done_callback(task_done_callback)
 
-    def stop(self) -> None:
+    async def stop(self) -> None:
+        """Cancel the poll loop, wait for it to finish, then release its fds."""
         self._running = False
-        if self._task:
-            self._task.cancel()
-            self._task = None
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._transcript_reader.close()
+        self._event_log.close()
+        self._dir_watcher.close()
         self.state.save()
         logger.info("Session monitor stopped and state saved")
 
@@ -15,14 +15,13 @@ Responsibilities:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import structlog
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-import aiofiles
-
 from .config import config
 from .providers import get_provider_for_window
 from .thread_router import thread_router
@@ -31,6 +30,19 @@ from .window_state_store import window_store
 logger = structlog.get_logger()
 
 
+def _read_byte_range(file_path: Path, start: int, end: int | None) -> str:
+    """Read whole lines starting at byte ``start`` until ``end`` is reached."""
+    with file_path.open("rb") as f:
+        f.seek(start)
+        if end is None:
+            data = f.read()
+        else:
+            data = f.read(max(end - start, 0))
+            if data and not data.endswith(b"\n"):
+                data += f.readline()
+    return data.decode("utf-8", "replace")
+
+
 @dataclass
 class ClaudeSession:
     """Information about a Claude Code session."""
@@ -118,26 +130,26 @@ class SessionResolver:
             window_id, provider_name=state.provider_name if state else None
         )
         try:
-            async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-                async for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    message_count += 1
-                    try:
-                        data = json.loads(line)
-                        if data.get("type") == "summary":
-                            s = data.get("summary", "")
-                            if s:
-                                summary = s
-                        elif provider.is_user_transcript_entry(data):
-                            parsed = provider.parse_history_entry(data)
-                            if parsed and parsed.text.strip():
-                                last_user_msg = parsed.text.strip()
-                    except json.JSONDecodeError:
-                        continue
+            content = await asyncio.to_thread(file_path.read_text, encoding="utf-8")
         except OSError:
             return None
+        for line in content.split("\n"):
+            line = line.strip()
+            if not line:
+                continue
+            message_count += 1
+            try:
+                data = json.loads(line)
+                if data.get("type") == "summary":
+                    s = data.get("summary", "")
+                    if s:
+                        summary = s
+                elif provider.is_user_transcript_entry(data):
+                    parsed = provider.parse_history_entry(data)
+                    if parsed and parsed.text.strip():
+                        last_user_msg = parsed.text.strip()
+            except json.JSONDecodeError:
+                continue
 
         if not summary:
             summary = last_user_msg[:50] if last_user_msg else "Untitled"
@@ -236,26 +248,16 @@ class SessionResolver:
         )
         entries: list[dict[str, Any]] = []
         try:
-            async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-                if start_byte > 0:
-                    await f.seek(start_byte)
-
-                while True:
-                    if end_byte is not None:
-                        current_pos = await f.tell()
-                        if current_pos >= end_byte:
-                            break
-
-                    line = await f.readline()
-                    if not line:
-                        break
-
-                    data = provider.parse_transcript_line(line)
-                    if data:
-                        entries.append(data)
+            content = await asyncio.to_thread(
+                _read_byte_range, file_path, start_byte, end_byte
+            )
         except OSError:
             logger.exception("Error reading session file %s", file_path)
             return [], 0
+        for line in content.split("\n"):
+            data = provider.parse_transcript_line(line)
+            if data:
+                entries.append(data)
 
         agent_messages, _ = provider.parse_transcript_entries(entries, {})
         all_messages = [
@@ -19,10 +19,16 @@ Key data:
   - _window_to_thread (reverse index for O(1) inbound lookups)
   - group_chat_ids   (composite key -> chat_id)
   - window_display_names (window_id -> display name)
+
+Window IDs are interned with ``sys.intern`` on ingestion so the same
+``"@12"`` shared across bindings, display names and window_states is a
+single object and dict lookups hit the identity fast path.
 """
 
 from __future__ import annotations
 
+import sys
+
 import structlog
 from collections.abc import Callable, Iterator
 from typing import Any, cast
@@ -121,11 +127,14 @@ class ThreadRouter:
         trigger a write.
         """
         self.thread_bindings = {
-            int(uid): {int(tid): wid for tid, wid in bindings.items()}
+            int(uid): {int(tid): sys.intern(wid) for tid, wid in bindings.items()}
             for uid, bindings in data.get("thread_bindings", {}).items()
         }
         self.group_chat_ids = data.get("group_chat_ids", {})
-        self.window_display_names = data.get("window_display_names", {})
+        self.window_display_names = {
+            sys.intern(wid): name
+            for wid, name in data.get("window_display_names", {}).items()
+        }
         self._dedup_thread_bindings()
         self._rebuild_reverse_index()
 
@@ -141,6 +150,7 @@ class ThreadRouter:
         Enforces 1 topic = 1 window: if another thread is already bound to
         the same window_id, that stale binding is removed first.
         """
+        window_id = sys.intern(window_id)
         if user_id not in self.thread_bindings:
             self.thread_bindings[user_id] = {}
 
@@ -320,7 +330,7 @@ class ThreadRouter:
     def set_display_name(self, window_id: str, window_name: str) -> None:
         """Update display name for a window_id."""
         if self.window_display_names.get(window_id) != window_name:
-            self.window_display_names[window_id] = window_name
+            self.window_display_names[sys.intern(window_id)] = window_name
             self._schedule_save()
 
     def sync_display_names(self, live_windows: list[tuple[str, str]]) -> bool:
@@ -332,7 +342,7 @@ class ThreadRouter:
         for window_id, window_name in live_windows:
             old = self.window_display_names.get(window_id)
             if old and old != window_name:
-                self.window_display_names[window_id] = window_name
+                self.window_display_names[sys.intern(window_id)] = window_name
                 changed = True
                 logger.info(
                     "Synced display name: %s %s → %s", window_id, old, window_name
@@ -17,6 +17,7 @@ import re
 from dataclasses import dataclass
 from typing import Any
 
+from ccgram import fast_json
 from ccgram.expandable_quote import EXPANDABLE_QUOTE_START, format_expandable_quote
 
 from .utils import shorten_path
@@ -95,6 +96,17 @@ class TranscriptParser:
         "LS": "\U0001f4c2",
     }
 
+    # Tools whose summary is a single input field, resolved with one lookup
+    # before the branchier per-tool cases in format_tool_use_summary.
+    _TOOL_SUMMARY_FIELD: dict[str, str] = {
+        "Bash": "command",
+        "Grep": "pattern",
+        "Task": "description",
+        "WebFetch": "url",
+        "WebSearch": "query",
+        "Skill": "skill",
+    }
+
     @staticmethod
     def parse_line(line: str) -> dict | None:
         """Parse a single JSONL line.
@@ -110,7 +122,7 @@ class TranscriptParser:
             return None
 
         try:
-            return json.loads(line)
+            return fast_json.loads(line)
         except json.JSONDecodeError:
             return None
 
@@ -203,7 +215,10 @@ class TranscriptParser:
 
         # Pick a meaningful short summary based on tool name
         summary = ""
-        if name in ("Read", "Glob"):
+        field = cls._TOOL_SUMMARY_FIELD.get(name)
+        if field is not None:
+            summary = input_data.get(field, "")
+        elif name in ("Read", "Glob"):
             summary = input_data.get("file_path") or input_data.get("pattern", "")
             if name == "Read":
                 summary = shorten_path(summary, cwd)
@@ -214,22 +229,12 @@ class TranscriptParser:
             summary = shorten_path(summary, cwd)
             # Note: Edit/Update diff and stats are generated in tool_result stage,
             # not here. We just show the tool name and file path.
-        elif name == "Bash":
-            summary = input_data.get("command", "")
-        elif name == "Grep":
-            summary = input_data.get("pattern", "")
-        elif name == "Task":
-            summary = input_data.get("description", "")
         elif name == "TaskCreate":
             summary = cls._summarize_task_create(input_data)
         elif name == "TaskUpdate":
             summary = cls._summarize_task_update(input_data)
         elif name == "TaskList":
             summary = cls._summarize_task_list(input_data)
-        elif name == "WebFetch":
-            summary = input_data.get("url", "")
-        elif name == "WebSearch":
-            summary = input_data.get("query", "")
         elif name == "TodoWrite":
             todos = input_data.get("todos", [])
             if isinstance(todos, list):
@@ -244,8 +249,6 @@ class TranscriptParser:
                     summary = q.get("question", "")
         elif name == "ExitPlanMode":
             summary = ""
-        elif name == "Skill":
-            summary = input_data.get("skill", "")
         else:
             # Generic: show first string value
             for v in input_data.values():
@@ -470,7 +473,9 @@ class TranscriptParser:
             if not isinstance(content, list):
                 content = [{"type": "text", "text": str(content)}] if content else []
 
-            parsed = cls.parse_message(data)
+            # Local commands only arrive as user entries; skip the text
+            # extraction parse_message does for assistant entries.
+            parsed = cls.parse_message(data) if msg_type == "user" else None
 
             # Handle local command messages first
             if parsed:
@@ -2,10 +2,14 @@
 
 Handles the full lifecycle of reading agent transcripts:
   - Scanning Claude projects for active session files
-  - Incremental byte-offset reads for JSONL providers
+  - Incremental byte-offset reads for JSONL providers (pread, inline for
+    small deltas)
   - Whole-file reads for JSON providers (e.g. Gemini)
   - Parsing transcript entries into NewMessage objects
   - mtime caching to skip unchanged files
+  - sessions-index.json parses cached by (mtime_ns, size)
+  - Per-poll stat snapshot so each transcript is stat'ed once per cycle
+  - Per-session fds kept open across polls (reopened when the file is replaced)
   - Pending tool-use state carried across poll cycles
 
 Key class: TranscriptReader.
@@ -14,13 +18,15 @@ Key class: TranscriptReader.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import aiofiles
 import structlog
 
+from . import fast_json
 from .monitor_events import NewMessage, SessionInfo
 from .monitor_state import MonitorState, TrackedSession
 from .providers import (
@@ -28,7 +34,12 @@ from .providers import (
     get_provider_for_window,
     registry,
 )
-from .utils import log_throttle_reset, log_throttled, read_cwd_from_jsonl
+from .utils import (
+    log_throttle_reset,
+    log_throttled,
+    read_cwd_from_jsonl,
+    to_thread_settled,
+)
 
 if TYPE_CHECKING:
     from .idle_tracker import IdleTracker
@@ -37,6 +48,14 @@ logger = structlog.get_logger()
 
 _PathResolveError = (OSError, ValueError)
 
+# Deltas up to this many bytes are pread on the event loop thread
+_INLINE_READ_MAX = 4096
+# Per-session read buffers: initial size and largest size kept across polls
+_READ_BUF_SIZE = 65536
+_READ_BUF_MAX = 1 << 20
+_OPEN_BRACE = ord("{")
+_SESSIONS_INDEX = "sessions-index.json"
+
 
 def _resolve_provider_for_file(window_id: str, file_path: Path) -> Any:
     """Prefer transcript-path provider hints when a hookful state goes stale."""
@@ -84,12 +103,75 @@ class TranscriptReader:
         self._idle_tracker = idle_tracker
         self._pending_tools: dict[str, dict[str, Any]] = {}
         self._file_mtimes: dict[str, float] = {}
+        # str(path) -> stat taken by the coordinator earlier in this poll
+        self._poll_stats: dict[str, os.stat_result] = {}
+        # monotonic time sampled once per poll; None outside a poll
+        self._poll_now: float | None = None
+        # session_id -> (fd, path, inode) kept open across polls
+        self._fds: dict[str, tuple[int, str, int]] = {}
+        # session_id -> reusable read buffer (see _read_buffer)
+        self._read_bufs: dict[str, bytearray] = {}
+        # sessions-index.json path -> (mtime_ns, size, parsed index)
+        self._index_cache: dict[Path, tuple[int, int, dict[str, Any]]] = {}
+
+    def prime_stats(
+        self, stats: dict[str, os.stat_result], now: float | None = None
+    ) -> None:
+        """Install the stat snapshot taken while classifying this poll's files.
+
+        Each entry is consumed once by ``_process_session_file`` so the
+        coordinator's existence probe doubles as the change-detection stat.
+        ``now`` is the poll's monotonic timestamp, stamped on every session
+        that produced entries instead of sampling the clock per session.
+        """
+        self._poll_stats = stats
+        self._poll_now = now
+
+    def end_poll(self) -> None:
+        """Drop the poll snapshot so reads outside a poll stat and clock afresh."""
+        self._poll_stats = {}
+        self._poll_now = None
+
+    def _stat(self, file_path: Path) -> os.stat_result:
+        st = self._poll_stats.pop(str(file_path), None)
+        return st if st is not None else file_path.stat()
+
+    def _session_fd(self, session_id: str, file_path: Path) -> int:
+        """Return the cached read-only fd for a session, opening it on first use."""
+        path = str(file_path)
+        cached = self._fds.get(session_id)
+        if cached is not None:
+            if cached[1] == path:
+                return cached[0]
+            self._close_fd(session_id)
+        fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+        self._fds[session_id] = (fd, path, os.fstat(fd).st_ino)
+        return fd
+
+    def _close_fd(self, session_id: str) -> None:
+        cached = self._fds.pop(session_id, None)
+        if cached is not None:
+            with contextlib.suppress(OSError):
+                os.close(cached[0])
+
+    def _drop_fd_if_replaced(self, session_id: str, st: os.stat_result) -> None:
+        """Close a cached fd whose path now names a different file (rotation)."""
+        cached = self._fds.get(session_id)
+        if cached is not None and cached[2] != st.st_ino:
+            self._close_fd(session_id)
+
+    def close(self) -> None:
+        """Close every cached transcript fd."""
+        for session_id in list(self._fds):
+            self._close_fd(session_id)
 
     def clear_session(self, session_id: str) -> None:
         """Remove all per-session state for a cleaned-up session."""
         self._state.remove_session(session_id)
         self._file_mtimes.pop(session_id, None)
         self._pending_tools.pop(session_id, None)
+        self._close_fd(session_id)
+        self._read_bufs.pop(session_id, None)
         log_throttle_reset(f"partial-jsonl:{session_id}")
 
     async def _process_session_file(
@@ -106,7 +188,7 @@ class TranscriptReader:
 
         if tracked is None:
             try:
-                st = file_path.stat()
+                st = self._stat(file_path)
                 file_size, current_mtime = st.st_size, st.st_mtime
             except OSError:
                 file_size = 0
@@ -132,10 +214,12 @@ class TranscriptReader:
             return
 
         try:
-            st = file_path.stat()
+            st = self._stat(file_path)
             current_mtime, current_size = st.st_mtime, st.st_size
         except OSError:
+            self._close_fd(session_id)
             return
+        self._drop_fd_if_replaced(session_id, st)
 
         last_mtime = self._file_mtimes.get(session_id, 0.0)
         if provider.capabilities.supports_incremental_read:
@@ -149,11 +233,16 @@ class TranscriptReader:
         self._file_mtimes[session_id] = current_mtime
 
         if new_entries:
-            self._idle_tracker.record_activity(session_id)
+            self._idle_tracker.record_activity(session_id, self._poll_now)
 
         if provider.capabilities.supports_task_tracking and window_id:
             provider.apply_task_entries(window_id, session_id, new_entries)
 
+        if not new_entries:
+            # Nothing to parse: pending tool_use state carries over unchanged.
+            self._state.update_session(tracked)
+            return
+
         carry = self._pending_tools.get(session_id, {})
         session_cwd: str | None = None
         if current_map:
@@ -199,60 +288,101 @@ class TranscriptReader:
         if not provider.capabilities.supports_incremental_read:
             return await self._read_whole_file(session, file_path, provider)
 
-        new_entries: list[dict] = []
         try:
-            async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-                await f.seek(0, 2)
-                file_size = await f.tell()
-
-                if session.last_byte_offset > file_size:
-                    logger.info(
-                        "File truncated for session %s "
-                        "(offset %d > size %d). Resetting.",
+            fd = self._session_fd(session.session_id, file_path)
+            file_size = os.fstat(fd).st_size
+            if session.last_byte_offset > file_size:
+                logger.info(
+                    "File truncated for session %s (offset %d > size %d). Resetting.",
+                    session.session_id,
+                    session.last_byte_offset,
+                    file_size,
+                )
+                session.last_byte_offset = 0
+            delta = file_size - session.last_byte_offset
+            # Typical polls append a line or two: a direct pread is cheaper
+            # than a thread-pool round trip. Large catch-ups (restart, long
+            # idle) read and parse in one worker hop so the json.loads pass
+            # over the backlog does not stall the event loop.
+            if delta > _INLINE_READ_MAX:
+                return await to_thread_settled(
+                    self._pread_and_parse, fd, session, delta, provider
+                )
+            return self._pread_and_parse(fd, session, delta, provider)
+        except OSError:
+            self._close_fd(session.session_id)
+            logger.exception("Error reading session file %s", file_path)
+            return []
+
+    def _read_buffer(self, session_id: str, size: int) -> bytearray:
+        """Return a buffer of at least ``size`` bytes, reused across polls.
+
+        Buffers up to _READ_BUF_MAX are kept per session; a larger one-off
+        catch-up gets a transient buffer that is freed after the read.
+        """
+        buf = self._read_bufs.get(session_id)
+        if buf is None or len(buf) < size:
+            buf = bytearray(max(size, _READ_BUF_SIZE))
+            if len(buf) <= _READ_BUF_MAX:
+                self._read_bufs[session_id] = buf
+        return buf
+
+    def _pread_and_parse(
+        self, fd: int, session: TrackedSession, size: int, provider: Any
+    ) -> list[dict]:
+        buf = self._read_buffer(session.session_id, size)
+        with memoryview(buf) as view:
+            n = os.preadv(fd, [view[:size]], session.last_byte_offset)
+        return self._parse_new_bytes(session, buf, n, provider)
+
+    def _parse_new_bytes(
+        self, session: TrackedSession, buf: bytearray, end: int, provider: Any
+    ) -> list[dict]:
+        """Parse ``buf[:end]``, the JSONL bytes read at ``session.last_byte_offset``.
+
+        Lines are decoded straight out of the read buffer. Advances the
+        offset past every consumed line and stops at the first unparseable
+        non-blank line (a partial write retried next cycle).
+        """
+        pos = 0
+        if session.last_byte_offset > 0 and end and buf[0] != _OPEN_BRACE:
+            logger.warning(
+                "Corrupted offset for session %s (byte %d is %r, not '{'). "
+                "Advancing to next line.",
+                session.session_id,
+                session.last_byte_offset,
+                chr(buf[0]),
+            )
+            nl = buf.find(b"\n", 0, end)
+            pos = end if nl < 0 else nl + 1
+
+        new_entries: list[dict] = []
+        consumed = pos
+        with memoryview(buf) as view:
+            while pos < end:
+                nl = buf.find(b"\n", pos, end)
+                if nl == pos:
+                    # Blank line: nothing to decode or parse.
+                    pos += 1
+                    consumed = pos
+                    continue
+                line_end = end if nl < 0 else nl + 1
+                line = str(view[pos:line_end], "utf-8", "replace")
+                pos = line_end
+                entry = provider.parse_transcript_line(line)
+                if entry:
+                    new_entries.append(entry)
+                elif line.strip():
+                    log_throttled(
+                        logger,
+                        f"partial-jsonl:{session.session_id}",
+                        "Partial JSONL line in session %s, will retry next cycle",
                         session.session_id,
-                        session.last_byte_offset,
-                        file_size,
                     )
-                    session.last_byte_offset = 0
-
-                await f.seek(session.last_byte_offset)
-
-                if session.last_byte_offset > 0:
-                    first_byte = await f.read(1)
-                    if first_byte and first_byte != "{":
-                        logger.warning(
-                            "Corrupted offset for session %s (byte %d is %r, not '{'). "
-                            "Advancing to next line.",
-                            session.session_id,
-                            session.last_byte_offset,
-                            first_byte,
-                        )
-                        await f.readline()
-                        session.last_byte_offset = await f.tell()
-                    else:
-                        await f.seek(session.last_byte_offset)
-
-                safe_offset = session.last_byte_offset
-                async for line in f:
-                    data = provider.parse_transcript_line(line)
-                    if data:
-                        new_entries.append(data)
-                        safe_offset = await f.tell()
-                    elif line.strip():
-                        log_throttled(
-                            logger,
-                            f"partial-jsonl:{session.session_id}",
-                            "Partial JSONL line in session %s, will retry next cycle",
-                            session.session_id,
-                        )
-                        break
-                    else:
-                        safe_offset = await f.tell()
-
-                session.last_byte_offset = safe_offset
+                    break
+                consumed = pos
 
-        except OSError:
-            logger.exception("Error reading session file %s", file_path)
+        session.last_byte_offset += consumed
         return new_entries
 
     async def _read_whole_file(
@@ -290,84 +420,122 @@ class TranscriptReader:
                 cwds.add(w.cwd)
         return cwds
 
+    def _load_index(self, index_file: Path) -> dict[str, Any] | None:
+        """Return the parsed sessions-index.json, reusing the last parse.
+
+        The cached parse is reused while (mtime_ns, size) is unchanged, so
+        polls between index rewrites cost one stat instead of a read + parse.
+        """
+        try:
+            st = index_file.stat()
+        except OSError:
+            self._index_cache.pop(index_file, None)
+            return None
+        cached = self._index_cache.get(index_file)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        try:
+            data = fast_json.loads(index_file.read_bytes())
+        except (json.JSONDecodeError, OSError) as e:
+            logger.debug("Error reading index %s: %s", index_file, e)
+            self._index_cache.pop(index_file, None)
+            return None
+        if not isinstance(data, dict):
+            return None
+        self._index_cache[index_file] = (st.st_mtime_ns, st.st_size, data)
+        return data
+
     def _scan_projects_sync(
         self, projects_path: Path, active_cwds: set[str]
     ) -> list[SessionInfo]:
         """Scan filesystem for session files matching active cwds (sync)."""
         sessions: list[SessionInfo] = []
 
-        if not projects_path.exists():
+        # scandir entries carry d_type, so is_dir() and the per-project
+        # listing below need no extra stat calls on most filesystems.
+        try:
+            with os.scandir(projects_path) as it:
+                project_dirs = [Path(entry.path) for entry in it if entry.is_dir()]
+        except OSError:
             return sessions
 
-        for project_dir in projects_path.iterdir():
-            if not project_dir.is_dir():
+        for project_dir in project_dirs:
+            jsonl_names: list[str] = []
+            has_index = False
+            try:
+                with os.scandir(project_dir) as it:
+                    for entry in it:
+                        if entry.name.endswith(".jsonl"):
+                            jsonl_names.append(entry.name)
+                        elif entry.name == _SESSIONS_INDEX:
+                            has_index = True
+            except OSError as e:
+                logger.debug("Error scanning jsonl files in %s: %s", project_dir, e)
                 continue
 
-            index_file = project_dir / "sessions-index.json"
+            index_file = project_dir / _SESSIONS_INDEX
             original_path = ""
             indexed_ids: set[str] = set()
 
-            if index_file.exists():
-                try:
-                    index_data = json.loads(index_file.read_text())
-                    entries = index_data.get("entries", [])
-                    original_path = index_data.get("originalPath", "")
-
-                    for entry in entries:
-                        session_id = entry.get("sessionId", "")
-                        full_path = entry.get("fullPath", "")
-                        project_path = entry.get("projectPath", original_path)
-
-                        if not session_id or not full_path:
-                            continue
-
-                        try:
-                            norm_pp = str(Path(project_path).resolve())
-                        except _PathResolveError:
-                            norm_pp = project_path
-                        if norm_pp not in active_cwds:
-                            continue
-
-                        indexed_ids.add(session_id)
-                        file_path = Path(full_path)
-                        if file_path.exists():
-                            sessions.append(
-                                SessionInfo(
-                                    session_id=session_id,
-                                    file_path=file_path,
-                                )
-                            )
-
-                except (json.JSONDecodeError, OSError) as e:
-                    logger.debug("Error reading index %s: %s", index_file, e)
-
-            try:
-                for jsonl_file in project_dir.glob("*.jsonl"):
-                    session_id = jsonl_file.stem
-                    if session_id in indexed_ids:
-                        continue
-
-                    file_project_path = original_path
-                    if not file_project_path:
-                        file_project_path = read_cwd_from_jsonl(jsonl_file)
-                    if not file_project_path:
+            if has_index:
+                index_data = self._load_index(index_file)
+            else:
+                index_data = None
+                self._index_cache.pop(index_file, None)
+            if index_data is not None:
+                entries = index_data.get("entries", [])
+                original_path = index_data.get("originalPath", "")
+
+                for entry in entries:
+                    session_id = entry.get("sessionId", "")
+                    full_path = entry.get("fullPath", "")
+                    project_path = entry.get("projectPath", original_path)
+
+                    if not session_id or not full_path:
                         continue
 
                     try:
-                        norm_fp = str(Path(file_project_path).resolve())
+                        norm_pp = str(Path(project_path).resolve())
                     except _PathResolveError:
-                        norm_fp = file_project_path
-
-                    if norm_fp not in active_cwds:
+                        norm_pp = project_path
+                    if norm_pp not in active_cwds:
                         continue
 
-                    sessions.append(
-                        SessionInfo(
-                            session_id=session_id,
-                            file_path=jsonl_file,
+                    indexed_ids.add(session_id)
+                    file_path = Path(full_path)
+                    if file_path.exists():
+                        sessions.append(
+                            SessionInfo(
+                                session_id=session_id,
+                                file_path=file_path,
+                            )
                         )
+
+            for name in jsonl_names:
+                session_id = name.removesuffix(".jsonl")
+                if session_id in indexed_ids:
+                    continue
+
+                jsonl_file = project_dir / name
+                file_project_path = original_path
+                if not file_project_path:
+                    file_project_path = read_cwd_from_jsonl(jsonl_file)
+                if not file_project_path:
+                    continue
+
+                try:
+                    norm_fp = str(Path(file_project_path).resolve())
+                except _PathResolveError:
+                    norm_fp = file_project_path
+
+                if norm_fp not in active_cwds:
+                    continue
+
+                sessions.append(
+                    SessionInfo(
+                        session_id=session_id,
+                        file_path=jsonl_file,
                     )
-            except OSError as e:
-                logger.debug("Error scanning jsonl files in %s: %s", project_dir, e)
+                )
 
         return sessions
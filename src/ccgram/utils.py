@@ -7,6 +7,7 @@ Provides:
   - read_cwd_from_jsonl(): extract the cwd field from the first JSONL entry.
   - read_session_metadata_from_jsonl(): single-pass extraction of (cwd, summary).
   - task_done_callback(): log unhandled exceptions from background asyncio tasks.
+  - to_thread_settled(): asyncio.to_thread that outlives cancellation of the caller.
   - log_throttled(): suppress repeated identical debug messages per key.
   - detect_tmux_context(): auto-detect tmux session name and own window ID.
   - check_duplicate_ccgram(): check if another ccgram is running in the session.
@@ -354,6 +355,22 @@ def task_done_callback(task: asyncio.Task[None]) -> None:
 _general_topic_pin_cache: dict[int, bool] = {}
 
 
+async def to_thread_settled[T](func: Callable[..., T], /, *args: Any) -> T:
+    """Run ``func(*args)`` in a worker thread, settling it before cancelling.
+
+    A cancelled ``asyncio.to_thread`` caller returns at once while the thread
+    keeps running. Here cancellation waits for the thread first, so cleanup
+    after the caller's task ends cannot race a read on a cached fd.
+    """
+    future = asyncio.ensure_future(asyncio.to_thread(func, *args))
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        with contextlib.suppress(Exception):
+            await future
+        raise
+
+
 def is_general_topic(message: Message) -> bool:
     """Return True if the message is in the General (default) forum topic.
 
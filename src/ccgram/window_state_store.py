@@ -19,6 +19,8 @@ Key types: WindowState, APPROVAL_MODES, BATCH_MODES, NOTIFICATION_MODES.
 
 from __future__ import annotations
 
+import sys
+
 import structlog
 from collections.abc import Callable
 from dataclasses import dataclass, field
@@ -60,7 +62,7 @@ class _Sentinel:
 _SENTINEL = _Sentinel()
 
 
-@dataclass
+@dataclass(slots=True)
 class PaneInfo:
     """Per-pane runtime state inside a tmux window.
 
@@ -108,7 +110,7 @@ class PaneInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class WindowState:
     """Persistent state for a tmux window.
 
@@ -209,6 +211,7 @@ class WindowState:
                     {**pdata, "pane_id": pdata.get("pane_id", pid)}
                 )
                 panes[pid] = pane
+        origin = data.get("origin", DEFAULT_WINDOW_ORIGIN)
         return cls(
             session_id=data.get("session_id", ""),
             cwd=data.get("cwd", ""),
@@ -222,11 +225,7 @@ class WindowState:
                 "tool_call_visibility", DEFAULT_TOOL_CALL_VISIBILITY
             ),
             external=data.get("external", False),
-            origin=(
-                data.get("origin", DEFAULT_WINDOW_ORIGIN)
-                if data.get("origin", DEFAULT_WINDOW_ORIGIN) in WINDOW_ORIGINS
-                else DEFAULT_WINDOW_ORIGIN
-            ),
+            origin=origin if origin in WINDOW_ORIGINS else DEFAULT_WINDOW_ORIGIN,
             panes=panes,
             pane_lifecycle_notify=data.get("pane_lifecycle_notify"),
             worktree_path=data.get("worktree_path"),
@@ -278,7 +277,9 @@ class WindowStateStore:
     def from_dict(self, data: dict[str, Any]) -> None:
         """Load window_states from state.json data."""
         self.window_states = {
-            k: WindowState.from_dict(v) for k, v in data.items() if isinstance(v, dict)
+            sys.intern(k): WindowState.from_dict(v)
+            for k, v in data.items()
+            if isinstance(v, dict)
         }
 
     # ------------------------------------------------------------------
@@ -287,9 +288,10 @@ class WindowStateStore:
 
     def get_window_state(self, window_id: str) -> WindowState:
         """Get or create window state."""
-        if window_id not in self.window_states:
-            self.window_states[window_id] = WindowState()
-        return self.window_states[window_id]
+        state = self.window_states.get(window_id)
+        if state is None:
+            state = self.window_states[sys.intern(window_id)] = WindowState()
+        return state
 
     def update_cwd(self, window_id: str, cwd: str) -> None:
         """Update CWD for a window and schedule persistence."""
@@ -1,9 +1,14 @@
 """Shared test helpers for ccgram unit tests."""
 
+from collections.abc import Awaitable, Callable
+from typing import Any
 from unittest.mock import MagicMock
 
 from ccgram.providers.base import AgentProvider, StatusUpdate
 
+# Claude's chrome separator line, shared by the pane fixtures and parser tests.
+SEPARATOR = "─" * 30
+
 
 def make_mock_provider(
     *, has_status: bool = False, interactive: bool = False
@@ -21,3 +26,12 @@ def make_mock_provider(
     else:
         provider.parse_terminal_status.return_value = None
     return provider
+
+
+def async_return(value: Any) -> Callable[..., Awaitable[Any]]:
+    """Build an async stub returning *value*, for awaits a test never asserts on."""
+
+    async def _stub(*_args: Any, **_kwargs: Any) -> Any:
+        return value
+
+    return _stub
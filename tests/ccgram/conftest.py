@@ -8,6 +8,7 @@ import os
 import time
 
 import pytest
+from _helpers import SEPARATOR
 
 
 @pytest.fixture(autouse=True)
@@ -166,7 +167,7 @@ def make_thinking_block():
 # ── Sample pane text for terminal parser ─────────────────────────────────
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pane_exit_plan():
     return (
         "  Would you like to proceed?\n"
@@ -177,27 +178,28 @@ def sample_pane_exit_plan():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pane_ask_user_multi_tab():
     return "  ←  ☐ Option A\n     ☐ Option B\n     ☐ Option C\n  Enter to select\n"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pane_ask_user_single_tab():
     return "  ☐ Option A\n  ☐ Option B\n  Enter to select\n"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pane_permission():
     return "  Do you want to proceed?\n  Some permission details\n  Esc to cancel\n"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pane_status_line():
-    sep = "─" * 30
-    return f"Some output text here\nMore output\n✻ Reading file src/main.py\n{sep}\n"
+    return (
+        f"Some output text here\nMore output\n✻ Reading file src/main.py\n{SEPARATOR}\n"
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pane_no_ui():
     return "$ echo hello\nhello\n$\n"
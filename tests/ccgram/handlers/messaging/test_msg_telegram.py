@@ -58,7 +58,6 @@ def _mock_router():
 
 
 class TestNotifyMessageSent:
-    @pytest.mark.asyncio
     async def test_sends_compact_line_to_sender_topic(self):
         from ccgram.handlers.messaging.msg_telegram import notify_message_sent
 
@@ -84,7 +83,6 @@ class TestNotifyMessageSent:
         assert "request" in text.lower() or "API contract" in text
         assert kwargs.get("disable_notification") is True
 
-    @pytest.mark.asyncio
     async def test_skips_when_no_sender_binding(self):
         from ccgram.handlers.messaging.msg_telegram import notify_message_sent
 
@@ -106,7 +104,6 @@ class TestNotifyMessageSent:
 
 
 class TestNotifyReplyReceived:
-    @pytest.mark.asyncio
     async def test_sends_reply_notification_to_original_sender_topic(self):
         from ccgram.handlers.messaging.msg_telegram import notify_reply_received
 
@@ -139,7 +136,6 @@ class TestNotifyReplyReceived:
 
 
 class TestNotifyPendingShell:
-    @pytest.mark.asyncio
     async def test_sends_pending_message_to_shell_topic(self):
         from ccgram.handlers.messaging.msg_telegram import notify_pending_shell
 
@@ -165,7 +161,6 @@ class TestNotifyPendingShell:
         assert "payment-svc" in text or "@0" in text
         assert kwargs.get("disable_notification") is True
 
-    @pytest.mark.asyncio
     async def test_skips_when_no_binding(self):
         from ccgram.handlers.messaging.msg_telegram import notify_pending_shell
 
@@ -187,7 +182,6 @@ class TestNotifyPendingShell:
 
 
 class TestNotificationGrouping:
-    @pytest.mark.asyncio
     async def test_multiple_messages_merged_in_delivered_notification(self):
         from ccgram.handlers.messaging.msg_telegram import notify_messages_delivered
 
@@ -215,7 +209,6 @@ class TestNotificationGrouping:
 
 
 class TestPeerMessageReaction:
-    @pytest.mark.asyncio
     async def test_delivered_notification_gets_inbox_reaction(self):
         from ccgram.handlers.messaging import msg_telegram
         from ccgram.handlers.messaging.msg_telegram import notify_messages_delivered
@@ -246,7 +239,6 @@ class TestPeerMessageReaction:
 
         assert args[3] == REACT_INBOX
 
-    @pytest.mark.asyncio
     async def test_no_reaction_when_send_fails(self):
         from ccgram.handlers.messaging import msg_telegram
         from ccgram.handlers.messaging.msg_telegram import notify_messages_delivered
@@ -269,7 +261,6 @@ class TestPeerMessageReaction:
 
 
 class TestSilentDelivery:
-    @pytest.mark.asyncio
     async def test_all_notifications_are_silent(self):
         from ccgram.handlers.messaging.msg_telegram import (
             notify_message_sent,
@@ -304,7 +295,6 @@ class TestSilentDelivery:
 
 
 class TestNotifyLoopDetected:
-    @pytest.mark.asyncio
     async def test_sends_alert_with_keyboard(self):
         from ccgram.handlers.messaging.msg_telegram import notify_loop_detected
 
@@ -332,7 +322,6 @@ class TestNotifyLoopDetected:
         assert any("Pause" in t for t in button_texts)
         assert any("Allow" in t for t in button_texts)
 
-    @pytest.mark.asyncio
     async def test_keyboard_has_correct_callback_data(self):
         from ccgram.handlers.messaging.msg_telegram import (
             CB_MSG_LOOP_ALLOW,
@@ -6,8 +6,6 @@ import pytest
 
 from ccgram.handlers.messaging_pipeline.message_task import ContentTask
 from ccgram.handlers.messaging_pipeline.tool_batch import (
-    BATCH_MAX_ENTRIES,
-    BATCH_MAX_LENGTH,
     ToolBatch,
     ToolBatchEntry,
     _active_batches,
@@ -24,26 +22,6 @@ from ccgram.telegram_draft import mark_draft_unavailable, reset_draft_state
 
 
 class TestFormatBatchMessage:
-    def test_single_entry_pending(self) -> None:
-        entries = [ToolBatchEntry(tool_use_id="t1", tool_use_text="Read src/foo.py")]
-        result = format_batch_message(entries)
-        assert result.startswith("\u26a1 1 tool call")
-        assert "Read src/foo.py" in result
-        assert "\u23f3" in result
-
-    def test_single_entry_with_result(self) -> None:
-        entries = [
-            ToolBatchEntry(
-                tool_use_id="t1",
-                tool_use_text="Read src/foo.py",
-                tool_result_text="42 lines",
-            )
-        ]
-        result = format_batch_message(entries)
-        assert "1 tool call" in result
-        assert "42 lines" in result
-        assert "\u23f3" not in result
-
     def test_multiple_entries(self) -> None:
         entries = [
             ToolBatchEntry(tool_use_id="t1", tool_use_text="Read src/foo.py"),
@@ -200,10 +178,6 @@ class TestBatchDataStructures:
         assert batch.telegram_msg_id is None
         assert batch.total_length == 0
 
-    def test_constants(self) -> None:
-        assert BATCH_MAX_ENTRIES == 9
-        assert BATCH_MAX_LENGTH == 2800
-
 
 class TestProcessToolEventSignature:
     def test_accepts_content_task_and_returns_optional(self) -> None:
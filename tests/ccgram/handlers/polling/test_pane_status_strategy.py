@@ -17,6 +17,8 @@ from ccgram.providers.base import StatusUpdate
 from ccgram.tmux_manager import PaneInfo as TmuxPaneInfo
 from ccgram.window_state_store import PaneInfo, window_store
 
+pytestmark = pytest.mark.status_polling
+
 
 def _require_pane(window_id: str, pane_id: str) -> PaneInfo:
     pane = window_store.get_pane(window_id, pane_id)
@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from telegram import Bot
 from telegram.error import TelegramError
 
@@ -14,6 +15,8 @@ from ccgram.handlers.polling.polling_coordinator import (
     status_poll_loop,
 )
 
+pytestmark = pytest.mark.status_polling
+
 SRC_FILE = (
     Path(__file__).resolve().parents[4]
     / "src"
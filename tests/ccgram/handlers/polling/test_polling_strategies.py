@@ -22,6 +22,17 @@ from ccgram.handlers.polling.polling_types import (
 )
 from ccgram.topic_state_registry import topic_state
 
+pytestmark = pytest.mark.status_polling
+
+_SEP = "─" * 30
+_CLAUDE_PLAN_PANE = (
+    "  Would you like to proceed?\n"
+    f"  {_SEP}\n"
+    "  Yes     No\n"
+    f"  {_SEP}\n"
+    "  ctrl-g to edit in vim\n"
+)
+
 
 @pytest.fixture(autouse=True)
 def _reset_topic_state_registry():
@@ -111,24 +122,14 @@ class TestTerminalScreenBuffer:
         assert ws.rc_active
         assert ws.rc_off_since is None
 
-    def _claude_plan_pane(self) -> str:
-        sep = "─" * 30
-        return (
-            "  Would you like to proceed?\n"
-            f"  {sep}\n"
-            "  Yes     No\n"
-            f"  {sep}\n"
-            "  ctrl-g to edit in vim\n"
-        )
-
     def test_claude_chrome_default_detects_interactive(self):
-        result = self.strategy.parse_with_pyte("@0", self._claude_plan_pane(), 200, 50)
+        result = self.strategy.parse_with_pyte("@0", _CLAUDE_PLAN_PANE, 200, 50)
         assert result is not None
         assert result.is_interactive is True
 
     def test_non_claude_chrome_skips_claude_ui_returns_none(self):
         result = self.strategy.parse_with_pyte(
-            "@0", self._claude_plan_pane(), 200, 50, parse_claude_chrome=False
+            "@0", _CLAUDE_PLAN_PANE, 200, 50, parse_claude_chrome=False
         )
         assert result is None
 
@@ -143,8 +144,7 @@ class TestTerminalScreenBuffer:
         assert "Gemini is thinking" in self.strategy.get_rendered_text("@0", "")
 
     def test_non_claude_chrome_still_updates_rc_state(self):
-        sep = "─" * 30
-        pane = f"agent output\r\n{sep}\r\n❯ \r\n{sep}\r\n  Remote Control active\r\n"
+        pane = f"agent output\r\n{_SEP}\r\n❯ \r\n{_SEP}\r\n  Remote Control active\r\n"
         result = self.strategy.parse_with_pyte(
             "@0", pane, 80, 10, parse_claude_chrome=False
         )
@@ -16,6 +16,10 @@ import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
+pytestmark = pytest.mark.status_polling
+
 POLLING_TYPES_PATH = (
     Path(__file__).resolve().parents[4]
     / "src"
@@ -1,4 +1,5 @@
 import time
+from types import SimpleNamespace
 
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
@@ -6,20 +7,29 @@ import pytest
 from telegram import Bot
 from telegram.error import BadRequest, TelegramError
 
-from _helpers import make_mock_provider
+from _helpers import async_return, make_mock_provider
 
+from ccgram.handlers.callback_data import IDLE_STATUS_TEXT
+from ccgram.handlers.recovery.transcript_discovery import (
+    discover_and_register_transcript,
+)
 from ccgram.handlers.topics.topic_lifecycle import (
     check_autoclose_timers,
     probe_topic_existence,
     prune_stale_state,
 )
 from ccgram.handlers.polling.window_tick import (
+    _check_interactive_only,
     _handle_dead_window_notification,
     _maybe_warn_external_gemini,
     _parse_with_pyte,
     _scan_window_panes,
+    _transition_to_idle,
     decide_tick,
 )
+from ccgram.handlers.polling.window_tick import (
+    _update_status as update_status_message,
+)
 from ccgram.handlers.polling.polling_state import (
     interactive_strategy,
     lifecycle_strategy,
@@ -31,8 +41,12 @@ from ccgram.handlers.polling.polling_types import (
     TickContext,
     is_shell_prompt,
 )
-from ccgram.telegram_client import PTBTelegramClient
-from ccgram.tmux_manager import PaneInfo
+from ccgram.providers.base import SessionStartEvent, StatusUpdate
+from ccgram.telegram_client import FakeTelegramClient, PTBTelegramClient
+from ccgram.tmux_manager import PaneInfo, TmuxWindow
+from ccgram.window_state_store import WindowState
+
+pytestmark = pytest.mark.status_polling
 
 
 def _assert_handle_called_once_with_client(mock_handle, bot, *args, **kwargs):
@@ -61,6 +75,23 @@ _start_autoclose_timer = lifecycle_strategy.start_autoclose_timer
 _clear_autoclose_timer = lifecycle_strategy.clear_autoclose_timer
 
 
+def _make_window(
+    window_id: str = "@0",
+    window_name: str = "project",
+    pane_current_command: str = "",
+    pane_width: int = 0,
+    pane_height: int = 0,
+) -> TmuxWindow:
+    return TmuxWindow(
+        window_id=window_id,
+        window_name=window_name,
+        cwd="/tmp/project",
+        pane_current_command=pane_current_command,
+        pane_width=pane_width,
+        pane_height=pane_height,
+    )
+
+
 def _has_autoclose(user_id: int, thread_id: int) -> bool:
     ts = _topic_poll_state.get((user_id, thread_id))
     return ts is not None and ts.autoclose is not None
@@ -71,6 +102,20 @@ def _get_autoclose(user_id: int, thread_id: int) -> tuple[str, float] | None:
     return ts.autoclose if ts else None
 
 
+@pytest.fixture
+def client() -> FakeTelegramClient:
+    return FakeTelegramClient()
+
+
+@pytest.fixture
+def frozen_time(monkeypatch) -> dict[str, float]:
+    clock = {"t": 0.0}
+    fake_time = SimpleNamespace(monotonic=lambda: clock["t"])
+    monkeypatch.setattr("ccgram.handlers.topics.topic_lifecycle.time", fake_time)
+    monkeypatch.setattr("ccgram.handlers.polling.window_tick.apply.time", fake_time)
+    return clock
+
+
 @pytest.fixture(autouse=True)
 def _reset():
     _window_poll_state.clear()
@@ -83,16 +128,20 @@ def _reset():
 
 
 class TestIsShellPrompt:
-    @pytest.mark.parametrize(
-        "cmd",
-        ["bash", "zsh", "fish", "sh", "/usr/bin/zsh", "  bash  ", "dash", "ksh"],
-    )
-    def test_shell_detected(self, cmd: str) -> None:
-        assert is_shell_prompt(cmd) is True
-
-    @pytest.mark.parametrize("cmd", ["node", "claude", "npx", ""])
-    def test_non_shell_rejected(self, cmd: str) -> None:
-        assert is_shell_prompt(cmd) is False
+    def test_shell_classification(self) -> None:
+        shells = [
+            "bash",
+            "zsh",
+            "fish",
+            "sh",
+            "/usr/bin/zsh",
+            "  bash  ",
+            "dash",
+            "ksh",
+        ]
+        non_shells = ["node", "claude", "npx", ""]
+        assert [c for c in shells if is_shell_prompt(c) is not True] == []
+        assert [c for c in non_shells if is_shell_prompt(c) is not False] == []
 
 
 class TestAutocloseTimers:
@@ -123,84 +172,81 @@ class TestAutocloseTimers:
     def test_clear_nonexistent_is_noop(self) -> None:
         lifecycle_strategy.clear_autoclose_timer(1, 42)
 
-    @pytest.mark.parametrize(
-        ("state", "minutes", "elapsed"),
-        [("done", 30, 30 * 60 + 1), ("dead", 10, 10 * 60 + 1)],
-        ids=["done", "dead"],
-    )
-    async def test_check_expired(
-        self, state: str, minutes: int, elapsed: float
-    ) -> None:
-        _start_autoclose_timer(1, 42, state, 0.0)
-        bot = AsyncMock(spec=Bot)
+    async def test_check_expired(self, frozen_time, client: FakeTelegramClient) -> None:
         with (
             patch("ccgram.handlers.topics.topic_lifecycle.config") as mock_config,
             patch("ccgram.handlers.topics.topic_lifecycle.thread_router") as mock_tr,
-            patch("ccgram.handlers.topics.topic_lifecycle.time") as mock_time,
             patch("ccgram.handlers.topics.topic_lifecycle.clear_topic_state"),
         ):
             mock_config.autoclose_done_minutes = 30
-            mock_config.autoclose_dead_minutes = minutes
-            mock_time.monotonic.return_value = elapsed
             mock_tr.resolve_chat_id.return_value = -100
-            await check_autoclose_timers(bot)
-        bot.delete_forum_topic.assert_called_once_with(
-            chat_id=-100, message_thread_id=42
-        )
-        mock_tr.unbind_thread.assert_called_once_with(1, 42)
-        assert not _has_autoclose(1, 42)
-
-    async def test_check_not_expired_yet(self) -> None:
+            for state, minutes, elapsed in [
+                ("done", 30, 30 * 60 + 1),
+                ("dead", 10, 10 * 60 + 1),
+            ]:
+                client.calls.clear()
+                mock_tr.unbind_thread.reset_mock()
+                _start_autoclose_timer(1, 42, state, 0.0)
+                mock_config.autoclose_dead_minutes = minutes
+                frozen_time["t"] = elapsed
+                await check_autoclose_timers(client)
+                assert [(c.method, c.kwargs) for c in client.calls] == [
+                    ("delete_forum_topic", {"chat_id": -100, "message_thread_id": 42})
+                ], state
+                mock_tr.unbind_thread.assert_called_once_with(1, 42)
+                assert not _has_autoclose(1, 42), state
+
+    async def test_check_not_expired_yet(
+        self, frozen_time, client: FakeTelegramClient
+    ) -> None:
         _start_autoclose_timer(1, 42, "done", 0.0)
-        bot = AsyncMock(spec=Bot)
         with (
             patch("ccgram.handlers.topics.topic_lifecycle.config") as mock_config,
-            patch("ccgram.handlers.topics.topic_lifecycle.time") as mock_time,
         ):
             mock_config.autoclose_done_minutes = 30
             mock_config.autoclose_dead_minutes = 10
-            mock_time.monotonic.return_value = 29 * 60
-            await check_autoclose_timers(bot)
-        bot.close_forum_topic.assert_not_called()
+            frozen_time["t"] = 29 * 60
+            await check_autoclose_timers(client)
+        assert client.call_count("close_forum_topic") == 0
         assert _has_autoclose(1, 42)
 
-    async def test_check_disabled_when_zero(self) -> None:
+    async def test_check_disabled_when_zero(
+        self, frozen_time, client: FakeTelegramClient
+    ) -> None:
         _start_autoclose_timer(1, 42, "done", 0.0)
-        bot = AsyncMock(spec=Bot)
         with (
             patch("ccgram.handlers.topics.topic_lifecycle.config") as mock_config,
-            patch("ccgram.handlers.topics.topic_lifecycle.time") as mock_time,
         ):
             mock_config.autoclose_done_minutes = 0
             mock_config.autoclose_dead_minutes = 0
-            mock_time.monotonic.return_value = 999999
-            await check_autoclose_timers(bot)
-        bot.close_forum_topic.assert_not_called()
+            frozen_time["t"] = 999999
+            await check_autoclose_timers(client)
+        assert client.call_count("close_forum_topic") == 0
 
-    async def test_check_telegram_error_handled(self) -> None:
+    async def test_check_telegram_error_handled(
+        self, frozen_time, client: FakeTelegramClient
+    ) -> None:
         _start_autoclose_timer(1, 42, "done", 0.0)
-        bot = AsyncMock(spec=Bot)
-        bot.close_forum_topic.side_effect = TelegramError("fail")
+        client.set_side_effect("close_forum_topic", [TelegramError("fail")])
         with (
             patch("ccgram.handlers.topics.topic_lifecycle.config") as mock_config,
             patch("ccgram.handlers.topics.topic_lifecycle.thread_router") as mock_tr,
-            patch("ccgram.handlers.topics.topic_lifecycle.time") as mock_time,
         ):
             mock_config.autoclose_done_minutes = 30
             mock_config.autoclose_dead_minutes = 10
-            mock_time.monotonic.return_value = 30 * 60 + 1
+            frozen_time["t"] = 30 * 60 + 1
             mock_tr.resolve_chat_id.return_value = -100
-            await check_autoclose_timers(bot)
+            await check_autoclose_timers(client)
         assert not _has_autoclose(1, 42)
 
-    async def test_check_treats_missing_topic_as_removed(self) -> None:
+    async def test_check_treats_missing_topic_as_removed(
+        self, frozen_time, client: FakeTelegramClient
+    ) -> None:
         _start_autoclose_timer(1, 42, "done", 0.0)
-        bot = AsyncMock(spec=Bot)
-        bot.delete_forum_topic.side_effect = BadRequest("Topic_id_invalid")
+        client.set_side_effect("delete_forum_topic", [BadRequest("Topic_id_invalid")])
         with (
             patch("ccgram.handlers.topics.topic_lifecycle.config") as mock_config,
             patch("ccgram.handlers.topics.topic_lifecycle.thread_router") as mock_tr,
-            patch("ccgram.handlers.topics.topic_lifecycle.time") as mock_time,
             patch(
                 "ccgram.handlers.topics.topic_lifecycle.clear_topic_state",
                 new_callable=AsyncMock,
@@ -208,13 +254,13 @@ class TestAutocloseTimers:
         ):
             mock_config.autoclose_done_minutes = 30
             mock_config.autoclose_dead_minutes = 10
-            mock_time.monotonic.return_value = 30 * 60 + 1
+            frozen_time["t"] = 30 * 60 + 1
             mock_tr.resolve_chat_id.return_value = -100
             mock_tr.get_window_for_thread.return_value = "@0"
 
-            await check_autoclose_timers(bot)
+            await check_autoclose_timers(client)
 
-        bot.close_forum_topic.assert_not_called()
+        assert client.call_count("close_forum_topic") == 0
         mock_tr.unbind_thread.assert_called_once_with(1, 42)
         mock_clear.assert_awaited_once()
         assert not _has_autoclose(1, 42)
@@ -301,6 +347,20 @@ def _reset_pyte():
 
 
 _SEP = "─" * 30
+_WORKING_PANE = f"Output\n✻ Working\n{_SEP}\n"
+_PLAN_PANE = (
+    "  Would you like to proceed?\n"
+    f"  {_SEP}\n"
+    "  Yes     No\n"
+    f"  {_SEP}\n"
+    "  ctrl-g to edit in vim\n"
+)
+_PERMISSION_PANE = (
+    f"✻ Working on task\n{_SEP}\n"
+    "  Do you want to proceed?\n"
+    "  Allow write to /tmp/foo\n"
+    "  Esc to cancel\n"
+)
 
 
 @pytest.mark.usefixtures("_reset_pyte")
@@ -321,14 +381,7 @@ class TestParseWithPyte:
         assert result.is_interactive is False
 
     def test_detects_interactive_ui(self) -> None:
-        pane_text = (
-            "  Would you like to proceed?\n"
-            f"  {_SEP}\n"
-            "  Yes     No\n"
-            f"  {_SEP}\n"
-            "  ctrl-g to edit in vim\n"
-        )
-        result = _parse_with_pyte("@0", pane_text)
+        result = _parse_with_pyte("@0", _PLAN_PANE)
         assert result is not None
         assert result.is_interactive is True
         assert result.ui_type == "ExitPlanMode"
@@ -338,20 +391,13 @@ class TestParseWithPyte:
         assert result is None
 
     def test_screen_buffer_cached_per_window(self) -> None:
-        pane_text = f"Output\n✻ Working\n{_SEP}\n"
-        _parse_with_pyte("@0", pane_text)
-        _parse_with_pyte("@1", pane_text)
+        _parse_with_pyte("@0", _WORKING_PANE)
+        _parse_with_pyte("@1", _WORKING_PANE)
         assert _window_poll_state["@0"].screen_buffer is not None
         assert _window_poll_state["@1"].screen_buffer is not None
 
     def test_interactive_takes_precedence_over_status(self) -> None:
-        pane_text = (
-            f"✻ Working on task\n{_SEP}\n"
-            "  Do you want to proceed?\n"
-            "  Allow write to /tmp/foo\n"
-            "  Esc to cancel\n"
-        )
-        result = _parse_with_pyte("@0", pane_text)
+        result = _parse_with_pyte("@0", _PERMISSION_PANE)
         assert result is not None
         assert result.is_interactive is True
         assert result.ui_type == "PermissionPrompt"
@@ -375,9 +421,8 @@ class TestPyteContentHashCaching:
         assert result1.raw_text != result2.raw_text
 
     def test_cache_miss_on_dimension_change(self) -> None:
-        pane_text = f"Output\n✻ Working\n{_SEP}\n"
-        result1 = _parse_with_pyte("@0", pane_text, columns=80, rows=24)
-        result2 = _parse_with_pyte("@0", pane_text, columns=120, rows=40)
+        result1 = _parse_with_pyte("@0", _WORKING_PANE, columns=80, rows=24)
+        result2 = _parse_with_pyte("@0", _WORKING_PANE, columns=120, rows=40)
         assert result1 is not None
         assert result2 is not None
         assert result2 is not result1
@@ -404,7 +449,7 @@ class TestPyteContentHashCaching:
         assert result2 is not result1
 
     def test_clear_screen_buffer_resets_cache(self) -> None:
-        _parse_with_pyte("@0", f"Output\n✻ Working\n{_SEP}\n")
+        _parse_with_pyte("@0", _WORKING_PANE)
         ws = terminal_poll_state.get_state("@0")
         assert ws.last_pane_hash is not None
 
@@ -416,26 +461,25 @@ class TestPyteContentHashCaching:
 @pytest.mark.usefixtures("_reset_pyte")
 class TestPyteDimensionPassthrough:
     def test_custom_dimensions_used(self) -> None:
-        _parse_with_pyte("@0", f"Output\n✻ Working\n{_SEP}\n", columns=80, rows=24)
+        _parse_with_pyte("@0", _WORKING_PANE, columns=80, rows=24)
         buf = terminal_poll_state.get_state("@0").screen_buffer
         assert buf is not None
         assert buf.columns == 80
         assert buf.rows == 24
 
     def test_zero_dimensions_fall_back_to_default(self) -> None:
-        _parse_with_pyte("@0", f"Output\n✻ Working\n{_SEP}\n", columns=0, rows=0)
+        _parse_with_pyte("@0", _WORKING_PANE, columns=0, rows=0)
         buf = terminal_poll_state.get_state("@0").screen_buffer
         assert buf is not None
         assert buf.columns == 200
         assert buf.rows == 50
 
     def test_resize_reuses_buffer(self) -> None:
-        pane_text = f"Output\n✻ Working\n{_SEP}\n"
-        _parse_with_pyte("@0", pane_text, columns=80, rows=24)
+        _parse_with_pyte("@0", _WORKING_PANE, columns=80, rows=24)
         buf1 = terminal_poll_state.get_state("@0").screen_buffer
         assert buf1 is not None
 
-        _parse_with_pyte("@0", pane_text + " changed", columns=120, rows=40)
+        _parse_with_pyte("@0", _WORKING_PANE + " changed", columns=120, rows=40)
         buf2 = terminal_poll_state.get_state("@0").screen_buffer
         assert buf2 is buf1
         assert buf2 is not None
@@ -491,134 +535,81 @@ class TestAnsiCapturePyteParsing:
         assert terminal_poll_state.get_state("@0").last_rendered_text == ""
 
 
-def _mock_update_status_patches(*, pyte_result, provider):
-    from contextlib import ExitStack
-
-    stack = ExitStack()
-    mocks: dict[str, MagicMock] = {}
-    mocks["tm"] = stack.enter_context(
-        patch("ccgram.handlers.polling.window_tick.apply.tmux_manager")
-    )
-    mocks["sm"] = stack.enter_context(
-        patch("ccgram.handlers.polling.window_tick.apply.window_query")
-    )
-    mocks["tr"] = stack.enter_context(
-        patch("ccgram.handlers.polling.window_tick.apply.thread_router")
-    )
-    stack.enter_context(
-        patch("ccgram.handlers.polling.window_tick.apply.update_topic_emoji")
-    )
-    mocks["enqueue"] = stack.enter_context(
-        patch("ccgram.handlers.polling.window_tick.apply.enqueue_status_update")
-    )
-    stack.enter_context(
-        patch(
-            "ccgram.handlers.polling.window_tick.apply.get_interactive_window",
-            return_value=None,
-        )
-    )
-    mocks["provider"] = stack.enter_context(
-        patch(
-            "ccgram.handlers.polling.window_tick.apply.get_provider_for_window",
-            return_value=provider,
-        )
-    )
-    # observe.py has its own bindings — patch those too so _resolve_status
-    # sees the mocked provider/tmux_manager/window_query.
-    stack.enter_context(
-        patch(
-            "ccgram.handlers.polling.window_tick.observe.get_provider_for_window",
-            return_value=provider,
-        )
-    )
-    observe_tm = stack.enter_context(
-        patch("ccgram.handlers.polling.window_tick.observe.tmux_manager")
-    )
-    observe_tm.get_pane_title = AsyncMock(return_value="")
-    stack.enter_context(
-        patch("ccgram.handlers.polling.window_tick.observe.window_query")
-    )
-    stack.enter_context(
-        patch(
-            "ccgram.handlers.polling.window_tick.observe._parse_with_pyte",
-            return_value=pyte_result,
-        )
+_APPLY = "ccgram.handlers.polling.window_tick.apply"
+_OBSERVE = "ccgram.handlers.polling.window_tick.observe"
+
+
+@pytest.fixture
+def polling_env(monkeypatch):
+    window = _make_window(pane_current_command="node", pane_width=80, pane_height=24)
+    tm = MagicMock()
+    tm.find_window_by_id = async_return(window)
+    tm.capture_pane = AsyncMock(return_value="\x1b[1msome ansi output\x1b[0m")
+    tm.get_pane_title = async_return("")
+    wq = MagicMock()
+    wq.get_notification_mode.return_value = "normal"
+    tr = MagicMock()
+    tr.resolve_chat_id.return_value = -100
+    tr.get_display_name.return_value = "project"
+    env = SimpleNamespace(
+        tm=tm,
+        wq=wq,
+        tr=tr,
+        enqueue=AsyncMock(),
+        provider=make_mock_provider(has_status=True),
+        pyte_result=None,
     )
 
-    mock_window = MagicMock()
-    mock_window.window_id = "@0"
-    mock_window.window_name = "project"
-    mock_window.pane_current_command = "node"
-    mock_window.pane_width = 80
-    mock_window.pane_height = 24
-    mocks["tm"].find_window_by_id = AsyncMock(return_value=mock_window)
-    mocks["tm"].capture_pane = AsyncMock(return_value="\x1b[1msome ansi output\x1b[0m")
-    mocks["tm"].get_pane_title = AsyncMock(return_value="")
-    mocks["tr"].resolve_chat_id.return_value = -100
-    mocks["tr"].get_display_name.return_value = "project"
-    mocks["sm"].get_notification_mode.return_value = "normal"
+    def provider_for_window(*_args, **_kwargs):
+        return env.provider
 
-    return stack, mocks
+    monkeypatch.setattr(f"{_APPLY}.tmux_manager", tm)
+    monkeypatch.setattr(f"{_APPLY}.window_query", wq)
+    monkeypatch.setattr(f"{_APPLY}.thread_router", tr)
+    monkeypatch.setattr(f"{_APPLY}.update_topic_emoji", AsyncMock())
+    monkeypatch.setattr(f"{_APPLY}.enqueue_status_update", env.enqueue)
+    monkeypatch.setattr(f"{_APPLY}.get_interactive_window", lambda *_a, **_k: None)
+    monkeypatch.setattr(f"{_APPLY}.get_provider_for_window", provider_for_window)
+    # observe.py has its own bindings — patch those too so _resolve_status
+    # sees the same provider/tmux_manager/window_query.
+    monkeypatch.setattr(f"{_OBSERVE}.get_provider_for_window", provider_for_window)
+    monkeypatch.setattr(f"{_OBSERVE}.tmux_manager", tm)
+    monkeypatch.setattr(f"{_OBSERVE}.window_query", wq)
+    monkeypatch.setattr(
+        f"{_OBSERVE}._parse_with_pyte", lambda *_a, **_k: env.pyte_result
+    )
+    return env
 
 
 class TestPyteFallbackInUpdateStatus:
-    async def test_empty_rendered_text_does_not_fall_back_to_raw_ansi(self) -> None:
-        stack, mocks = _mock_update_status_patches(
-            pyte_result=None, provider=make_mock_provider(has_status=False)
-        )
-        with stack:
-            from ccgram.handlers.polling.window_tick import (
-                _update_status as update_status_message,
-            )
-
-            terminal_poll_state.get_state("@0").last_rendered_text = ""
-            await update_status_message(AsyncMock(spec=Bot), 1, "@0", thread_id=42)
-
-            call_args = mocks["provider"].return_value.parse_terminal_status.call_args
-            assert call_args[0][0] == ""
-
-    async def test_falls_back_to_provider_with_rendered_text(self) -> None:
-        stack, mocks = _mock_update_status_patches(
-            pyte_result=None, provider=make_mock_provider(has_status=True)
-        )
-        with stack:
-            from ccgram.handlers.polling.window_tick import (
-                _update_status as update_status_message,
-            )
+    async def test_empty_rendered_text_does_not_fall_back_to_raw_ansi(
+        self, client: FakeTelegramClient, polling_env
+    ) -> None:
+        polling_env.provider = make_mock_provider(has_status=False)
+        terminal_poll_state.get_state("@0").last_rendered_text = ""
+        await update_status_message(AsyncMock(spec=Bot), 1, "@0", thread_id=42)
 
-            terminal_poll_state.get_state(
-                "@0"
-            ).last_rendered_text = "clean rendered text"
-            await update_status_message(AsyncMock(spec=Bot), 1, "@0", thread_id=42)
+        call_args = polling_env.provider.parse_terminal_status.call_args
+        assert call_args[0][0] == ""
 
-            provider_mock = mocks["provider"].return_value
-            provider_mock.parse_terminal_status.assert_called_once()
-            assert (
-                provider_mock.parse_terminal_status.call_args[0][0]
-                == "clean rendered text"
-            )
+    async def test_falls_back_to_provider_with_rendered_text(self, polling_env) -> None:
+        terminal_poll_state.get_state("@0").last_rendered_text = "clean rendered text"
+        await update_status_message(AsyncMock(spec=Bot), 1, "@0", thread_id=42)
 
-    async def test_uses_pyte_result_when_available(self) -> None:
-        from ccgram.providers.base import StatusUpdate
+        parse = polling_env.provider.parse_terminal_status
+        parse.assert_called_once()
+        assert parse.call_args[0][0] == "clean rendered text"
 
-        pyte_status = StatusUpdate(
+    async def test_uses_pyte_result_when_available(self, polling_env) -> None:
+        polling_env.pyte_result = StatusUpdate(
             raw_text="Reading file",
             display_label="\U0001f4d6 reading\u2026",
         )
-        stack, mocks = _mock_update_status_patches(
-            pyte_result=pyte_status, provider=make_mock_provider(has_status=True)
-        )
-        with stack:
-            from ccgram.handlers.polling.window_tick import (
-                _update_status as update_status_message,
-            )
+        await update_status_message(AsyncMock(spec=Bot), 1, "@0", thread_id=42)
 
-            await update_status_message(AsyncMock(spec=Bot), 1, "@0", thread_id=42)
-
-            provider_mock = mocks["provider"].return_value
-            provider_mock.parse_terminal_status.assert_not_called()
-            mocks["enqueue"].assert_called_once()
-            assert mocks["enqueue"].call_args[0][3] == "\U0001f4d6 Reading file"
+        polling_env.provider.parse_terminal_status.assert_not_called()
+        polling_env.enqueue.assert_called_once()
+        assert polling_env.enqueue.call_args[0][3] == "\U0001f4d6 Reading file"
 
 
 class TestClearSeenStatus:
@@ -636,19 +627,15 @@ class TestClearSeenStatus:
 
 
 class TestTransitionToIdle:
-    async def test_sends_idle_text(self) -> None:
-        from ccgram.handlers.callback_data import IDLE_STATUS_TEXT
-        from ccgram.handlers.polling.window_tick import _transition_to_idle
-
+    async def test_sends_idle_text(self, frozen_time) -> None:
         bot = AsyncMock(spec=Bot)
         with (
             patch("ccgram.handlers.polling.window_tick.apply.update_topic_emoji"),
             patch(
                 "ccgram.handlers.polling.window_tick.apply.enqueue_status_update"
             ) as mock_enqueue,
-            patch("ccgram.handlers.polling.window_tick.apply.time") as mock_time,
         ):
-            mock_time.monotonic.return_value = 100.0
+            frozen_time["t"] = 100.0
             await _transition_to_idle(bot, 1, "@0", 42, -100, "project", "normal")
         mock_enqueue.assert_called_once()
         assert mock_enqueue.call_args[0][3] == IDLE_STATUS_TEXT
@@ -656,8 +643,6 @@ class TestTransitionToIdle:
 
     @pytest.mark.parametrize("mode", ["muted", "errors_only"])
     async def test_suppressed_mode_clears_status_no_timer(self, mode: str) -> None:
-        from ccgram.handlers.polling.window_tick import _transition_to_idle
-
         bot = AsyncMock(spec=Bot)
         with (
             patch("ccgram.handlers.polling.window_tick.apply.update_topic_emoji"),
@@ -682,28 +667,33 @@ class TestShellPromptClearsStatus:
 
 
 class TestProbeFailures:
-    async def test_probe_skips_suspended_windows(self) -> None:
+    async def test_probe_skips_suspended_windows(
+        self, client: FakeTelegramClient
+    ) -> None:
         terminal_poll_state.get_state("@5").probe_failures = MAX_PROBE_FAILURES
-        bot = AsyncMock(spec=Bot)
         with patch("ccgram.handlers.topics.topic_lifecycle.thread_router") as mock_tr:
             mock_tr.iter_thread_bindings.return_value = [(1, 42, "@5")]
-            await probe_topic_existence(bot)
-        bot.unpin_all_forum_topic_messages.assert_not_called()
+            await probe_topic_existence(client)
+        assert client.calls == []
 
-    async def test_probe_success_resets_counter(self) -> None:
+    async def test_probe_success_resets_counter(
+        self, client: FakeTelegramClient
+    ) -> None:
         terminal_poll_state.get_state("@5").probe_failures = 2
-        bot = AsyncMock(spec=Bot)
         with patch("ccgram.handlers.topics.topic_lifecycle.thread_router") as mock_tr:
             mock_tr.iter_thread_bindings.return_value = [(1, 42, "@5")]
             mock_tr.resolve_chat_id.return_value = -100
-            await probe_topic_existence(bot)
+            await probe_topic_existence(client)
         assert (
             _window_poll_state.get("@5") is None
             or _window_poll_state["@5"].probe_failures == 0
         )
-        bot.unpin_all_forum_topic_messages.assert_called_once_with(
-            chat_id=-100, message_thread_id=42
-        )
+        assert [(c.method, c.kwargs) for c in client.calls] == [
+            (
+                "unpin_all_forum_topic_messages",
+                {"chat_id": -100, "message_thread_id": 42},
+            )
+        ]
 
     @pytest.mark.parametrize(
         "exc",
@@ -712,24 +702,29 @@ class TestProbeFailures:
             pytest.param(BadRequest("Permission denied"), id="bad-request-other"),
         ],
     )
-    async def test_probe_error_increments_counter(self, exc: TelegramError) -> None:
-        bot = AsyncMock(spec=Bot)
-        bot.unpin_all_forum_topic_messages.side_effect = exc
+    async def test_probe_error_increments_counter(
+        self, client: FakeTelegramClient, exc: TelegramError
+    ) -> None:
+        client.set_side_effect("unpin_all_forum_topic_messages", [exc])
         with patch("ccgram.handlers.topics.topic_lifecycle.thread_router") as mock_tr:
             mock_tr.iter_thread_bindings.return_value = [(1, 42, "@5")]
             mock_tr.resolve_chat_id.return_value = -100
-            await probe_topic_existence(bot)
+            await probe_topic_existence(client)
         assert _window_poll_state["@5"].probe_failures == 1
 
-    async def test_probe_suspends_after_max_failures(self) -> None:
-        bot = AsyncMock(spec=Bot)
-        bot.unpin_all_forum_topic_messages.side_effect = TelegramError("Timed out")
+    async def test_probe_suspends_after_max_failures(
+        self, client: FakeTelegramClient
+    ) -> None:
+        client.set_side_effect(
+            "unpin_all_forum_topic_messages",
+            [TelegramError("Timed out")] * MAX_PROBE_FAILURES,
+        )
         with patch("ccgram.handlers.topics.topic_lifecycle.thread_router") as mock_tr:
             mock_tr.iter_thread_bindings.return_value = [(1, 42, "@5")]
             mock_tr.resolve_chat_id.return_value = -100
             for _ in range(MAX_PROBE_FAILURES + 1):
-                await probe_topic_existence(bot)
-        assert bot.unpin_all_forum_topic_messages.call_count == MAX_PROBE_FAILURES
+                await probe_topic_existence(client)
+        assert client.call_count("unpin_all_forum_topic_messages") == MAX_PROBE_FAILURES
         assert _window_poll_state["@5"].probe_failures == MAX_PROBE_FAILURES
 
     @pytest.mark.parametrize(
@@ -739,12 +734,14 @@ class TestProbeFailures:
             pytest.param(False, id="window-already-gone"),
         ],
     )
-    async def test_topic_deleted_cleans_up(self, window_alive: bool) -> None:
+    async def test_topic_deleted_cleans_up(
+        self, client: FakeTelegramClient, window_alive: bool
+    ) -> None:
         terminal_poll_state.get_state("@5").probe_failures = 1
-        bot = AsyncMock(spec=Bot)
-        bot.unpin_all_forum_topic_messages.side_effect = BadRequest("Topic_id_invalid")
-        mock_window = MagicMock()
-        mock_window.window_id = "@5"
+        client.set_side_effect(
+            "unpin_all_forum_topic_messages", [BadRequest("Topic_id_invalid")]
+        )
+        mock_window = _make_window(window_id="@5")
         with (
             patch("ccgram.handlers.topics.topic_lifecycle.thread_router") as mock_tr,
             patch("ccgram.handlers.topics.topic_lifecycle.tmux_manager") as mock_tm,
@@ -755,13 +752,13 @@ class TestProbeFailures:
         ):
             mock_tr.iter_thread_bindings.return_value = [(1, 42, "@5")]
             mock_tr.resolve_chat_id.return_value = -100
-            mock_tm.find_window_by_id = AsyncMock(
-                return_value=mock_window if window_alive else None
+            mock_tm.find_window_by_id = async_return(
+                mock_window if window_alive else None
             )
             mock_tm.kill_window = AsyncMock()
-            await probe_topic_existence(bot)
+            await probe_topic_existence(client)
         mock_tm.kill_window.assert_not_called()
-        mock_cleanup.assert_called_once_with(1, 42, bot, window_id="@5")
+        mock_cleanup.assert_called_once_with(1, 42, client, window_id="@5")
         mock_tr.unbind_thread.assert_called_once_with(1, 42)
         assert (
             _window_poll_state.get("@5") is None
@@ -771,9 +768,7 @@ class TestProbeFailures:
 
 class TestPruneStaleStatePolling:
     async def test_calls_sync_and_prune(self) -> None:
-        mock_win = MagicMock()
-        mock_win.window_id = "@1"
-        mock_win.window_name = "proj"
+        mock_win = _make_window(window_id="@1", window_name="proj")
         with patch("ccgram.handlers.topics.topic_lifecycle.session_manager") as mock_sm:
             mock_sm.sync_display_names.return_value = False
             mock_sm.prune_stale_state.return_value = False
@@ -792,10 +787,6 @@ class TestPruneStaleStatePolling:
 
 class TestProviderSwitchPromptSetup:
     async def test_switch_to_shell_offers_prompt_setup(self) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-
         bot = AsyncMock(spec=Bot)
         with (
             patch(
@@ -825,8 +816,8 @@ class TestProviderSwitchPromptSetup:
                     transcript_path="",
                 )
             }
-            mock_tmux.find_window_by_id = AsyncMock(
-                return_value=MagicMock(pane_current_command="fish", cwd="/proj")
+            mock_tmux.find_window_by_id = async_return(
+                MagicMock(pane_current_command="fish", cwd="/proj")
             )
             await discover_and_register_transcript(
                 "@7", client=bot, user_id=1, thread_id=42
@@ -837,10 +828,6 @@ class TestProviderSwitchPromptSetup:
         assert mock_ensure.call_args[0] == ("@7", "provider_switch")
 
     async def test_switch_to_claude_does_not_offer_prompt_setup(self) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-
         mock_provider = MagicMock()
         mock_provider.capabilities.supports_hook = True
 
@@ -877,8 +864,8 @@ class TestProviderSwitchPromptSetup:
                     transcript_path="/path/to/claude.jsonl",
                 )
             }
-            mock_tmux.find_window_by_id = AsyncMock(
-                return_value=MagicMock(pane_current_command="claude", cwd="/proj")
+            mock_tmux.find_window_by_id = async_return(
+                MagicMock(pane_current_command="claude", cwd="/proj")
             )
             await discover_and_register_transcript(
                 "@7", client=bot, user_id=1, thread_id=42
@@ -887,10 +874,6 @@ class TestProviderSwitchPromptSetup:
         mock_ensure.assert_not_awaited()
 
     async def test_fallback_shell_assignment_offers_prompt_setup(self) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-
         bot = AsyncMock(spec=Bot)
         with (
             patch(
@@ -923,10 +906,10 @@ class TestProviderSwitchPromptSetup:
                     transcript_path="",
                 )
             }
-            mock_tmux.find_window_by_id = AsyncMock(
-                return_value=MagicMock(pane_current_command="bash", cwd="/proj")
+            mock_tmux.find_window_by_id = async_return(
+                MagicMock(pane_current_command="bash", cwd="/proj")
             )
-            mock_tmux.get_pane_title = AsyncMock(return_value="")
+            mock_tmux.get_pane_title = async_return("")
             mock_config.tmux_session_name = "ccgram"
             await discover_and_register_transcript(
                 "@7", client=bot, user_id=1, thread_id=42
@@ -937,10 +920,6 @@ class TestProviderSwitchPromptSetup:
         assert mock_ensure.call_args[0] == ("@7", "provider_switch")
 
     async def test_fallback_shell_assignment_sets_up_prompt_without_bot(self) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-
         with (
             patch(
                 "ccgram.handlers.recovery.transcript_discovery.session_manager"
@@ -976,10 +955,10 @@ class TestProviderSwitchPromptSetup:
                     transcript_path="",
                 )
             }
-            mock_tmux.find_window_by_id = AsyncMock(
-                return_value=MagicMock(pane_current_command="bash", cwd="/proj")
+            mock_tmux.find_window_by_id = async_return(
+                MagicMock(pane_current_command="bash", cwd="/proj")
             )
-            mock_tmux.get_pane_title = AsyncMock(return_value="")
+            mock_tmux.get_pane_title = async_return("")
             mock_config.tmux_session_name = "ccgram"
             await discover_and_register_transcript("@7")
 
@@ -989,11 +968,6 @@ class TestProviderSwitchPromptSetup:
 
 class TestProviderSwitchChain:
     async def test_claude_to_shell_to_gemini_to_shell(self) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-        from ccgram.window_state_store import WindowState
-
         state = WindowState(
             cwd="/proj", provider_name="claude", transcript_path="/tx/claude.jsonl"
         )
@@ -1065,10 +1039,8 @@ class TestProviderSwitchChain:
 
             # Step 1: claude → shell. User exits claude, pane shows fish.
             mock_detect.return_value = "shell"
-            mock_tmux.find_window_by_id = AsyncMock(
-                return_value=MagicMock(
-                    pane_current_command="fish", cwd="/proj", pane_tty=""
-                )
+            mock_tmux.find_window_by_id = async_return(
+                MagicMock(pane_current_command="fish", cwd="/proj", pane_tty="")
             )
             await discover_and_register_transcript(
                 "@7", client=bot, user_id=1, thread_id=42
@@ -1083,10 +1055,8 @@ class TestProviderSwitchChain:
 
             # Step 2: shell → gemini. User runs `gemini` in shell.
             mock_detect.return_value = "gemini"
-            mock_tmux.find_window_by_id = AsyncMock(
-                return_value=MagicMock(
-                    pane_current_command="gemini", cwd="/proj", pane_tty=""
-                )
+            mock_tmux.find_window_by_id = async_return(
+                MagicMock(pane_current_command="gemini", cwd="/proj", pane_tty="")
             )
             await discover_and_register_transcript(
                 "@7", client=bot, user_id=1, thread_id=42
@@ -1099,10 +1069,8 @@ class TestProviderSwitchChain:
 
             # Step 3: gemini → shell. User exits gemini, pane shows fish.
             mock_detect.return_value = "shell"
-            mock_tmux.find_window_by_id = AsyncMock(
-                return_value=MagicMock(
-                    pane_current_command="fish", cwd="/proj", pane_tty=""
-                )
+            mock_tmux.find_window_by_id = async_return(
+                MagicMock(pane_current_command="fish", cwd="/proj", pane_tty="")
             )
             await discover_and_register_transcript(
                 "@7", client=bot, user_id=1, thread_id=42
@@ -1116,11 +1084,6 @@ class TestProviderSwitchChain:
 
 class TestMaybeDiscoverTranscript:
     async def test_noop_when_discovered_session_matches_current(self) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-        from ccgram.providers.base import SessionStartEvent
-
         mock_provider = MagicMock()
         mock_provider.capabilities.supports_hook = False
         mock_provider.capabilities.name = "codex"
@@ -1157,10 +1120,10 @@ class TestMaybeDiscoverTranscript:
                     provider_name="codex",
                 )
             }
-            mock_tmux.find_window_by_id = AsyncMock(
-                return_value=MagicMock(pane_current_command="bun")
+            mock_tmux.find_window_by_id = async_return(
+                MagicMock(pane_current_command="bun")
             )
-            mock_tmux.get_pane_title = AsyncMock(return_value="")
+            mock_tmux.get_pane_title = async_return("")
             mock_config.tmux_session_name = "ccgram"
             await discover_and_register_transcript("@7")
 
@@ -1168,10 +1131,6 @@ class TestMaybeDiscoverTranscript:
         mock_sm.write_hookless_session_map.assert_not_called()
 
     async def test_skips_when_no_cwd_and_no_tmux_window(self) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-
         with (
             patch(
                 "ccgram.handlers.recovery.transcript_discovery.session_manager"
@@ -1184,16 +1143,11 @@ class TestMaybeDiscoverTranscript:
             ) as mock_tmux,
         ):
             mock_ws.window_states = {"@7": MagicMock(session_id="", cwd="")}
-            mock_tmux.find_window_by_id = AsyncMock(return_value=None)
+            mock_tmux.find_window_by_id = async_return(None)
             await discover_and_register_transcript("@7")
         mock_sm.register_hookless_session.assert_not_called()
 
     async def test_falls_back_to_tmux_cwd_when_state_cwd_empty(self) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-        from ccgram.providers.base import SessionStartEvent
-
         mock_provider = MagicMock()
         mock_provider.capabilities.supports_hook = False
         mock_provider.capabilities.name = "codex"
@@ -1230,8 +1184,8 @@ class TestMaybeDiscoverTranscript:
             ) as mock_config,
         ):
             mock_ws.window_states = {"@7": mock_state}
-            mock_tmux.find_window_by_id = AsyncMock(return_value=mock_window)
-            mock_tmux.get_pane_title = AsyncMock(return_value="")
+            mock_tmux.find_window_by_id = async_return(mock_window)
+            mock_tmux.get_pane_title = async_return("")
             mock_config.tmux_session_name = "ccgram"
             await discover_and_register_transcript("@7")
 
@@ -1241,10 +1195,6 @@ class TestMaybeDiscoverTranscript:
         mock_sms.register_hookless_session.assert_called_once()
 
     async def test_skips_when_provider_has_hooks(self) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-
         mock_provider = MagicMock()
         mock_provider.capabilities.supports_hook = True
         with (
@@ -1266,10 +1216,6 @@ class TestMaybeDiscoverTranscript:
         mock_sm.register_hookless_session.assert_not_called()
 
     async def test_skips_when_window_not_tracked(self) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-
         with (
             patch(
                 "ccgram.handlers.recovery.transcript_discovery.session_manager"
@@ -1283,11 +1229,6 @@ class TestMaybeDiscoverTranscript:
         mock_sm.register_hookless_session.assert_not_called()
 
     async def test_registers_when_transcript_found(self) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-        from ccgram.providers.base import SessionStartEvent
-
         mock_provider = MagicMock()
         mock_provider.capabilities.supports_hook = False
         mock_provider.capabilities.name = "codex"
@@ -1325,8 +1266,8 @@ class TestMaybeDiscoverTranscript:
             }
             mock_config.tmux_session_name = "ccgram"
             mock_window = MagicMock(pane_current_command="bun")
-            mock_tmux.find_window_by_id = AsyncMock(return_value=mock_window)
-            mock_tmux.get_pane_title = AsyncMock(return_value="")
+            mock_tmux.find_window_by_id = async_return(mock_window)
+            mock_tmux.get_pane_title = async_return("")
             await discover_and_register_transcript("@7")
 
         mock_sms.register_hookless_session.assert_called_once_with(
@@ -1345,11 +1286,6 @@ class TestMaybeDiscoverTranscript:
         )
 
     async def test_skips_session_if_already_bound_to_other_window(self) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-        from ccgram.providers.base import SessionStartEvent
-
         mock_provider = MagicMock()
         mock_provider.capabilities.supports_hook = False
         mock_provider.capabilities.name = "codex"
@@ -1400,21 +1336,16 @@ class TestMaybeDiscoverTranscript:
                 ),
             }
             mock_config.tmux_session_name = "ccgram"
-            mock_tmux.find_window_by_id = AsyncMock(
-                return_value=MagicMock(pane_current_command="bun")
+            mock_tmux.find_window_by_id = async_return(
+                MagicMock(pane_current_command="bun")
             )
-            mock_tmux.get_pane_title = AsyncMock(return_value="")
+            mock_tmux.get_pane_title = async_return("")
             await discover_and_register_transcript("@7")
 
         mock_sms.register_hookless_session.assert_not_called()
         mock_sms.write_hookless_session_map.assert_not_called()
 
     async def test_updates_when_new_session_discovered_for_same_window(self) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-        from ccgram.providers.base import SessionStartEvent
-
         mock_provider = MagicMock()
         mock_provider.capabilities.supports_hook = False
         mock_provider.capabilities.name = "codex"
@@ -1456,10 +1387,10 @@ class TestMaybeDiscoverTranscript:
                 )
             }
             mock_config.tmux_session_name = "ccgram"
-            mock_tmux.find_window_by_id = AsyncMock(
-                return_value=MagicMock(pane_current_command="bun")
+            mock_tmux.find_window_by_id = async_return(
+                MagicMock(pane_current_command="bun")
             )
-            mock_tmux.get_pane_title = AsyncMock(return_value="")
+            mock_tmux.get_pane_title = async_return("")
             await discover_and_register_transcript("@7")
 
         mock_sms.register_hookless_session.assert_called_once_with(
@@ -1471,10 +1402,6 @@ class TestMaybeDiscoverTranscript:
         )
 
     async def test_noop_when_discovery_returns_none(self) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-
         mock_provider = MagicMock()
         mock_provider.capabilities.supports_hook = False
         mock_provider.discover_transcript.return_value = None
@@ -1501,21 +1428,16 @@ class TestMaybeDiscoverTranscript:
                 "@7": MagicMock(session_id="", cwd="/proj", provider_name="codex")
             }
             mock_config.tmux_session_name = "ccgram"
-            mock_tmux.find_window_by_id = AsyncMock(
-                return_value=MagicMock(pane_current_command="bun")
+            mock_tmux.find_window_by_id = async_return(
+                MagicMock(pane_current_command="bun")
             )
-            mock_tmux.get_pane_title = AsyncMock(return_value="")
+            mock_tmux.get_pane_title = async_return("")
             await discover_and_register_transcript("@7")
 
         mock_sm.register_hookless_session.assert_not_called()
         mock_sm.write_hookless_session_map.assert_not_called()
 
     async def test_session_map_write_runs_in_background_thread(self) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-        from ccgram.providers.base import SessionStartEvent
-
         mock_provider = MagicMock()
         mock_provider.capabilities.supports_hook = False
         mock_provider.capabilities.name = "codex"
@@ -1556,8 +1478,8 @@ class TestMaybeDiscoverTranscript:
             }
             mock_config.tmux_session_name = "ccgram"
             mock_window = MagicMock(pane_current_command="bun")
-            mock_tmux.find_window_by_id = AsyncMock(return_value=mock_window)
-            mock_tmux.get_pane_title = AsyncMock(return_value="")
+            mock_tmux.find_window_by_id = async_return(mock_window)
+            mock_tmux.get_pane_title = async_return("")
             mock_asyncio.to_thread = AsyncMock(side_effect=[event, None])
             await discover_and_register_transcript("@7")
 
@@ -1569,11 +1491,6 @@ class TestMaybeDiscoverTranscript:
         mock_sms.register_hookless_session.assert_called_once()
 
     async def test_tries_hookless_providers_when_provider_name_empty(self) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-        from ccgram.providers.base import SessionStartEvent
-
         event = SessionStartEvent(
             session_id="uuid-found",
             cwd="/proj",
@@ -1629,8 +1546,8 @@ class TestMaybeDiscoverTranscript:
                 "@7": MagicMock(session_id="", cwd="/proj", provider_name="")
             }
             mock_config.tmux_session_name = "ccgram"
-            mock_tmux.find_window_by_id = AsyncMock(return_value=mock_window)
-            mock_tmux.get_pane_title = AsyncMock(return_value="")
+            mock_tmux.find_window_by_id = async_return(mock_window)
+            mock_tmux.get_pane_title = async_return("")
             await discover_and_register_transcript("@7")
 
         mock_sms.register_hookless_session.assert_called_once_with(
@@ -1644,11 +1561,6 @@ class TestMaybeDiscoverTranscript:
     async def test_tries_next_provider_when_session_conflicts_with_bound_window(
         self,
     ) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-        from ccgram.providers.base import SessionStartEvent
-
         conflicting_event = SessionStartEvent(
             session_id="uuid-in-use",
             cwd="/proj",
@@ -1712,10 +1624,10 @@ class TestMaybeDiscoverTranscript:
                 "@9": mock_bound_state,
             }
             mock_config.tmux_session_name = "ccgram"
-            mock_tmux.find_window_by_id = AsyncMock(
-                return_value=MagicMock(pane_current_command="bun")
+            mock_tmux.find_window_by_id = async_return(
+                MagicMock(pane_current_command="bun")
             )
-            mock_tmux.get_pane_title = AsyncMock(return_value="")
+            mock_tmux.get_pane_title = async_return("")
             await discover_and_register_transcript("@7")
 
         mock_codex.discover_transcript.assert_called_once()
@@ -1729,10 +1641,6 @@ class TestMaybeDiscoverTranscript:
         )
 
     async def test_skips_hookless_fallback_when_pane_is_shell(self) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-
         mock_window = MagicMock(pane_current_command="bash")
 
         with (
@@ -1749,16 +1657,12 @@ class TestMaybeDiscoverTranscript:
             mock_ws.window_states = {
                 "@7": MagicMock(session_id="", cwd="/proj", provider_name="")
             }
-            mock_tmux.find_window_by_id = AsyncMock(return_value=mock_window)
+            mock_tmux.find_window_by_id = async_return(mock_window)
             await discover_and_register_transcript("@7")
 
         mock_sm.register_hookless_session.assert_not_called()
 
     async def test_passes_max_age_zero_when_pane_is_alive(self) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-
         mock_provider = MagicMock()
         mock_provider.capabilities.supports_hook = False
         mock_provider.capabilities.name = "codex"
@@ -1789,10 +1693,10 @@ class TestMaybeDiscoverTranscript:
                 "@7": MagicMock(session_id="", cwd="/proj", provider_name="codex")
             }
             mock_config.tmux_session_name = "ccgram"
-            mock_tmux.find_window_by_id = AsyncMock(
-                return_value=MagicMock(pane_current_command="bun")
+            mock_tmux.find_window_by_id = async_return(
+                MagicMock(pane_current_command="bun")
             )
-            mock_tmux.get_pane_title = AsyncMock(return_value="")
+            mock_tmux.get_pane_title = async_return("")
             mock_asyncio.to_thread = AsyncMock(return_value=None)
             await discover_and_register_transcript("@7")
 
@@ -1801,10 +1705,6 @@ class TestMaybeDiscoverTranscript:
         assert discover_call.kwargs["max_age"] == 0
 
     async def test_passes_max_age_none_when_pane_not_alive(self) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-
         mock_provider = MagicMock()
         mock_provider.capabilities.supports_hook = False
         mock_provider.capabilities.name = "codex"
@@ -1835,7 +1735,7 @@ class TestMaybeDiscoverTranscript:
                 "@7": MagicMock(session_id="", cwd="/proj", provider_name="codex")
             }
             mock_config.tmux_session_name = "ccgram"
-            mock_tmux.find_window_by_id = AsyncMock(return_value=None)
+            mock_tmux.find_window_by_id = async_return(None)
             mock_asyncio.to_thread = AsyncMock(return_value=None)
             await discover_and_register_transcript("@7")
 
@@ -1844,11 +1744,6 @@ class TestMaybeDiscoverTranscript:
         assert discover_call.kwargs["max_age"] is None
 
     async def test_rebinds_stale_codex_window_to_gemini_from_pane_title(self) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-        from ccgram.providers.base import SessionStartEvent
-
         mock_codex = MagicMock()
         mock_codex.capabilities.supports_hook = False
         mock_codex.capabilities.name = "codex"
@@ -1913,13 +1808,13 @@ class TestMaybeDiscoverTranscript:
         ):
             mock_ws.window_states = {"@7": mock_state}
             mock_sm.set_window_provider.side_effect = _set_window_provider
-            mock_tmux.find_window_by_id = AsyncMock(
-                return_value=MagicMock(
+            mock_tmux.find_window_by_id = async_return(
+                MagicMock(
                     pane_current_command="bun",
                     cwd="/Users/alexei/Workspace/ccgram",
                 )
             )
-            mock_tmux.get_pane_title = AsyncMock(return_value="◇  Ready (ccbot)")
+            mock_tmux.get_pane_title = async_return("◇  Ready (ccbot)")
             mock_config.tmux_session_name = "ccgram"
             await discover_and_register_transcript("@7")
 
@@ -1941,11 +1836,6 @@ class TestMaybeDiscoverTranscript:
     async def test_rebinds_stale_claude_window_to_codex_from_transcript_path(
         self,
     ) -> None:
-        from ccgram.handlers.recovery.transcript_discovery import (
-            discover_and_register_transcript,
-        )
-        from ccgram.providers.base import SessionStartEvent
-
         codex_event = SessionStartEvent(
             session_id="codex-uuid",
             cwd="/Users/alexei/Workspace/ccgram",
@@ -2013,8 +1903,8 @@ class TestMaybeDiscoverTranscript:
         ):
             mock_ws.window_states = {"@7": mock_state}
             mock_sm.set_window_provider.side_effect = _set_window_provider
-            mock_tmux.find_window_by_id = AsyncMock(
-                return_value=MagicMock(
+            mock_tmux.find_window_by_id = async_return(
+                MagicMock(
                     pane_current_command="node",
                     cwd="/Users/alexei/Workspace/ccgram",
                 )
@@ -2187,8 +2077,7 @@ class TestDeadWindowNotification:
     async def test_probe_cleans_up_on_thread_not_found(self, error_msg: str) -> None:
         bot = AsyncMock(spec=Bot)
         bot.unpin_all_forum_topic_messages.side_effect = BadRequest(error_msg)
-        mock_window = MagicMock()
-        mock_window.window_id = "@5"
+        mock_window = _make_window(window_id="@5")
         with (
             patch("ccgram.handlers.topics.topic_lifecycle.thread_router") as mock_tr,
             patch("ccgram.handlers.topics.topic_lifecycle.tmux_manager") as mock_tm,
@@ -2199,7 +2088,7 @@ class TestDeadWindowNotification:
         ):
             mock_tr.iter_thread_bindings.return_value = [(1, 42, "@5")]
             mock_tr.resolve_chat_id.return_value = -100
-            mock_tm.find_window_by_id = AsyncMock(return_value=mock_window)
+            mock_tm.find_window_by_id = async_return(mock_window)
             mock_tm.kill_window = AsyncMock()
             await probe_topic_existence(bot)
 
@@ -2253,8 +2142,6 @@ class TestScanWindowPanes:
         mock_handle.assert_not_called()
 
     async def test_detects_interactive_prompt_in_non_active_pane(self) -> None:
-        from ccgram.providers.base import StatusUpdate
-
         bot = AsyncMock(spec=Bot)
         interactive = StatusUpdate(
             raw_text="Allow?",
@@ -2308,8 +2195,6 @@ class TestScanWindowPanes:
         mock_tm.capture_pane_by_id.assert_called_once_with("%2", window_id="@0")
 
     async def test_deduplicates_same_prompt(self) -> None:
-        from ccgram.providers.base import StatusUpdate
-
         bot = AsyncMock(spec=Bot)
         interactive = StatusUpdate(
             raw_text="Allow write?",
@@ -2382,10 +2267,6 @@ class TestScanWindowPanes:
 @pytest.mark.usefixtures("_reset_pyte")
 class TestUpdateStatusMessageEdgeCases:
     async def test_window_gone_enqueues_clear(self) -> None:
-        from ccgram.handlers.polling.window_tick import (
-            _update_status as update_status_message,
-        )
-
         bot = AsyncMock(spec=Bot)
         with (
             patch("ccgram.handlers.polling.window_tick.apply.tmux_manager") as mock_tm,
@@ -2394,20 +2275,13 @@ class TestUpdateStatusMessageEdgeCases:
                 new_callable=AsyncMock,
             ) as mock_enqueue,
         ):
-            mock_tm.find_window_by_id = AsyncMock(return_value=None)
+            mock_tm.find_window_by_id = async_return(None)
             await update_status_message(bot, 1, "@0", thread_id=42)
         mock_enqueue.assert_called_once_with(ANY, 1, "@0", None, thread_id=42)
 
     async def test_empty_capture_keeps_existing_status(self) -> None:
-        from ccgram.handlers.polling.window_tick import (
-            _update_status as update_status_message,
-        )
-
         bot = AsyncMock(spec=Bot)
-        mock_window = MagicMock()
-        mock_window.window_id = "@0"
-        mock_window.pane_width = 80
-        mock_window.pane_height = 24
+        mock_window = _make_window(pane_width=80, pane_height=24)
         with (
             patch("ccgram.handlers.polling.window_tick.apply.tmux_manager") as mock_tm,
             patch(
@@ -2415,26 +2289,19 @@ class TestUpdateStatusMessageEdgeCases:
                 new_callable=AsyncMock,
             ) as mock_enqueue,
         ):
-            mock_tm.find_window_by_id = AsyncMock(return_value=mock_window)
+            mock_tm.find_window_by_id = async_return(mock_window)
             mock_tm.capture_pane = AsyncMock(return_value=None)
             await update_status_message(bot, 1, "@0", thread_id=42)
         mock_enqueue.assert_not_called()
 
     async def test_vim_insert_detected_from_rendered_text(self) -> None:
-        from ccgram.handlers.polling.window_tick import (
-            _update_status as update_status_message,
-        )
-        from ccgram.providers.base import StatusUpdate
-
         terminal_poll_state.get_state(
             "@0"
         ).last_rendered_text = "some code\n-- INSERT --\n"
         pyte_status = StatusUpdate(raw_text="Working", display_label="...working")
-        mock_window = MagicMock()
-        mock_window.window_id = "@0"
-        mock_window.pane_width = 80
-        mock_window.pane_height = 24
-        mock_window.pane_current_command = "node"
+        mock_window = _make_window(
+            pane_width=80, pane_height=24, pane_current_command="node"
+        )
         bot = AsyncMock(spec=Bot)
         with (
             patch("ccgram.handlers.polling.window_tick.apply.tmux_manager") as mock_tm,
@@ -2463,7 +2330,7 @@ class TestUpdateStatusMessageEdgeCases:
                 return_value=[],
             ),
         ):
-            mock_tm.find_window_by_id = AsyncMock(return_value=mock_window)
+            mock_tm.find_window_by_id = async_return(mock_window)
             mock_tm.capture_pane = AsyncMock(return_value="\x1b[1mansi\x1b[0m")
             mock_tr.resolve_chat_id.return_value = -100
             mock_tr.get_display_name.return_value = "project"
@@ -2472,19 +2339,12 @@ class TestUpdateStatusMessageEdgeCases:
         mock_vim.assert_called_once_with("@0")
 
     async def test_status_includes_subagent_names(self) -> None:
-        from ccgram.handlers.polling.window_tick import (
-            _update_status as update_status_message,
-        )
-        from ccgram.providers.base import StatusUpdate
-
         pyte_status = StatusUpdate(
             raw_text="Working", display_label="\u23f3 Working\u2026"
         )
-        mock_window = MagicMock()
-        mock_window.window_id = "@0"
-        mock_window.pane_width = 80
-        mock_window.pane_height = 24
-        mock_window.pane_current_command = "node"
+        mock_window = _make_window(
+            pane_width=80, pane_height=24, pane_current_command="node"
+        )
         bot = AsyncMock(spec=Bot)
         with (
             patch("ccgram.handlers.polling.window_tick.apply.tmux_manager") as mock_tm,
@@ -2511,7 +2371,7 @@ class TestUpdateStatusMessageEdgeCases:
                 return_value=["write-tests"],
             ),
         ):
-            mock_tm.find_window_by_id = AsyncMock(return_value=mock_window)
+            mock_tm.find_window_by_id = async_return(mock_window)
             mock_tm.capture_pane = AsyncMock(return_value="some output")
             mock_tr.resolve_chat_id.return_value = -100
             mock_tr.get_display_name.return_value = "project"
@@ -2522,11 +2382,6 @@ class TestUpdateStatusMessageEdgeCases:
         assert "\U0001f916" in status_text
 
     async def test_status_prefers_multiline_raw_task_block(self) -> None:
-        from ccgram.handlers.polling.window_tick import (
-            _update_status as update_status_message,
-        )
-        from ccgram.providers.base import StatusUpdate
-
         pyte_status = StatusUpdate(
             raw_text=(
                 "Running py-idioms review…\n"
@@ -2536,11 +2391,9 @@ class TestUpdateStatusMessageEdgeCases:
             ),
             display_label="\u26a1 running\u2026",
         )
-        mock_window = MagicMock()
-        mock_window.window_id = "@0"
-        mock_window.pane_width = 80
-        mock_window.pane_height = 24
-        mock_window.pane_current_command = "node"
+        mock_window = _make_window(
+            pane_width=80, pane_height=24, pane_current_command="node"
+        )
         bot = AsyncMock(spec=Bot)
         with (
             patch("ccgram.handlers.polling.window_tick.apply.tmux_manager") as mock_tm,
@@ -2567,7 +2420,7 @@ class TestUpdateStatusMessageEdgeCases:
                 return_value=[],
             ),
         ):
-            mock_tm.find_window_by_id = AsyncMock(return_value=mock_window)
+            mock_tm.find_window_by_id = async_return(mock_window)
             mock_tm.capture_pane = AsyncMock(return_value="some output")
             mock_tr.resolve_chat_id.return_value = -100
             mock_tr.get_display_name.return_value = "project"
@@ -2579,17 +2432,10 @@ class TestUpdateStatusMessageEdgeCases:
         assert "◻ Collect agent results" in status_text
 
     async def test_interactive_window_clears_when_ui_disappears(self) -> None:
-        from ccgram.handlers.polling.window_tick import (
-            _update_status as update_status_message,
-        )
-        from ccgram.providers.base import StatusUpdate
-
         non_interactive = StatusUpdate(raw_text="Working", display_label="...working")
-        mock_window = MagicMock()
-        mock_window.window_id = "@0"
-        mock_window.pane_width = 80
-        mock_window.pane_height = 24
-        mock_window.pane_current_command = "node"
+        mock_window = _make_window(
+            pane_width=80, pane_height=24, pane_current_command="node"
+        )
         bot = AsyncMock(spec=Bot)
         with (
             patch("ccgram.handlers.polling.window_tick.apply.tmux_manager") as mock_tm,
@@ -2617,7 +2463,7 @@ class TestUpdateStatusMessageEdgeCases:
                 return_value=[],
             ),
         ):
-            mock_tm.find_window_by_id = AsyncMock(return_value=mock_window)
+            mock_tm.find_window_by_id = async_return(mock_window)
             mock_tm.capture_pane = AsyncMock(return_value="some output")
             mock_tr.resolve_chat_id.return_value = -100
             mock_tr.get_display_name.return_value = "project"
@@ -2626,22 +2472,15 @@ class TestUpdateStatusMessageEdgeCases:
         _assert_clear_called_once_with_client(mock_clear, 1, bot, 42)
 
     async def test_new_interactive_ui_enters_interactive_mode(self) -> None:
-        from ccgram.handlers.polling.window_tick import (
-            _update_status as update_status_message,
-        )
-        from ccgram.providers.base import StatusUpdate
-
         interactive_status = StatusUpdate(
             raw_text="Allow?",
             display_label="Allow?",
             is_interactive=True,
             ui_type="PermissionPrompt",
         )
-        mock_window = MagicMock()
-        mock_window.window_id = "@0"
-        mock_window.pane_width = 80
-        mock_window.pane_height = 24
-        mock_window.pane_current_command = "node"
+        mock_window = _make_window(
+            pane_width=80, pane_height=24, pane_current_command="node"
+        )
         bot = AsyncMock(spec=Bot)
         with (
             patch("ccgram.handlers.polling.window_tick.apply.tmux_manager") as mock_tm,
@@ -2663,7 +2502,7 @@ class TestUpdateStatusMessageEdgeCases:
             patch("ccgram.tmux_manager.has_insert_indicator", return_value=False),
             patch("ccgram.tmux_manager.notify_vim_insert_seen"),
         ):
-            mock_tm.find_window_by_id = AsyncMock(return_value=mock_window)
+            mock_tm.find_window_by_id = async_return(mock_window)
             mock_tm.capture_pane = AsyncMock(return_value="Allow?\nEsc\n")
             await update_status_message(bot, 1, "@0", thread_id=42)
         _assert_handle_called_once_with_client(mock_handle, bot, 1, "@0", 42)
@@ -2679,19 +2518,13 @@ class TestCheckInteractiveOnly:
         ],
     )
     async def test_detects_interactive_ui(self, interactive_window: str | None) -> None:
-        from ccgram.handlers.polling.window_tick import _check_interactive_only
-        from ccgram.providers.base import StatusUpdate
-
         interactive_status = StatusUpdate(
             raw_text="Allow?",
             display_label="Allow?",
             is_interactive=True,
             ui_type="PermissionPrompt",
         )
-        mock_window = MagicMock()
-        mock_window.window_id = "@0"
-        mock_window.pane_width = 80
-        mock_window.pane_height = 24
+        mock_window = _make_window(pane_width=80, pane_height=24)
         bot = AsyncMock(spec=Bot)
         with (
             patch("ccgram.handlers.polling.window_tick.apply.tmux_manager") as mock_tm,
@@ -2720,19 +2553,13 @@ class TestCheckInteractiveOnly:
         _assert_handle_called_once_with_client(mock_handle, bot, 1, "@0", 42)
 
     async def test_clears_interactive_mode_on_handle_failure(self) -> None:
-        from ccgram.handlers.polling.window_tick import _check_interactive_only
-        from ccgram.providers.base import StatusUpdate
-
         interactive_status = StatusUpdate(
             raw_text="Allow?",
             display_label="Allow?",
             is_interactive=True,
             ui_type="PermissionPrompt",
         )
-        mock_window = MagicMock()
-        mock_window.window_id = "@0"
-        mock_window.pane_width = 80
-        mock_window.pane_height = 24
+        mock_window = _make_window(pane_width=80, pane_height=24)
         bot = AsyncMock(spec=Bot)
         with (
             patch("ccgram.handlers.polling.window_tick.apply.tmux_manager") as mock_tm,
@@ -2762,10 +2589,7 @@ class TestCheckInteractiveOnly:
         mock_clear.assert_called_once_with(1, 42)
 
     async def test_skips_when_already_interactive(self) -> None:
-        from ccgram.handlers.polling.window_tick import _check_interactive_only
-
-        mock_window = MagicMock()
-        mock_window.window_id = "@0"
+        mock_window = _make_window()
         bot = AsyncMock(spec=Bot)
         with (
             patch("ccgram.handlers.polling.window_tick.apply.tmux_manager") as mock_tm,
@@ -2788,16 +2612,10 @@ class TestCheckInteractiveOnly:
         mock_handle.assert_not_called()
 
     async def test_no_action_when_not_interactive(self) -> None:
-        from ccgram.handlers.polling.window_tick import _check_interactive_only
-        from ccgram.providers.base import StatusUpdate
-
         normal_status = StatusUpdate(
             raw_text="Reading file", display_label="reading..."
         )
-        mock_window = MagicMock()
-        mock_window.window_id = "@0"
-        mock_window.pane_width = 80
-        mock_window.pane_height = 24
+        mock_window = _make_window(pane_width=80, pane_height=24)
         bot = AsyncMock(spec=Bot)
         with (
             patch("ccgram.handlers.polling.window_tick.apply.tmux_manager") as mock_tm,
@@ -2819,8 +2637,6 @@ class TestCheckInteractiveOnly:
         mock_handle.assert_not_called()
 
     async def test_no_action_when_window_gone(self) -> None:
-        from ccgram.handlers.polling.window_tick import _check_interactive_only
-
         bot = AsyncMock(spec=Bot)
         with (
             patch("ccgram.handlers.polling.window_tick.apply.tmux_manager") as mock_tm,
@@ -2829,15 +2645,12 @@ class TestCheckInteractiveOnly:
                 new_callable=AsyncMock,
             ) as mock_handle,
         ):
-            mock_tm.find_window_by_id = AsyncMock(return_value=None)
+            mock_tm.find_window_by_id = async_return(None)
             await _check_interactive_only(bot, 1, "@0", 42)
         mock_handle.assert_not_called()
 
     async def test_no_action_on_empty_capture(self) -> None:
-        from ccgram.handlers.polling.window_tick import _check_interactive_only
-
-        mock_window = MagicMock()
-        mock_window.window_id = "@0"
+        mock_window = _make_window()
         bot = AsyncMock(spec=Bot)
         with (
             patch("ccgram.handlers.polling.window_tick.apply.tmux_manager") as mock_tm,
@@ -2868,9 +2681,6 @@ class TestCheckInteractiveOnly:
     async def test_falls_back_to_provider_regex(
         self, uses_pane_title: bool, expected_title: str
     ) -> None:
-        from ccgram.handlers.polling.window_tick import _check_interactive_only
-        from ccgram.providers.base import StatusUpdate
-
         interactive_status = StatusUpdate(
             raw_text="Allow?",
             display_label="Allow?",
@@ -2880,10 +2690,7 @@ class TestCheckInteractiveOnly:
         mock_provider = MagicMock()
         mock_provider.capabilities.uses_pane_title = uses_pane_title
         mock_provider.parse_terminal_status.return_value = interactive_status
-        mock_window = MagicMock()
-        mock_window.window_id = "@0"
-        mock_window.pane_width = 80
-        mock_window.pane_height = 24
+        mock_window = _make_window(pane_width=80, pane_height=24)
         bot = AsyncMock(spec=Bot)
         with (
             patch("ccgram.handlers.polling.window_tick.apply.tmux_manager") as mock_tm,
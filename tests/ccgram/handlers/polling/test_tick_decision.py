@@ -2,9 +2,13 @@
 
 import time
 
+import pytest
+
 from ccgram.handlers.polling.polling_types import TickContext, TickDecision
 from ccgram.handlers.polling.window_tick import decide_tick
 
+pytestmark = pytest.mark.status_polling
+
 
 def _ctx(
     window_id: str = "@1",
@@ -24,6 +24,8 @@ from ccgram.handlers.polling.window_tick import (
 )
 from ccgram.providers.base import StatusUpdate
 
+pytestmark = pytest.mark.status_polling
+
 
 @pytest.fixture(autouse=True)
 def _reset():
@@ -13,6 +13,8 @@ from ccgram.handlers.polling.window_tick.decide import (
 )
 from ccgram.providers.base import StatusUpdate
 
+pytestmark = pytest.mark.status_polling
+
 
 def _make_ctx(
     *,
@@ -276,7 +276,6 @@ def _clean_monitor_state():
 
 @pytest.mark.usefixtures("_clean_monitor_state")
 class TestCheckPassiveShellOutput:
-    @pytest.mark.asyncio()
     async def test_skips_when_no_markers(self) -> None:
         from ccgram.handlers.shell.shell_capture import (
             _shell_monitor_state,
@@ -292,7 +291,6 @@ class TestCheckPassiveShellOutput:
             or _shell_monitor_state["@0"].msg_id is None
         )
 
-    @pytest.mark.asyncio()
     async def test_relays_completed_command(self) -> None:
         from ccgram.handlers.shell.shell_capture import (
             _shell_monitor_state,
@@ -325,7 +323,6 @@ class TestCheckPassiveShellOutput:
         assert state.msg_id == 99
         assert state.last_command_echo == "ccgram:0❯ ls"
 
-    @pytest.mark.asyncio()
     async def test_skips_unchanged_content(self) -> None:
         from ccgram.handlers.shell.shell_capture import check_passive_shell_output
 
@@ -366,7 +363,6 @@ class TestCheckPassiveShellOutput:
 
         mock_send2.assert_not_called()
 
-    @pytest.mark.asyncio()
     async def test_error_indicator_for_nonzero_exit(self) -> None:
         from ccgram.handlers.shell.shell_capture import (
             _shell_monitor_state,
@@ -399,7 +395,6 @@ class TestCheckPassiveShellOutput:
         state = _shell_monitor_state["@0"]
         assert state.exit_code_sent is True
 
-    @pytest.mark.asyncio()
     async def test_new_command_resets_state(self) -> None:
         from ccgram.handlers.shell.shell_capture import (
             _shell_monitor_state,
@@ -453,7 +448,6 @@ class TestCheckPassiveShellOutput:
         assert state.last_command_echo == "ccgram:0❯ pwd"
         assert state.msg_id == mock_sent2.message_id
 
-    @pytest.mark.asyncio()
     async def test_long_output_with_scrollback(self) -> None:
         from ccgram.handlers.shell.shell_capture import (
             _shell_monitor_state,
@@ -521,7 +515,6 @@ class TestClearShellMonitorState:
 
 @pytest.mark.usefixtures("_clean_monitor_state")
 class TestPassiveEdgeCases:
-    @pytest.mark.asyncio()
     async def test_same_command_rerun_creates_new_message(self) -> None:
         from ccgram.handlers.shell.shell_capture import (
             _shell_monitor_state,
@@ -572,7 +565,6 @@ class TestPassiveEdgeCases:
 
         assert _shell_monitor_state["@0"].msg_id == 61
 
-    @pytest.mark.asyncio()
     async def test_scroll_out_preserves_in_progress(self) -> None:
         from ccgram.handlers.shell.shell_capture import (
             _ShellMonitorState,
@@ -649,7 +641,6 @@ class TestHasMarkersInTail:
 
 @pytest.mark.usefixtures("_clean_monitor_state")
 class TestPassiveRelayFormatting:
-    @pytest.mark.asyncio()
     async def test_output_includes_command_header(self) -> None:
         from ccgram.handlers.shell.shell_capture import check_passive_shell_output
 
@@ -679,7 +670,6 @@ class TestPassiveRelayFormatting:
         assert "hello" in sent_text
         assert sent_text.startswith("```\n")
 
-    @pytest.mark.asyncio()
     async def test_multiline_output_formatted(self) -> None:
         from ccgram.handlers.shell.shell_capture import check_passive_shell_output
 
@@ -708,7 +698,6 @@ class TestPassiveRelayFormatting:
         assert "❯ seq 1 3" in sent_text
         assert "1\n2\n3" in sent_text
 
-    @pytest.mark.asyncio()
     async def test_error_command_shows_exit_indicator(self) -> None:
         from ccgram.handlers.shell.shell_capture import (
             _shell_monitor_state,
@@ -742,7 +731,6 @@ class TestPassiveRelayFormatting:
         edit_text = mock_edit.call_args[0][3]  # (bot, chat_id, msg_id, text)
         assert "exit 127" in edit_text
 
-    @pytest.mark.asyncio()
     async def test_telegram_command_reacts_done_on_success(self) -> None:
         from ccgram.handlers.shell.shell_capture import (
             _shell_monitor_state,
@@ -786,7 +774,6 @@ class TestPassiveRelayFormatting:
         assert _shell_monitor_state["@0"].telegram_message_id == 0
         reset_shell_monitor_state()
 
-    @pytest.mark.asyncio()
     async def test_telegram_command_reacts_fail_on_nonzero_exit(self) -> None:
         from ccgram.handlers.shell.shell_capture import (
             check_passive_shell_output,
@@ -829,7 +816,6 @@ class TestPassiveRelayFormatting:
         assert mock_react.call_args.args[2] == 601
         reset_shell_monitor_state()
 
-    @pytest.mark.asyncio()
     async def test_no_message_id_skips_reaction(self) -> None:
         from ccgram.handlers.shell.shell_capture import (
             check_passive_shell_output,
@@ -869,7 +855,6 @@ class TestPassiveRelayFormatting:
 
 
 class TestCaptureWithScrollback:
-    @pytest.mark.asyncio()
     async def test_returns_text_on_success(self) -> None:
         from ccgram.handlers.shell.shell_capture import _capture_with_scrollback
 
@@ -883,7 +868,6 @@ class TestCaptureWithScrollback:
 
         assert result == "line1\nline2"
 
-    @pytest.mark.asyncio()
     async def test_returns_none_on_empty(self) -> None:
         from ccgram.handlers.shell.shell_capture import _capture_with_scrollback
 
@@ -897,7 +881,6 @@ class TestCaptureWithScrollback:
 
         assert result is None
 
-    @pytest.mark.asyncio()
     async def test_uses_correct_tmux_flags(self) -> None:
         from ccgram.handlers.shell.shell_capture import _capture_with_scrollback
 
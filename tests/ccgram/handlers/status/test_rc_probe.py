@@ -19,6 +19,8 @@ from ccgram.telegram_client import FakeTelegramClient
 from ccgram.thread_router import thread_router
 from ccgram.window_state_store import window_store
 
+pytestmark = pytest.mark.status_ui
+
 
 @pytest.fixture
 def mgr(monkeypatch) -> SessionManager:
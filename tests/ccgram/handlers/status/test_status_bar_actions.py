@@ -1,5 +1,7 @@
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
+import pytest
+
 from ccgram.handlers.callback_data import (
     CB_KEYS_PREFIX,
     CB_STATUS_ESC,
@@ -8,6 +10,8 @@ from ccgram.handlers.callback_data import (
 )
 from ccgram.handlers.status.status_bar_actions import _handle_status_bar_action
 
+pytestmark = pytest.mark.status_ui
+
 MOD = "ccgram.handlers.status.status_bar_actions"
 
 
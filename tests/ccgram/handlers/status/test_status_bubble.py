@@ -24,6 +24,8 @@ from ccgram.handlers.status.status_bubble import (
 from ccgram.telegram_draft import mark_draft_unavailable, reset_draft_state
 from ccgram.window_state_store import PaneInfo, WindowState, window_store
 
+pytestmark = pytest.mark.status_ui
+
 USER_ID = 1
 THREAD_ID = 10
 WINDOW_ID = "@0"
@@ -1,7 +1,5 @@
 """Tests for status message inline action buttons (Esc, Screenshot, Notify)."""
 
-from unittest.mock import patch
-
 import pytest
 
 from ccgram.handlers.callback_data import (
@@ -12,8 +10,39 @@ from ccgram.handlers.callback_data import (
     CB_STATUS_SCREENSHOT,
     NOTIFY_MODE_ICONS,
 )
+from ccgram.config import config
 from ccgram.handlers.status.status_bubble import build_status_keyboard
 
+pytestmark = pytest.mark.status_ui
+
+_ACTIONS = "ccgram.handlers.status.status_bar_actions"
+_NOTIFY_ITEMS = list(NOTIFY_MODE_ICONS.items())
+
+
+@pytest.fixture
+def notification_mode(monkeypatch):
+    modes = {"mode": "all"}
+    monkeypatch.setattr(
+        "ccgram.handlers.status.status_bubble.get_notification_mode",
+        lambda _window_id: modes["mode"],
+    )
+    return modes
+
+
+@pytest.fixture
+def miniapp(monkeypatch):
+    monkeypatch.setattr(config, "miniapp_base_url", "https://example.com")
+    monkeypatch.setattr(config, "telegram_bot_token", "bot:abc")
+    signed: list[tuple[str, int]] = []
+
+    def fake_sign(*, bot_token: str, window_id: str, user_id: int) -> str:
+        assert bot_token == "bot:abc"
+        signed.append((window_id, user_id))
+        return "abc.def"
+
+    monkeypatch.setattr(f"{_ACTIONS}.sign_token", fake_sign)
+    return signed
+
 
 def _all_callback_data(window_id: str) -> list[str]:
     kb = build_status_keyboard(window_id)
@@ -25,20 +54,29 @@ def _all_callback_data(window_id: str) -> list[str]:
     ]
 
 
+@pytest.fixture(scope="module")
+def cb_data_at0() -> list[str]:
+    return _all_callback_data("@0")
+
+
+@pytest.fixture(scope="module")
+def cb_data_at42() -> list[str]:
+    return _all_callback_data("@42")
+
+
 class TestBuildStatusKeyboard:
     @pytest.mark.parametrize(
         "prefix",
         [CB_STATUS_ESC, CB_STATUS_SCREENSHOT, CB_STATUS_NOTIFY, CB_STATUS_REMOTE],
     )
-    def test_has_button_with_prefix(self, prefix: str) -> None:
-        assert any(d.startswith(prefix) for d in _all_callback_data("@0"))
+    def test_has_button_with_prefix(self, cb_data_at0: list[str], prefix: str) -> None:
+        assert any(d.startswith(prefix) for d in cb_data_at0)
 
-    def test_window_id_in_callback_data(self) -> None:
-        data = _all_callback_data("@42")
-        assert f"{CB_STATUS_ESC}@42" in data
-        assert f"{CB_STATUS_SCREENSHOT}@42" in data
-        assert f"{CB_STATUS_NOTIFY}@42" in data
-        assert f"{CB_STATUS_REMOTE}@42" in data
+    def test_window_id_in_callback_data(self, cb_data_at42: list[str]) -> None:
+        assert f"{CB_STATUS_ESC}@42" in cb_data_at42
+        assert f"{CB_STATUS_SCREENSHOT}@42" in cb_data_at42
+        assert f"{CB_STATUS_NOTIFY}@42" in cb_data_at42
+        assert f"{CB_STATUS_REMOTE}@42" in cb_data_at42
 
     def test_callback_data_truncated_to_64_bytes(self) -> None:
         long_id = "@" + "x" * 60
@@ -49,24 +87,17 @@ class TestBuildStatusKeyboard:
             CB_STATUS_NOTIFY,
             CB_STATUS_REMOTE,
         )
-        for row in kb.inline_keyboard:
-            for btn in row:
-                cb = btn.callback_data
-                assert isinstance(cb, str)
-                assert len(cb) == 64
-                assert any(cb.startswith(p) for p in prefixes)
+        data = [btn.callback_data for row in kb.inline_keyboard for btn in row]
+        assert all(isinstance(cb, str) and len(cb) == 64 for cb in data), data
+        assert all(cb.startswith(prefixes) for cb in data), data  # type: ignore[union-attr]
 
-    @pytest.mark.parametrize(("mode", "expected_icon"), list(NOTIFY_MODE_ICONS.items()))
+    @pytest.mark.parametrize(("mode", "expected_icon"), _NOTIFY_ITEMS)
     def test_bell_icon_reflects_notification_mode(
-        self, mode: str, expected_icon: str
+        self, notification_mode, mode: str, expected_icon: str
     ) -> None:
-        with patch(
-            "ccgram.handlers.status.status_bubble.get_notification_mode",
-            return_value=mode,
-        ):
-            kb = build_status_keyboard("@0")
-            notify_btn = kb.inline_keyboard[0][2]
-            assert notify_btn.text == expected_icon
+        notification_mode["mode"] = mode
+        notify_btn = build_status_keyboard("@0").inline_keyboard[0][2]
+        assert notify_btn.text == expected_icon
 
     def test_no_history_single_row(self) -> None:
         kb = build_status_keyboard("@0")
@@ -103,9 +134,8 @@ class TestBuildStatusKeyboard:
         assert len(cb) == 64  # type: ignore[arg-type]
         assert cb.startswith(CB_STATUS_RECALL)  # type: ignore[union-attr]
 
-    def test_rc_button_always_present(self) -> None:
-        data = _all_callback_data("@0")
-        assert any(d.startswith(CB_STATUS_REMOTE) for d in data)
+    def test_rc_button_always_present(self, cb_data_at0: list[str]) -> None:
+        assert any(d.startswith(CB_STATUS_REMOTE) for d in cb_data_at0)
 
     def test_rc_button_label_inactive(self) -> None:
         kb = build_status_keyboard("@0")
@@ -133,36 +163,22 @@ class TestBuildStatusKeyboard:
 class TestDashboardButtonRow:
     """Dashboard WebApp button is appended only when Mini App is enabled."""
 
-    def test_no_dashboard_when_user_id_omitted(self) -> None:
+    def test_no_dashboard_when_user_id_omitted(self, miniapp) -> None:
         # No user_id \u2192 no dashboard button even if base_url is set.
-        with patch("ccgram.handlers.status.status_bar_actions.config") as cfg:
-            cfg.miniapp_base_url = "https://example.com"
-            cfg.telegram_bot_token = "bot:abc"
-            kb = build_status_keyboard("@0")
+        kb = build_status_keyboard("@0")
         for row in kb.inline_keyboard:
             for btn in row:
                 assert btn.web_app is None
 
-    def test_no_dashboard_when_miniapp_disabled(self) -> None:
-        with patch("ccgram.handlers.status.status_bar_actions.config") as cfg:
-            cfg.miniapp_base_url = ""
-            cfg.telegram_bot_token = "bot:abc"
-            kb = build_status_keyboard("@0", user_id=42)
+    def test_no_dashboard_when_miniapp_disabled(self, miniapp, monkeypatch) -> None:
+        monkeypatch.setattr(config, "miniapp_base_url", "")
+        kb = build_status_keyboard("@0", user_id=42)
         for row in kb.inline_keyboard:
             for btn in row:
                 assert btn.web_app is None
 
-    def test_dashboard_appended_when_enabled(self) -> None:
-        with (
-            patch("ccgram.handlers.status.status_bar_actions.config") as cfg,
-            patch(
-                "ccgram.handlers.status.status_bar_actions.sign_token",
-                return_value="abc.def",
-            ),
-        ):
-            cfg.miniapp_base_url = "https://example.com"
-            cfg.telegram_bot_token = "bot:abc"
-            kb = build_status_keyboard("@7", user_id=42)
+    def test_dashboard_appended_when_enabled(self, miniapp) -> None:
+        kb = build_status_keyboard("@7", user_id=42)
         # Dashboard sits in its own (last) row.
         last_row = kb.inline_keyboard[-1]
         assert len(last_row) == 1
@@ -171,37 +187,15 @@ class TestDashboardButtonRow:
         assert btn.web_app is not None
         assert btn.web_app.url == "https://example.com/app/abc.def"
 
-    def test_dashboard_url_signed_with_window_and_user(self) -> None:
-        captured: list[tuple[str, int]] = []
-
-        def fake_sign(*, bot_token: str, window_id: str, user_id: int) -> str:
-            captured.append((window_id, user_id))
-            assert bot_token == "bot:abc"
-            return "tok"
-
-        with (
-            patch("ccgram.handlers.status.status_bar_actions.config") as cfg,
-            patch(
-                "ccgram.handlers.status.status_bar_actions.sign_token",
-                side_effect=fake_sign,
-            ),
-        ):
-            cfg.miniapp_base_url = "https://example.com/"
-            cfg.telegram_bot_token = "bot:abc"
-            build_status_keyboard("@9", user_id=99)
-        assert captured == [("@9", 99)]
-
-    def test_history_row_does_not_replace_dashboard(self) -> None:
-        with (
-            patch("ccgram.handlers.status.status_bar_actions.config") as cfg,
-            patch(
-                "ccgram.handlers.status.status_bar_actions.sign_token",
-                return_value="tok",
-            ),
-        ):
-            cfg.miniapp_base_url = "https://example.com"
-            cfg.telegram_bot_token = "bot:abc"
-            kb = build_status_keyboard("@0", history=["a", "b"], user_id=42)
+    def test_dashboard_url_signed_with_window_and_user(
+        self, miniapp, monkeypatch
+    ) -> None:
+        monkeypatch.setattr(config, "miniapp_base_url", "https://example.com/")
+        build_status_keyboard("@9", user_id=99)
+        assert miniapp == [("@9", 99)]
+
+    def test_history_row_does_not_replace_dashboard(self, miniapp) -> None:
+        kb = build_status_keyboard("@0", history=["a", "b"], user_id=42)
         # history row + actions row + dashboard row = 3 rows.
         assert len(kb.inline_keyboard) == 3
         assert kb.inline_keyboard[-1][0].web_app is not None
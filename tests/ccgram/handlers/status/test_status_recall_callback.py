@@ -2,9 +2,13 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
 from ccgram.handlers.callback_data import CB_STATUS_RECALL
 from ccgram.handlers.status.status_bar_actions import _handle_status_bar_action  # noqa: F401
 
+pytestmark = pytest.mark.status_ui
+
 
 def _make_query() -> AsyncMock:
     query = AsyncMock()
@@ -24,6 +24,8 @@ from ccgram.handlers.status.topic_emoji import (
     update_topic_emoji,
 )
 
+pytestmark = pytest.mark.status_ui
+
 _DEBOUNCE_FOR: dict[str, float] = {
     "active": DEBOUNCE_TO_ACTIVE_SECONDS,
     "idle": DEBOUNCE_TO_IDLE_SECONDS,
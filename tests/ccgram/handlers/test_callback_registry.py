@@ -119,7 +119,6 @@ class TestDispatch:
         update.callback_query.answer = AsyncMock()
         return update
 
-    @pytest.mark.asyncio
     async def test_dispatch_calls_handler(self) -> None:
         handler = AsyncMock()
         _registry["test:"] = handler
@@ -138,7 +137,6 @@ class TestDispatch:
 
         handler.assert_awaited_once_with(update, context)
 
-    @pytest.mark.asyncio
     async def test_dispatch_unauthorized_user(self) -> None:
         handler = AsyncMock()
         _registry["test:"] = handler
@@ -154,7 +152,6 @@ class TestDispatch:
         handler.assert_not_awaited()
         update.callback_query.answer.assert_awaited_once_with("Not authorized")
 
-    @pytest.mark.asyncio
     async def test_dispatch_wrong_group(self) -> None:
         handler = AsyncMock()
         _registry["test:"] = handler
@@ -168,7 +165,6 @@ class TestDispatch:
 
         handler.assert_not_awaited()
 
-    @pytest.mark.asyncio
     async def test_dispatch_no_match(self) -> None:
         _registry["known:"] = AsyncMock()
         update = self._make_update("unknown:data")
@@ -186,7 +182,6 @@ class TestDispatch:
 
         _registry["known:"].assert_not_awaited()
 
-    @pytest.mark.asyncio
     async def test_dispatch_noop(self) -> None:
         update = self._make_update("noop")
         context = MagicMock()
@@ -203,7 +198,6 @@ class TestDispatch:
 
         update.callback_query.answer.assert_awaited_once_with()
 
-    @pytest.mark.asyncio
     async def test_dispatch_records_group_chat_id(self) -> None:
         handler = AsyncMock()
         _registry["test:"] = handler
@@ -1,9 +1,16 @@
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from telegram.constants import ChatAction
+
+from _helpers import async_return
 
 from ccgram.handlers.text.text_handler import (
+    PENDING_DELIVERY_NOTICE,
+    _bash_capture_tasks,
+    _capture_bash_output,
     _check_ui_guards,
     _forward_message,
     _handle_dead_window,
@@ -19,10 +26,80 @@ from ccgram.handlers.user_state import (
     PENDING_THREAD_TEXT,
     RECOVERY_WINDOW_ID,
 )
+from ccgram.telegram_client import FakeTelegramClient
 
 _TH = "ccgram.handlers.text.text_handler"
 
 
+@pytest.fixture
+def client() -> FakeTelegramClient:
+    return FakeTelegramClient()
+
+
+class _FakeTask:
+    def __init__(self) -> None:
+        self.cancel = MagicMock()
+        self.done = MagicMock(return_value=False)
+
+
+@pytest.fixture
+def bash_tasks():
+    _bash_capture_tasks.clear()
+    yield _bash_capture_tasks
+    for task in _bash_capture_tasks.values():
+        task.cancel()
+    _bash_capture_tasks.clear()
+
+
+@pytest.fixture
+def text_env(monkeypatch):
+    tr = MagicMock()
+    tr.get_window_for_thread.return_value = None
+    tr.iter_thread_bindings.return_value = []
+    tr.get_display_name.return_value = "project"
+    tm = MagicMock()
+    tm.list_windows = async_return([])
+    tm.discover_external_sessions = async_return([])
+    tm.find_window_by_id = async_return(None)
+    wq = MagicMock()
+    wq.view_window.return_value = MagicMock(cwd="/tmp/project")
+    env = SimpleNamespace(
+        tr=tr,
+        tm=tm,
+        wq=wq,
+        reply=AsyncMock(),
+        picker=MagicMock(return_value=("Pick:", MagicMock(), ["@5"])),
+        browser=MagicMock(return_value=("Browse:", MagicMock(), [])),
+        path=MagicMock(),
+    )
+    env.path.return_value.is_dir.return_value = True
+    monkeypatch.setattr(f"{_TH}.thread_router", tr)
+    monkeypatch.setattr(f"{_TH}.tmux_manager", tm)
+    monkeypatch.setattr(f"{_TH}.window_query", wq)
+    monkeypatch.setattr(f"{_TH}.safe_reply", env.reply)
+    monkeypatch.setattr(f"{_TH}.build_window_picker", env.picker)
+    monkeypatch.setattr(f"{_TH}.build_directory_browser", env.browser)
+    monkeypatch.setattr(f"{_TH}.Path", env.path)
+    return env
+
+
+@pytest.fixture
+def forward_env(text_env, monkeypatch):
+    text_env.send = AsyncMock(return_value=(True, "ok"))
+    text_env.interactive = MagicMock(return_value=None)
+    text_env.handle_ui = AsyncMock()
+    monkeypatch.setattr(f"{_TH}.send_to_window", text_env.send)
+    monkeypatch.setattr(f"{_TH}.get_interactive_window", text_env.interactive)
+    monkeypatch.setattr(f"{_TH}.handle_interactive_ui", text_env.handle_ui)
+    monkeypatch.setattr(f"{_TH}._capture_bash_output", AsyncMock())
+    return text_env
+
+
+def _with_window(env: SimpleNamespace) -> None:
+    w = MagicMock(window_id="@5", window_name="proj", cwd="/tmp")
+    env.tm.list_windows = async_return([w])
+
+
 class TestCheckUiGuards:
     @pytest.mark.parametrize(
         ("state", "expected_text"),
@@ -31,16 +108,14 @@ class TestCheckUiGuards:
             (STATE_BROWSING_DIRECTORY, "directory browser"),
         ],
     )
-    async def test_same_thread_blocks(self, state, expected_text) -> None:
-        message = AsyncMock()
+    async def test_same_thread_blocks(self, text_env, state, expected_text) -> None:
         user_data = {STATE_KEY: state, PENDING_THREAD_ID: 42}
 
-        with patch(f"{_TH}.safe_reply", new_callable=AsyncMock) as mock_reply:
-            result = await _check_ui_guards(user_data, 42, message)
+        result = await _check_ui_guards(user_data, 42, AsyncMock())
 
         assert result is True
-        mock_reply.assert_called_once()
-        assert expected_text in mock_reply.call_args.args[1]
+        text_env.reply.assert_called_once()
+        assert expected_text in text_env.reply.call_args.args[1]
 
     @pytest.mark.parametrize(
         "state", [STATE_SELECTING_WINDOW, STATE_BROWSING_DIRECTORY]
@@ -72,279 +147,116 @@ class TestCheckUiGuards:
 
 
 class TestHandleUnboundTopic:
-    @patch(f"{_TH}.thread_router")
-    @patch(f"{_TH}.tmux_manager")
-    async def test_bound_topic_returns_false(
-        self, _mock_tm: MagicMock, mock_tr: MagicMock
-    ) -> None:
-        mock_tr.get_window_for_thread.return_value = "@0"
-        message = AsyncMock()
+    async def test_bound_topic_returns_false(self, text_env) -> None:
+        text_env.tr.get_window_for_thread.return_value = "@0"
 
-        result = await _handle_unbound_topic(100, 42, "hello", {}, message)
+        result = await _handle_unbound_topic(100, 42, "hello", {}, AsyncMock())
 
         assert result is False
 
-    @patch(f"{_TH}.safe_reply", new_callable=AsyncMock)
-    @patch(f"{_TH}.build_window_picker")
-    @patch(f"{_TH}.tmux_manager")
-    @patch(f"{_TH}.thread_router")
-    async def test_shows_window_picker(
-        self,
-        mock_tr: MagicMock,
-        mock_tm: MagicMock,
-        mock_picker: MagicMock,
-        mock_reply: AsyncMock,
-    ) -> None:
-        mock_tr.get_window_for_thread.return_value = None
-        mock_tr.iter_thread_bindings.return_value = []
-        w = MagicMock(window_id="@5", window_name="proj", cwd="/tmp")
-        mock_tm.list_windows = AsyncMock(return_value=[w])
-        mock_tm.discover_external_sessions = AsyncMock(return_value=[])
-        mock_picker.return_value = ("Pick:", MagicMock(), ["@5"])
-
+    async def test_shows_window_picker(self, text_env) -> None:
+        _with_window(text_env)
         user_data: dict = {}
-        message = MagicMock()
 
-        result = await _handle_unbound_topic(100, 42, "hello", user_data, message)
+        result = await _handle_unbound_topic(100, 42, "hello", user_data, MagicMock())
 
         assert result is True
-        mock_picker.assert_called_once()
-        assert mock_reply.call_count == 2
+        text_env.picker.assert_called_once()
+        assert text_env.reply.call_count == 2
         assert user_data[STATE_KEY] == STATE_SELECTING_WINDOW
         assert user_data[PENDING_THREAD_TEXT] == "hello"
 
-    @patch(f"{_TH}.safe_reply", new_callable=AsyncMock)
-    @patch(f"{_TH}.build_directory_browser")
-    @patch(f"{_TH}.tmux_manager")
-    @patch(f"{_TH}.thread_router")
-    async def test_shows_directory_browser(
-        self,
-        mock_tr: MagicMock,
-        mock_tm: MagicMock,
-        mock_browser: MagicMock,
-        mock_reply: AsyncMock,
-    ) -> None:
-        mock_tr.get_window_for_thread.return_value = None
-        mock_tr.iter_thread_bindings.return_value = []
-        mock_tm.list_windows = AsyncMock(return_value=[])
-        mock_tm.discover_external_sessions = AsyncMock(return_value=[])
-        mock_browser.return_value = ("Browse:", MagicMock(), [])
-
+    async def test_shows_directory_browser(self, text_env) -> None:
         user_data: dict = {}
-        message = AsyncMock()
 
-        result = await _handle_unbound_topic(100, 42, "hello", user_data, message)
+        result = await _handle_unbound_topic(100, 42, "hello", user_data, AsyncMock())
 
         assert result is True
-        mock_browser.assert_called_once()
+        text_env.browser.assert_called_once()
         assert user_data[STATE_KEY] == STATE_BROWSING_DIRECTORY
-        assert mock_reply.call_count == 2
-
-    @patch(f"{_TH}.safe_reply", new_callable=AsyncMock)
-    @patch(f"{_TH}.build_window_picker")
-    @patch(f"{_TH}.tmux_manager")
-    @patch(f"{_TH}.thread_router")
-    async def test_stores_pending_state(
-        self,
-        mock_tr: MagicMock,
-        mock_tm: MagicMock,
-        mock_picker: MagicMock,
-        _mock_reply: AsyncMock,
-    ) -> None:
-        mock_tr.get_window_for_thread.return_value = None
-        mock_tr.iter_thread_bindings.return_value = []
-        w = MagicMock(window_id="@5", window_name="proj", cwd="/tmp")
-        mock_tm.list_windows = AsyncMock(return_value=[w])
-        mock_tm.discover_external_sessions = AsyncMock(return_value=[])
-        mock_picker.return_value = ("Pick:", MagicMock(), ["@5"])
+        assert text_env.reply.call_count == 2
 
+    async def test_stores_pending_state(self, text_env) -> None:
+        _with_window(text_env)
         user_data: dict = {}
-        message = AsyncMock()
 
-        await _handle_unbound_topic(100, 42, "my text", user_data, message)
+        await _handle_unbound_topic(100, 42, "my text", user_data, AsyncMock())
 
         assert user_data[PENDING_THREAD_ID] == 42
         assert user_data[PENDING_THREAD_TEXT] == "my text"
 
-    @patch(f"{_TH}.safe_reply", new_callable=AsyncMock)
-    @patch(f"{_TH}.build_window_picker")
-    @patch(f"{_TH}.tmux_manager")
-    @patch(f"{_TH}.thread_router")
-    async def test_window_picker_sends_pending_disclosure(
-        self,
-        mock_tr: MagicMock,
-        mock_tm: MagicMock,
-        mock_picker: MagicMock,
-        mock_reply: AsyncMock,
-    ) -> None:
-        mock_tr.get_window_for_thread.return_value = None
-        mock_tr.iter_thread_bindings.return_value = []
-        w = MagicMock(window_id="@5", window_name="proj", cwd="/tmp")
-        mock_tm.list_windows = AsyncMock(return_value=[w])
-        mock_tm.discover_external_sessions = AsyncMock(return_value=[])
-        mock_picker.return_value = ("Pick:", MagicMock(), ["@5"])
+    async def test_window_picker_sends_pending_disclosure(self, text_env) -> None:
+        _with_window(text_env)
 
-        user_data: dict = {}
-        message = AsyncMock()
+        await _handle_unbound_topic(100, 42, "hello", {}, AsyncMock())
 
-        await _handle_unbound_topic(100, 42, "hello", user_data, message)
+        assert text_env.reply.call_count == 2
+        assert text_env.reply.call_args_list[1].args[1] == PENDING_DELIVERY_NOTICE
 
-        from ccgram.handlers.text.text_handler import PENDING_DELIVERY_NOTICE
+    async def test_directory_browser_sends_pending_disclosure(self, text_env) -> None:
+        await _handle_unbound_topic(100, 42, "hello", {}, AsyncMock())
 
-        assert mock_reply.call_count == 2
-        assert mock_reply.call_args_list[1].args[1] == PENDING_DELIVERY_NOTICE
-
-    @patch(f"{_TH}.safe_reply", new_callable=AsyncMock)
-    @patch(f"{_TH}.build_directory_browser")
-    @patch(f"{_TH}.tmux_manager")
-    @patch(f"{_TH}.thread_router")
-    async def test_directory_browser_sends_pending_disclosure(
-        self,
-        mock_tr: MagicMock,
-        mock_tm: MagicMock,
-        mock_browser: MagicMock,
-        mock_reply: AsyncMock,
-    ) -> None:
-        mock_tr.get_window_for_thread.return_value = None
-        mock_tr.iter_thread_bindings.return_value = []
-        mock_tm.list_windows = AsyncMock(return_value=[])
-        mock_tm.discover_external_sessions = AsyncMock(return_value=[])
-        mock_browser.return_value = ("Browse:", MagicMock(), [])
-
-        user_data: dict = {}
-        message = AsyncMock()
-
-        await _handle_unbound_topic(100, 42, "hello", user_data, message)
-
-        from ccgram.handlers.text.text_handler import PENDING_DELIVERY_NOTICE
-
-        assert mock_reply.call_count == 2
-        assert mock_reply.call_args_list[1].args[1] == PENDING_DELIVERY_NOTICE
+        assert text_env.reply.call_count == 2
+        assert text_env.reply.call_args_list[1].args[1] == PENDING_DELIVERY_NOTICE
 
 
 class TestHandleDeadWindow:
-    @patch(f"{_TH}.tmux_manager")
-    async def test_alive_window_returns_false(self, mock_tm: MagicMock) -> None:
-        mock_tm.find_window_by_id = AsyncMock(return_value=MagicMock())
-        message = AsyncMock()
+    async def test_alive_window_returns_false(self, text_env) -> None:
+        text_env.tm.find_window_by_id = async_return(MagicMock())
 
-        result = await _handle_dead_window("@0", 100, 42, "hello", {}, message)
+        result = await _handle_dead_window("@0", 100, 42, "hello", {}, AsyncMock())
 
         assert result is False
 
-    @patch(f"{_TH}.safe_reply", new_callable=AsyncMock)
-    @patch(f"{_TH}.render_banner")
-    @patch(f"{_TH}.tmux_manager")
-    @patch(f"{_TH}.window_query")
-    @patch(f"{_TH}.thread_router")
-    async def test_shows_recovery_ui(
-        self,
-        mock_tr: MagicMock,
-        mock_sm: MagicMock,
-        mock_tm: MagicMock,
-        mock_render: MagicMock,
-        mock_reply: AsyncMock,
-    ) -> None:
-        mock_tm.find_window_by_id = AsyncMock(return_value=None)
-        mock_tr.get_display_name.return_value = "project"
-        ws = MagicMock()
-        ws.cwd = "/tmp/project"
-        mock_sm.view_window.return_value = ws
-        mock_render.return_value = (
-            "⚠ Session `project` ended.\n📂 `/tmp/project`",
-            MagicMock(),
+    async def test_shows_recovery_ui(self, text_env, monkeypatch) -> None:
+        render = MagicMock(
+            return_value=(
+                "⚠ Session `project` ended.\n📂 `/tmp/project`",
+                MagicMock(),
+            )
         )
-
+        monkeypatch.setattr(f"{_TH}.render_banner", render)
         user_data: dict = {}
-        message = AsyncMock()
 
-        with patch(f"{_TH}.Path") as mock_path:
-            mock_path.return_value.is_dir.return_value = True
-            result = await _handle_dead_window(
-                "@0", 100, 42, "hello", user_data, message
-            )
+        result = await _handle_dead_window(
+            "@0", 100, 42, "hello", user_data, AsyncMock()
+        )
 
         assert result is True
-        mock_reply.assert_called_once()
-        banner = mock_render.call_args.args[0]
+        text_env.reply.assert_called_once()
+        banner = render.call_args.args[0]
         assert banner.window_id == "@0"
         assert banner.mode == "dead"
         assert banner.cwd == "/tmp/project"
         assert banner.display == "project"
         assert user_data[RECOVERY_WINDOW_ID] == "@0"
 
-    @patch(f"{_TH}.safe_reply", new_callable=AsyncMock)
-    @patch(f"{_TH}.tmux_manager")
-    @patch(f"{_TH}.window_query")
-    @patch(f"{_TH}.thread_router")
-    async def test_recovery_banner_includes_help_text(
-        self,
-        mock_tr: MagicMock,
-        mock_sm: MagicMock,
-        mock_tm: MagicMock,
-        mock_reply: AsyncMock,
-    ) -> None:
-        mock_tm.find_window_by_id = AsyncMock(return_value=None)
-        mock_tr.get_display_name.return_value = "project"
-        ws = MagicMock()
-        ws.cwd = "/tmp/project"
-        mock_sm.view_window.return_value = ws
-
-        user_data: dict = {}
-        message = AsyncMock()
-
+    async def test_recovery_banner_includes_help_text(self, text_env) -> None:
         with patch(
             "ccgram.handlers.recovery.recovery_banner.get_provider_for_window"
         ) as mock_gpw:
             caps = mock_gpw.return_value.capabilities
             caps.supports_continue = True
             caps.supports_resume = True
-            with patch(f"{_TH}.Path") as mock_path:
-                mock_path.return_value.is_dir.return_value = True
-                await _handle_dead_window("@0", 100, 42, "hello", user_data, message)
+            await _handle_dead_window("@0", 100, 42, "hello", {}, AsyncMock())
 
-        body = mock_reply.call_args.args[1]
+        body = text_env.reply.call_args.args[1]
         assert "Start fresh" in body
         assert "Continue last session" in body
         assert "Resume from list" in body
 
     @pytest.mark.parametrize("cwd", ["", "/nonexistent"])
-    @patch(f"{_TH}.safe_reply", new_callable=AsyncMock)
-    @patch(f"{_TH}.build_directory_browser")
-    @patch(f"{_TH}.tmux_manager")
-    @patch(f"{_TH}.window_query")
-    @patch(f"{_TH}.thread_router")
-    async def test_falls_back_to_browser(
-        self,
-        mock_tr: MagicMock,
-        mock_sm: MagicMock,
-        mock_tm: MagicMock,
-        mock_browser: MagicMock,
-        _mock_reply: AsyncMock,
-        cwd: str,
-    ) -> None:
-        mock_tm.find_window_by_id = AsyncMock(return_value=None)
-        mock_tr.get_display_name.return_value = "project"
-        ws = MagicMock()
-        ws.cwd = cwd
-        mock_sm.view_window.return_value = ws
-        mock_browser.return_value = ("Browse:", MagicMock(), [])
+    async def test_falls_back_to_browser(self, text_env, cwd: str) -> None:
+        text_env.wq.view_window.return_value = MagicMock(cwd=cwd)
+        text_env.path.return_value.is_dir.return_value = False
+        text_env.path.cwd.return_value = text_env.path.return_value
+        text_env.path.cwd.return_value.__str__ = MagicMock(return_value="/cwd")
 
-        user_data: dict = {}
-        message = AsyncMock()
-
-        with patch(f"{_TH}.Path") as mock_path:
-            mock_path.return_value.is_dir.return_value = False
-            mock_path.cwd.return_value = mock_path.return_value
-            str_mock = MagicMock(return_value="/cwd")
-            mock_path.cwd.return_value.__str__ = str_mock
-            result = await _handle_dead_window(
-                "@0", 100, 42, "hello", user_data, message
-            )
+        result = await _handle_dead_window("@0", 100, 42, "hello", {}, AsyncMock())
 
         assert result is True
-        mock_tr.unbind_thread.assert_called_once_with(100, 42)
-        mock_browser.assert_called_once()
+        text_env.tr.unbind_thread.assert_called_once_with(100, 42)
+        text_env.browser.assert_called_once()
 
 
 class TestShellProviderRouting:
@@ -438,134 +350,71 @@ class TestShellProviderRouting:
 
 
 class TestForwardMessage:
-    @patch(f"{_TH}.send_to_window", new_callable=AsyncMock, return_value=(True, "ok"))
-    @patch(f"{_TH}.window_query")
     async def test_sends_to_window(
-        self, mock_sm: MagicMock, mock_send: AsyncMock
+        self, forward_env, client: FakeTelegramClient
     ) -> None:
-        bot = AsyncMock()
-        message = AsyncMock()
+        await _forward_message("@0", 100, 42, "hello", client, AsyncMock())
 
-        with patch(f"{_TH}.get_interactive_window", return_value=None):
-            await _forward_message("@0", 100, 42, "hello", bot, message)
+        forward_env.send.assert_called_once_with("@0", "hello")
 
-        mock_send.assert_called_once_with("@0", "hello")
-
-    @patch(f"{_TH}.safe_reply", new_callable=AsyncMock)
-    @patch(
-        f"{_TH}.send_to_window",
-        new_callable=AsyncMock,
-        return_value=(False, "Window not found"),
-    )
-    @patch(f"{_TH}.window_query")
     async def test_send_failure_replies_error(
-        self, mock_sm: MagicMock, _mock_send: AsyncMock, mock_reply: AsyncMock
+        self, forward_env, client: FakeTelegramClient
     ) -> None:
-        bot = AsyncMock()
-        message = AsyncMock()
+        forward_env.send.return_value = (False, "Window not found")
 
-        await _forward_message("@0", 100, 42, "hello", bot, message)
+        await _forward_message("@0", 100, 42, "hello", client, AsyncMock())
 
-        mock_reply.assert_called_once()
-        assert "Window not found" in mock_reply.call_args.args[1]
+        forward_env.reply.assert_called_once()
+        assert "Window not found" in forward_env.reply.call_args.args[1]
 
-    @patch(f"{_TH}.get_interactive_window", return_value=None)
-    @patch(f"{_TH}._capture_bash_output")
-    @patch(f"{_TH}.send_to_window", new_callable=AsyncMock, return_value=(True, "ok"))
-    @patch(f"{_TH}.window_query")
     async def test_bash_capture_for_bang_command(
-        self,
-        mock_sm: MagicMock,
-        _mock_send: AsyncMock,
-        mock_capture: MagicMock,
-        _mock_interactive: MagicMock,
+        self, forward_env, client: FakeTelegramClient, bash_tasks: dict
     ) -> None:
-        bot = AsyncMock()
-        message = AsyncMock()
-
-        await _forward_message("@0", 100, 42, "!ls -la", bot, message)
-
-        from ccgram.handlers.text.text_handler import _bash_capture_tasks
+        await _forward_message("@0", 100, 42, "!ls -la", client, AsyncMock())
 
         key = (100, 42)
-        assert key in _bash_capture_tasks
-        task = _bash_capture_tasks.pop(key)
+        assert key in bash_tasks
+        task = bash_tasks.pop(key)
         task.cancel()
         with pytest.raises(asyncio.CancelledError):
             await task
 
-    @patch(f"{_TH}.get_interactive_window", return_value=None)
-    @patch(f"{_TH}.send_to_window", new_callable=AsyncMock, return_value=(True, "ok"))
-    @patch(f"{_TH}.window_query")
     async def test_cancels_existing_bash_capture(
-        self, mock_sm: MagicMock, _mock_send: AsyncMock, _mock_interactive: MagicMock
+        self, forward_env, client: FakeTelegramClient, bash_tasks: dict
     ) -> None:
-        bot = AsyncMock()
-        message = AsyncMock()
-
-        from ccgram.handlers.text.text_handler import _bash_capture_tasks
-
-        dummy_task = AsyncMock(spec=asyncio.Task)
-        dummy_task.done.return_value = False
-        _bash_capture_tasks[(100, 42)] = dummy_task
+        dummy_task = _FakeTask()
+        bash_tasks[(100, 42)] = dummy_task
 
-        await _forward_message("@0", 100, 42, "hello", bot, message)
+        await _forward_message("@0", 100, 42, "hello", client, AsyncMock())
 
         dummy_task.cancel.assert_called_once()
-        assert (100, 42) not in _bash_capture_tasks
+        assert (100, 42) not in bash_tasks
 
-    @patch(f"{_TH}.handle_interactive_ui", new_callable=AsyncMock)
-    @patch(f"{_TH}.get_interactive_window", return_value="@0")
-    @patch(f"{_TH}.send_to_window", new_callable=AsyncMock, return_value=(True, "ok"))
-    @patch(f"{_TH}.window_query")
     async def test_refreshes_interactive_ui(
-        self,
-        mock_sm: MagicMock,
-        _mock_send: AsyncMock,
-        _mock_get_iw: MagicMock,
-        mock_handle_ui: AsyncMock,
+        self, forward_env, client: FakeTelegramClient, monkeypatch
     ) -> None:
-        bot = AsyncMock()
-        message = AsyncMock()
+        forward_env.interactive.return_value = "@0"
+        monkeypatch.setattr(f"{_TH}.asyncio.sleep", AsyncMock())
 
-        await _forward_message("@0", 100, 42, "hello", bot, message)
+        await _forward_message("@0", 100, 42, "hello", client, AsyncMock())
 
-        mock_handle_ui.assert_called_once()
-        assert mock_handle_ui.call_args.args[0] is bot
-        assert mock_handle_ui.call_args.args[1:] == (100, "@0", 42)
+        forward_env.handle_ui.assert_called_once()
+        assert forward_env.handle_ui.call_args.args[0] is client
+        assert forward_env.handle_ui.call_args.args[1:] == (100, "@0", 42)
 
-    @patch(f"{_TH}.send_to_window", new_callable=AsyncMock, return_value=(True, "ok"))
-    @patch(f"{_TH}.window_query")
     async def test_sends_typing_chat_action(
-        self, _mock_sm: MagicMock, _mock_send: AsyncMock
+        self, forward_env, client: FakeTelegramClient
     ) -> None:
-        from telegram.constants import ChatAction
-
-        bot = AsyncMock()
         message = AsyncMock()
         message.chat.send_action = AsyncMock()
 
-        with patch(f"{_TH}.get_interactive_window", return_value=None):
-            await _forward_message("@0", 100, 42, "hello", bot, message)
+        await _forward_message("@0", 100, 42, "hello", client, message)
 
         message.chat.send_action.assert_awaited_once_with(ChatAction.TYPING)
 
 
 class TestBashCaptureCleanup:
-    @pytest.fixture(autouse=True)
-    def _clear_bash_tasks(self):
-        from ccgram.handlers.text.text_handler import _bash_capture_tasks
-
-        _bash_capture_tasks.clear()
-        yield
-        _bash_capture_tasks.clear()
-
-    async def test_cleanup_on_early_return(self, monkeypatch) -> None:
-        from ccgram.handlers.text.text_handler import (
-            _bash_capture_tasks,
-            _capture_bash_output,
-        )
-
+    async def test_cleanup_on_early_return(self, monkeypatch, bash_tasks) -> None:
         key = (999, 888)
 
         monkeypatch.setattr(f"{_TH}.asyncio.sleep", AsyncMock())
@@ -577,19 +426,14 @@ class TestBashCaptureCleanup:
             mock_tm.capture_pane = AsyncMock(return_value=None)
 
             task = asyncio.create_task(
-                _capture_bash_output(AsyncMock(), 999, 888, "@0", "ls")
+                _capture_bash_output(FakeTelegramClient(), 999, 888, "@0", "ls")
             )
-            _bash_capture_tasks[key] = task
+            bash_tasks[key] = task
             await task
 
-        assert key not in _bash_capture_tasks
-
-    async def test_cleanup_on_cancel(self) -> None:
-        from ccgram.handlers.text.text_handler import (
-            _bash_capture_tasks,
-            _capture_bash_output,
-        )
+        assert key not in bash_tasks
 
+    async def test_cleanup_on_cancel(self, bash_tasks) -> None:
         key = (777, 666)
 
         with (
@@ -600,23 +444,18 @@ class TestBashCaptureCleanup:
             mock_tm.capture_pane = AsyncMock(return_value=None)
 
             task = asyncio.create_task(
-                _capture_bash_output(AsyncMock(), 777, 666, "@0", "ls")
+                _capture_bash_output(FakeTelegramClient(), 777, 666, "@0", "ls")
             )
-            _bash_capture_tasks[key] = task
+            bash_tasks[key] = task
             await asyncio.sleep(0)
             task.cancel()
             await task
 
-        assert key not in _bash_capture_tasks
-
-    async def test_identity_check_preserves_replacement_task(self) -> None:
-        from ccgram.handlers.text.text_handler import (
-            _bash_capture_tasks,
-            _capture_bash_output,
-        )
+        assert key not in bash_tasks
 
+    async def test_identity_check_preserves_replacement_task(self, bash_tasks) -> None:
         key = (555, 444)
-        sentinel = AsyncMock(spec=asyncio.Task)
+        sentinel = _FakeTask()
 
         with (
             patch(f"{_TH}.tmux_manager") as mock_tm,
@@ -626,14 +465,14 @@ class TestBashCaptureCleanup:
             mock_tm.capture_pane = AsyncMock(return_value=None)
 
             task_a = asyncio.create_task(
-                _capture_bash_output(AsyncMock(), 555, 444, "@0", "ls")
+                _capture_bash_output(FakeTelegramClient(), 555, 444, "@0", "ls")
             )
-            _bash_capture_tasks[key] = task_a
+            bash_tasks[key] = task_a
             await asyncio.sleep(0)
 
             task_a.cancel()
-            _bash_capture_tasks[key] = sentinel  # Task B
+            bash_tasks[key] = sentinel  # Task B
 
             await task_a  # A's finally runs
 
-        assert _bash_capture_tasks.get(key) is sentinel
+        assert bash_tasks.get(key) is sentinel
@@ -78,7 +78,6 @@ def test_register_pending_creation_ignores_blank_window_id():
     assert not _is_pending_user_creation("")
 
 
-@pytest.mark.asyncio
 async def test_handle_new_window_skips_when_pending(monkeypatch):
     register_pending_creation("@42")
 
@@ -99,7 +98,6 @@ async def test_handle_new_window_skips_when_pending(monkeypatch):
     rebind_mock.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_handle_new_window_proceeds_when_not_pending(monkeypatch):
     create_topic_mock = AsyncMock()
     rebind_mock = AsyncMock(return_value=False)
@@ -120,7 +118,6 @@ async def test_handle_new_window_proceeds_when_not_pending(monkeypatch):
     create_topic_mock.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_handle_new_window_skips_when_already_bound_takes_priority(monkeypatch):
     """already-bound check runs first; pending-creation check is a fallback."""
     register_pending_creation("@42")  # also pending
@@ -135,7 +135,7 @@ class TestShutdownRuntime:
 
         bootstrap._status_poll_task = asyncio.create_task(_noop())  # type: ignore[assignment]
         monitor = MagicMock()
-        monitor.stop = MagicMock()
+        monitor.stop = AsyncMock()
         bootstrap.session_monitor = monitor
 
         with (
@@ -151,7 +151,7 @@ class TestShutdownRuntime:
             mailbox_cls.return_value.sweep = MagicMock()
             await bootstrap.shutdown_runtime()
 
-        monitor.stop.assert_called_once()
+        monitor.stop.assert_awaited_once()
         workers.assert_awaited_once()
         stop_mini.assert_awaited_once()
         sm.flush_state.assert_called_once()
@@ -199,7 +199,7 @@ class TestResetForTesting:
         from ccgram import session_monitor as sm_mod
 
         monitor = MagicMock()
-        monitor.stop = MagicMock()
+        monitor.stop = AsyncMock()
         sm_mod.set_active_monitor(monitor)
         bootstrap.session_monitor = monitor
 
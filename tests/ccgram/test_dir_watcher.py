@@ -0,0 +1,90 @@
+"""Tests for DirWatcher — inotify wakeups for the monitor poll loop."""
+
+import asyncio
+import sys
+import time
+
+import pytest
+
+from ccgram.dir_watcher import DirWatcher
+
+linux_only = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+)
+
+
+async def test_inactive_watcher_sleeps_full_timeout() -> None:
+    watcher = DirWatcher()
+    start = time.monotonic()
+    await watcher.wait(0.05)
+    assert time.monotonic() - start >= 0.05
+    assert not watcher.active
+
+
+@linux_only
+async def test_write_wakes_before_timeout(tmp_path) -> None:
+    watcher = DirWatcher()
+    assert watcher.start()
+    try:
+        watcher.watch([str(tmp_path / "t.jsonl")])
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, (tmp_path / "t.jsonl").write_text, "{}\n")
+        start = time.monotonic()
+        assert await watcher.wait(5.0)
+        assert time.monotonic() - start < 2.0
+    finally:
+        watcher.close()
+    assert not watcher.active
+
+
+@linux_only
+async def test_unwatched_directory_does_not_wake(tmp_path) -> None:
+    watched = tmp_path / "watched"
+    other = tmp_path / "other"
+    watched.mkdir()
+    other.mkdir()
+    watcher = DirWatcher()
+    assert watcher.start()
+    try:
+        watcher.watch([str(watched / "t.jsonl"), str(tmp_path / "missing" / "t")])
+        watcher.watch([str(watched / "t.jsonl")])
+        (other / "t.jsonl").write_text("{}\n")
+        start = time.monotonic()
+        assert not await watcher.wait(0.3)
+        assert time.monotonic() - start >= 0.3
+    finally:
+        watcher.close()
+
+
+@linux_only
+async def test_unwatched_file_in_watched_directory_does_not_wake(tmp_path) -> None:
+    watcher = DirWatcher()
+    assert watcher.start()
+    try:
+        watcher.watch([str(tmp_path / "t.jsonl")])
+        (tmp_path / "monitor_state.json").write_text("{}")
+        assert not await watcher.wait(0.3)
+    finally:
+        watcher.close()
+
+
+@linux_only
+async def test_deleted_directory_is_rewatched_when_recreated(tmp_path) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    target = str(project / "t.jsonl")
+    watcher = DirWatcher()
+    assert watcher.start()
+    try:
+        watcher.watch([target])
+        project.rmdir()
+        assert not await watcher.wait(0.2)
+        assert watcher._watches == {}
+
+        project.mkdir()
+        watcher.watch([target])
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, (project / "t.jsonl").write_text, "{}\n")
+        assert await watcher.wait(5.0)
+    finally:
+        watcher.close()
@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from ccgram.event_reader import read_new_events
+from ccgram.event_reader import EventLogReader
 from ccgram.providers.base import HookEvent
 
 
@@ -25,18 +25,25 @@ def _write_event(path: Path, event_type: str, window_key: str, session_id: str)
         )
 
 
-async def test_returns_empty_when_file_missing(tmp_path: Path) -> None:
-    events, offset = await read_new_events(tmp_path / "missing.jsonl", 0)
+@pytest.fixture
+def reader():
+    log_reader = EventLogReader()
+    yield log_reader
+    log_reader.close()
+
+
+async def test_returns_empty_when_file_missing(tmp_path: Path, reader) -> None:
+    events, offset = await reader.read_new_events(tmp_path / "missing.jsonl", 0)
     assert events == []
     assert offset == 0
 
 
-async def test_reads_new_events_from_zero(tmp_path: Path) -> None:
+async def test_reads_new_events_from_zero(tmp_path: Path, reader) -> None:
     path = tmp_path / "events.jsonl"
     _write_event(path, "Stop", "ccgram:@0", "sess-1")
     _write_event(path, "SessionStart", "ccgram:@1", "sess-2")
 
-    events, offset = await read_new_events(path, 0)
+    events, offset = await reader.read_new_events(path, 0)
     assert len(events) == 2
     assert events[0].event_type == "Stop"
     assert events[0].window_key == "ccgram:@0"
@@ -44,54 +51,54 @@ async def test_reads_new_events_from_zero(tmp_path: Path) -> None:
     assert offset == path.stat().st_size
 
 
-async def test_reads_only_new_events_after_offset(tmp_path: Path) -> None:
+async def test_reads_only_new_events_after_offset(tmp_path: Path, reader) -> None:
     path = tmp_path / "events.jsonl"
     _write_event(path, "Stop", "ccgram:@0", "sess-1")
-    _, offset_after_first = await read_new_events(path, 0)
+    _, offset_after_first = await reader.read_new_events(path, 0)
 
     _write_event(path, "SessionStart", "ccgram:@1", "sess-2")
-    events, offset = await read_new_events(path, offset_after_first)
+    events, offset = await reader.read_new_events(path, offset_after_first)
     assert len(events) == 1
     assert events[0].event_type == "SessionStart"
     assert offset > offset_after_first
 
 
-async def test_skips_empty_lines(tmp_path: Path) -> None:
+async def test_skips_empty_lines(tmp_path: Path, reader) -> None:
     path = tmp_path / "events.jsonl"
     path.write_text("\n\n")
     _write_event(path, "Stop", "ccgram:@0", "sess-1")
     path.open("a").write("\n")
 
-    events, offset = await read_new_events(path, 0)
+    events, offset = await reader.read_new_events(path, 0)
     assert len(events) == 1
     assert events[0].event_type == "Stop"
 
 
-async def test_skips_malformed_lines(tmp_path: Path) -> None:
+async def test_skips_malformed_lines(tmp_path: Path, reader) -> None:
     path = tmp_path / "events.jsonl"
     path.write_text("not-json\n")
     _write_event(path, "Stop", "ccgram:@0", "sess-1")
 
-    events, offset = await read_new_events(path, 0)
+    events, offset = await reader.read_new_events(path, 0)
     assert len(events) == 1
     assert events[0].event_type == "Stop"
 
 
-async def test_resets_offset_on_truncation(tmp_path: Path) -> None:
+async def test_resets_offset_on_truncation(tmp_path: Path, reader) -> None:
     path = tmp_path / "events.jsonl"
     _write_event(path, "Stop", "ccgram:@0", "sess-1")
     file_size = path.stat().st_size
 
     stale_offset = file_size + 9999
-    events, offset = await read_new_events(path, stale_offset)
+    events, offset = await reader.read_new_events(path, stale_offset)
     assert offset <= file_size
 
 
-async def test_returns_hook_event_dataclass(tmp_path: Path) -> None:
+async def test_returns_hook_event_dataclass(tmp_path: Path, reader) -> None:
     path = tmp_path / "events.jsonl"
     _write_event(path, "Notification", "ccgram:@5", "abc-123")
 
-    events, _ = await read_new_events(path, 0)
+    events, _ = await reader.read_new_events(path, 0)
     assert len(events) == 1
     ev = events[0]
     assert isinstance(ev, HookEvent)
@@ -99,3 +106,76 @@ async def test_returns_hook_event_dataclass(tmp_path: Path) -> None:
     assert ev.window_key == "ccgram:@5"
     assert ev.session_id == "abc-123"
     assert ev.timestamp == pytest.approx(1234567890.0)
+
+
+async def test_partial_trailing_line_left_for_next_read(tmp_path: Path, reader) -> None:
+    path = tmp_path / "events.jsonl"
+    _write_event(path, "Stop", "ccgram:@0", "sess-1")
+    complete_size = path.stat().st_size
+    with path.open("a") as f:
+        f.write('{"event": "Notifi')
+
+    events, offset = await reader.read_new_events(path, 0)
+    assert [e.event_type for e in events] == ["Stop"]
+    assert offset == complete_size
+
+    with path.open("a") as f:
+        f.write('cation", "window_key": "ccgram:@0", "session_id": "s"}\n')
+    events, offset = await reader.read_new_events(path, offset)
+    assert [e.event_type for e in events] == ["Notification"]
+    assert offset == path.stat().st_size
+
+
+async def test_log_reader_reuses_fd_across_reads(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    _write_event(path, "Stop", "ccgram:@0", "sess-1")
+    reader = EventLogReader()
+    try:
+        events, offset = await reader.read_new_events(path, 0)
+        assert [e.event_type for e in events] == ["Stop"]
+        fd = reader._fd
+
+        events, offset = await reader.read_new_events(path, offset)
+        assert events == []
+
+        _write_event(path, "SessionStart", "ccgram:@1", "sess-2")
+        events, offset = await reader.read_new_events(path, offset)
+        assert [e.event_type for e in events] == ["SessionStart"]
+        assert reader._fd == fd
+        assert offset == path.stat().st_size
+    finally:
+        reader.close()
+    assert reader._fd == -1
+
+
+async def test_log_reader_reopens_replaced_file(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    _write_event(path, "Stop", "ccgram:@0", "sess-1")
+    reader = EventLogReader()
+    try:
+        _, offset = await reader.read_new_events(path, 0)
+
+        replacement = tmp_path / "events.new"
+        _write_event(replacement, "Notification", "ccgram:@0", "sess-1")
+        _write_event(replacement, "SessionStart", "ccgram:@1", "sess-2")
+        replacement.replace(path)
+
+        events, offset = await reader.read_new_events(path, offset)
+        assert [e.event_type for e in events] == ["Notification", "SessionStart"]
+        assert offset == path.stat().st_size
+    finally:
+        reader.close()
+
+
+async def test_log_reader_handles_missing_and_truncated(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    reader = EventLogReader()
+    try:
+        assert await reader.read_new_events(path, 7) == ([], 7)
+
+        _write_event(path, "Stop", "ccgram:@0", "sess-1")
+        events, offset = await reader.read_new_events(path, 99999)
+        assert [e.event_type for e in events] == ["Stop"]
+        assert offset == path.stat().st_size
+    finally:
+        reader.close()
@@ -24,7 +24,6 @@ class TestDiscoverExternalSessions:
         tm._external_cache_expires = 0.0
         return tm
 
-    @pytest.mark.asyncio
     async def test_returns_windows_with_ai_processes(self, manager):
         sessions_proc = _make_proc("my-project\nccgram\n")
         windows_proc = _make_proc(
@@ -43,7 +42,6 @@ class TestDiscoverExternalSessions:
         assert result[0].window_id == "my-project:@0"
         assert result[0].pane_current_command == "claude"
 
-    @pytest.mark.asyncio
     async def test_skips_own_session(self, manager):
         sessions_proc = _make_proc("ccgram\n")
 
@@ -58,7 +56,6 @@ class TestDiscoverExternalSessions:
         assert result == []
         assert mock_exec.call_count == 1
 
-    @pytest.mark.asyncio
     async def test_pattern_filtering(self, manager):
         sessions_proc = _make_proc("omc-abc\nrandom-session\n")
         omc_windows = _make_proc("@0\tagent\t/tmp\tclaude\n")
@@ -74,7 +71,6 @@ class TestDiscoverExternalSessions:
         assert len(result) == 1
         assert result[0].window_id == "omc-abc:@0"
 
-    @pytest.mark.asyncio
     async def test_multiple_patterns(self, manager):
         sessions_proc = _make_proc("omc-abc\nomx-xyz\nother\n")
         omc_windows = _make_proc("@0\tagent\t/tmp\tclaude\n")
@@ -92,7 +88,6 @@ class TestDiscoverExternalSessions:
         ids = {w.window_id for w in result}
         assert ids == {"omc-abc:@0", "omx-xyz:@0"}
 
-    @pytest.mark.asyncio
     async def test_no_patterns_scans_all_sessions(self, manager):
         sessions_proc = _make_proc("sess-a\nsess-b\n")
         win_a = _make_proc("@0\twin\t/tmp\tclaude\n")
@@ -108,7 +103,6 @@ class TestDiscoverExternalSessions:
 
         assert len(result) == 2
 
-    @pytest.mark.asyncio
     async def test_emdash_sessions_included(self, manager):
         sessions_proc = _make_proc("emdash-claude-main-abc123\n")
         windows_proc = _make_proc("@0\temdash\t/home/user\tclaude\n")
@@ -124,7 +118,6 @@ class TestDiscoverExternalSessions:
         assert len(result) == 1
         assert result[0].window_id == "emdash-claude-main-abc123:@0"
 
-    @pytest.mark.asyncio
     async def test_cache_returns_cached_results(self, manager):
         manager._external_cache = [
             TmuxWindow(
@@ -143,7 +136,6 @@ class TestDiscoverExternalSessions:
         assert result[0].window_id == "cached:@0"
         mock_exec.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_cache_is_a_copy(self, manager):
         original = TmuxWindow(
             window_id="x:@0", window_name="x", cwd="/tmp", pane_current_command="claude"
@@ -162,7 +154,6 @@ class TestDiscoverExternalSessions:
         )
         assert len(manager._external_cache) == 1
 
-    @pytest.mark.asyncio
     async def test_list_sessions_timeout_returns_empty(self, manager):
         with (
             patch(
@@ -176,7 +167,6 @@ class TestDiscoverExternalSessions:
 
         assert result == []
 
-    @pytest.mark.asyncio
     async def test_list_sessions_oserror_returns_empty(self, manager):
         with (
             patch(
@@ -190,7 +180,6 @@ class TestDiscoverExternalSessions:
 
         assert result == []
 
-    @pytest.mark.asyncio
     async def test_list_sessions_nonzero_exit_returns_empty(self, manager):
         sessions_proc = _make_proc("", returncode=1)
 
@@ -206,7 +195,6 @@ class TestDiscoverExternalSessions:
 
         assert result == []
 
-    @pytest.mark.asyncio
     async def test_deprecated_alias_delegates(self, manager):
         manager.discover_external_sessions = AsyncMock(return_value=[])
         result = await manager.discover_emdash_sessions()
@@ -221,7 +209,6 @@ class TestScanSessionWindows:
         tm.session_name = "ccgram"
         return tm
 
-    @pytest.mark.asyncio
     async def test_filters_non_ai_windows(self, manager):
         proc = _make_proc(
             "@0\tproject\t/home/user\tclaude\n"
@@ -237,7 +224,6 @@ class TestScanSessionWindows:
         assert len(result) == 1
         assert result[0].window_id == "my-session:@0"
 
-    @pytest.mark.asyncio
     async def test_multiple_ai_windows(self, manager):
         proc = _make_proc(
             "@0\tproject-a\t/home/a\tclaude\n"
@@ -253,7 +239,6 @@ class TestScanSessionWindows:
         assert len(result) == 3
         assert {w.pane_current_command for w in result} == {"claude", "codex", "gemini"}
 
-    @pytest.mark.asyncio
     async def test_timeout_returns_empty(self, manager):
         with patch(
             "ccgram.tmux_manager.asyncio.create_subprocess_exec",
@@ -262,7 +247,6 @@ class TestScanSessionWindows:
             result = await manager._scan_session_windows("my-session")
         assert result == []
 
-    @pytest.mark.asyncio
     async def test_oserror_returns_empty(self, manager):
         with patch(
             "ccgram.tmux_manager.asyncio.create_subprocess_exec",
@@ -271,7 +255,6 @@ class TestScanSessionWindows:
             result = await manager._scan_session_windows("my-session")
         assert result == []
 
-    @pytest.mark.asyncio
     async def test_nonzero_exit_returns_empty(self, manager):
         proc = _make_proc("", returncode=1)
         with patch(
@@ -280,7 +263,6 @@ class TestScanSessionWindows:
             result = await manager._scan_session_windows("my-session")
         assert result == []
 
-    @pytest.mark.asyncio
     async def test_malformed_lines_skipped(self, manager):
         proc = _make_proc(
             "@0\tproject\t/home\tclaude\n\nincomplete\tdata\n@1\tok\t/tmp\tgemini\n"
@@ -295,7 +277,6 @@ class TestScanSessionWindows:
         assert result[0].window_id == "ext:@0"
         assert result[1].window_id == "ext:@1"
 
-    @pytest.mark.asyncio
     async def test_emdash_fallback_name(self, manager):
         proc = _make_proc("@0\t\t/home\tclaude\n")
 
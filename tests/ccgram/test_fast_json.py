@@ -0,0 +1,29 @@
+"""Tests for fast_json — orjson-or-stdlib JSON decoding."""
+
+import json
+
+import pytest
+
+from ccgram import fast_json
+
+
+@pytest.mark.parametrize("payload", ['{"a": [1, "é"]}', b'{"a": [1, "\xc3\xa9"]}'])
+def test_loads_accepts_str_and_bytes(payload) -> None:
+    assert fast_json.loads(payload) == {"a": [1, "é"]}
+
+
+def test_decode_error_is_stdlib_subclass() -> None:
+    with pytest.raises(json.JSONDecodeError):
+        fast_json.loads(b'{"event": "Notifi')
+
+
+@pytest.mark.parametrize(
+    ("payload", "check"),
+    [
+        (rb'{"text": "\ud83d"}', lambda data: data["text"] == "\ud83d"),
+        (b'{"value": NaN}', lambda data: data["value"] != data["value"]),
+    ],
+    ids=["lone-surrogate", "nan"],
+)
+def test_loads_accepts_what_stdlib_accepts(payload, check) -> None:
+    assert check(fast_json.loads(payload))
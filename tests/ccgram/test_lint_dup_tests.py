@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+
+_SCRIPT_PATH = Path(__file__).resolve().parents[2] / "scripts" / "lint_dup_tests.py"
+
+
+def _load_module():
+    spec = importlib.util.spec_from_file_location("lint_dup_tests", _SCRIPT_PATH)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["lint_dup_tests"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def lint_module():
+    return _load_module()
+
+
+def _write(tmp_path: Path, name: str, source: str) -> Path:
+    path = tmp_path / name
+    path.write_text(textwrap.dedent(source), encoding="utf-8")
+    return path
+
+
+_BODY = """
+class TestThing:
+    def test_value(self):
+        assert 1 + 1 == 2
+"""
+
+
+def test_copy_in_other_file_is_reported(lint_module, tmp_path: Path) -> None:
+    _write(tmp_path, "test_a.py", _BODY)
+    _write(tmp_path, "test_b.py", "\n\n" + _BODY)
+    groups = lint_module.find_duplicates([tmp_path])
+    assert len(groups) == 1
+    assert [loc[2] for loc in groups[0]] == ["TestThing.test_value"] * 2
+
+
+def test_same_body_under_other_class_passes(lint_module, tmp_path: Path) -> None:
+    _write(tmp_path, "test_a.py", _BODY)
+    _write(tmp_path, "test_b.py", _BODY.replace("TestThing", "TestWrapMode"))
+    assert lint_module.find_duplicates([tmp_path]) == []
+
+
+def test_same_body_with_other_parametrize_passes(lint_module, tmp_path: Path) -> None:
+    _write(
+        tmp_path,
+        "test_a.py",
+        """
+        import pytest
+
+        @pytest.mark.parametrize("x", [1])
+        def test_x(x):
+            assert x
+
+        def helper():
+            pass
+        """,
+    )
+    _write(
+        tmp_path,
+        "test_b.py",
+        """
+        import pytest
+
+        @pytest.mark.parametrize("x", [2])
+        def test_x(x):
+            assert x
+        """,
+    )
+    assert lint_module.find_duplicates([tmp_path]) == []
+
+
+def test_non_test_files_ignored(lint_module, tmp_path: Path) -> None:
+    _write(tmp_path, "test_a.py", _BODY)
+    _write(tmp_path, "helpers.py", _BODY)
+    assert lint_module.find_duplicates([tmp_path]) == []
+
+
+def test_main_exit_codes(lint_module, tmp_path: Path) -> None:
+    _write(tmp_path, "test_a.py", _BODY)
+    assert lint_module.main(["lint_dup_tests.py", str(tmp_path)]) == 0
+    _write(tmp_path, "test_b.py", _BODY)
+    assert lint_module.main(["lint_dup_tests.py", str(tmp_path)]) == 1
@@ -141,3 +141,22 @@ class TestSaveIfDirty:
         monkeypatch.setattr("ccgram.monitor_state.atomic_write_json", fake_write)
         state.save_if_dirty()
         assert len(saved) == 0
+
+    def test_flush_interval_defers_second_save(self, tmp_path, monkeypatch):
+        state = MonitorState(state_file=tmp_path / "state.json", flush_interval=60.0)
+        saved: list[bool] = []
+
+        def fake_write(*_args, **_kwargs):
+            saved.append(True)
+
+        monkeypatch.setattr("ccgram.monitor_state.atomic_write_json", fake_write)
+        state.update_session(TrackedSession(session_id="s1", file_path="/a.jsonl"))
+        state.save_if_dirty()
+        state.update_session(TrackedSession(session_id="s2", file_path="/b.jsonl"))
+        state.save_if_dirty()
+        assert len(saved) == 1
+        assert state._dirty is True
+
+        state.save_if_dirty(force=True)
+        assert len(saved) == 2
+        assert state._dirty is False
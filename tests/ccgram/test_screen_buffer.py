@@ -52,6 +52,31 @@ class TestFeedAndDisplay:
         assert buf.display[0] == "text"
 
 
+class TestGetLine:
+    def test_reads_single_row(self):
+        buf = ScreenBuffer(columns=40, rows=5)
+        buf.feed("first\r\nsecond")
+        assert buf.get_line(0) == "first"
+        assert buf.get_line(1) == "second"
+        assert buf.get_line(2) == ""
+
+    def test_out_of_range_rows_are_empty(self):
+        buf = ScreenBuffer(columns=40, rows=5)
+        buf.feed("text")
+        assert buf.get_line(-1) == ""
+        assert buf.get_line(5) == ""
+
+    def test_gaps_render_as_spaces(self):
+        buf = ScreenBuffer(columns=40, rows=5)
+        buf.feed("a\x1b[5Cb")
+        assert buf.get_line(0) == "a     b"
+
+    def test_wide_chars_match_pyte(self):
+        buf = ScreenBuffer(columns=40, rows=5)
+        buf.feed("日本 ok")
+        assert buf.get_line(0) == buf._screen.display[0].rstrip()
+
+
 class TestRenderedText:
     def test_trims_trailing_blank_lines(self):
         buf = ScreenBuffer(columns=40, rows=5)
@@ -127,6 +152,29 @@ class TestSequentialFeeds:
         buf.feed(" world")
         assert buf.display[0] == "hello world"
 
+    def test_escape_split_across_feeds(self):
+        buf = ScreenBuffer(columns=40, rows=5)
+        buf.feed("\x1b[")
+        buf.feed("31mred")
+        assert buf.display[0] == "red"
+
+    def test_stream_tracks_plain_text_state(self):
+        buf = ScreenBuffer(columns=40, rows=5)
+        assert buf._stream._taking_plain_text is True
+        buf.feed("\x1b[")
+        assert not buf._stream._taking_plain_text
+        buf.feed("31mred")
+        assert buf._stream._taking_plain_text is True
+
+    def test_plain_feed_matches_parser(self):
+        text = "alpha\nbeta\r\ngamma\rG"
+        buf = ScreenBuffer(columns=40, rows=5)
+        buf.feed(text)
+        ref = ScreenBuffer(columns=40, rows=5)
+        ref._stream.feed(text)
+        assert buf.display == ref.display
+        assert buf.cursor_row == ref.cursor_row
+
     def test_reset_then_feed(self):
         buf = ScreenBuffer(columns=40, rows=5)
         buf.feed("old content")
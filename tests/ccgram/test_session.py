@@ -11,6 +11,8 @@ from ccgram.thread_router import thread_router
 from ccgram.user_preferences import user_preferences
 from ccgram.window_state_store import APPROVAL_MODES, WindowState, window_store
 
+pytestmark = pytest.mark.session
+
 
 @pytest.fixture
 def mgr(monkeypatch) -> SessionManager:
@@ -6,6 +6,8 @@ import pytest
 
 from ccgram.user_preferences import UserPreferences
 
+pytestmark = pytest.mark.session
+
 
 def _resolved(path: str) -> str:
     return str(Path(path).resolve())
@@ -5,9 +5,13 @@ import os
 import time
 from pathlib import Path
 
+import pytest
+
 from ccgram.session_map import parse_session_map, session_map_sync
 from ccgram.window_state_store import WindowState, window_store
 
+pytestmark = pytest.mark.session
+
 
 def _write_transcript(path: Path, age_seconds: float) -> None:
     path.write_text('{"type":"assistant"}\n')
@@ -23,6 +23,8 @@ from ccgram.window_state_store import (
     install_window_store,
 )
 
+pytestmark = pytest.mark.session
+
 
 @pytest.fixture
 def store() -> WindowStateStore:
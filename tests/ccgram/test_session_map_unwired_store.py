@@ -18,6 +18,10 @@ import sys
 import textwrap
 from pathlib import Path
 
+import pytest
+
+pytestmark = pytest.mark.session
+
 
 def test_parse_session_map_works_without_session_manager(tmp_path: Path) -> None:
     transcript = tmp_path / "x.jsonl"
@@ -1,11 +1,14 @@
 """Tests for SessionMonitor."""
 
+import asyncio
 import json
 import os
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from ccgram import fast_json
+from ccgram.config import config
 from ccgram.monitor_state import TrackedSession
 from ccgram.providers.claude import ClaudeProvider
 from ccgram.providers.codex import CodexProvider
@@ -67,6 +70,30 @@ class TestPendingToolsCleanup:
 
         assert old_sid not in monitor._pending_tools
 
+    async def test_pending_tools_kept_without_new_entries(self, tmp_path) -> None:
+        session_file = tmp_path / "transcript.jsonl"
+        session_file.write_text("")
+
+        monitor = SessionMonitor(
+            projects_path=tmp_path / "projects",
+            state_file=tmp_path / "ms.json",
+        )
+        pending = {"tool_1": {"name": "Read"}}
+        monitor._pending_tools["sess-p"] = pending
+        monitor.state.update_session(
+            TrackedSession(
+                session_id="sess-p", file_path=str(session_file), last_byte_offset=0
+            )
+        )
+
+        with patch.object(ClaudeProvider, "parse_transcript_entries") as parse:
+            await monitor._process_session_file(
+                "sess-p", session_file, [], window_id="@1"
+            )
+
+        parse.assert_not_called()
+        assert monitor._pending_tools["sess-p"] is pending
+
 
 class TestNewWindowDetection:
     async def test_callback_fires_for_new_window(self, monitor: SessionMonitor) -> None:
@@ -270,6 +297,25 @@ class TestReadNewLines:
         entries = await monitor._read_new_lines(tracked, session_file)
         assert len(entries) == 1
 
+    async def test_blank_lines_consumed(self, tmp_path) -> None:
+        session_file = tmp_path / "test.jsonl"
+        line = (
+            '{"type":"assistant","message":{"content":[{"type":"text","text":"a"}]}}\n'
+        )
+        content = "\n" + line + "\n\n" + line
+        session_file.write_text(content)
+
+        monitor = SessionMonitor(
+            projects_path=tmp_path,
+            state_file=tmp_path / "ms.json",
+        )
+        tracked = TrackedSession(
+            session_id="t1", file_path=str(session_file), last_byte_offset=0
+        )
+        entries = await monitor._read_new_lines(tracked, session_file)
+        assert len(entries) == 2
+        assert tracked.last_byte_offset == len(content.encode())
+
     async def test_partial_line_stops_reading(self, tmp_path) -> None:
         session_file = tmp_path / "test.jsonl"
         good_line = (
@@ -288,6 +334,138 @@ class TestReadNewLines:
         assert len(entries) == 1
         assert tracked.last_byte_offset == len(good_line.encode())
 
+    async def test_lone_surrogate_line_does_not_stall(self, tmp_path) -> None:
+        session_file = tmp_path / "test.jsonl"
+        surrogate_line = (
+            '{"type":"assistant","message":{"content":'
+            '[{"type":"text","text":"split \\ud83d"}]}}\n'
+        )
+        good_line = (
+            '{"type":"assistant","message":{"content":[{"type":"text","text":"ok"}]}}\n'
+        )
+        content = surrogate_line + good_line
+        session_file.write_text(content)
+
+        monitor = SessionMonitor(
+            projects_path=tmp_path,
+            state_file=tmp_path / "ms.json",
+        )
+        tracked = TrackedSession(
+            session_id="t1", file_path=str(session_file), last_byte_offset=0
+        )
+        entries = await monitor._read_new_lines(tracked, session_file)
+        assert len(entries) == 2
+        assert tracked.last_byte_offset == len(content.encode())
+
+    async def test_large_delta_read_off_loop(self, tmp_path) -> None:
+        session_file = tmp_path / "test.jsonl"
+        line = (
+            '{"type":"assistant","message":{"content":[{"type":"text","text":"é"}]}}\n'
+        )
+        body = line * 200
+        session_file.write_text(body, encoding="utf-8")
+
+        monitor = SessionMonitor(
+            projects_path=tmp_path,
+            state_file=tmp_path / "ms.json",
+        )
+        tracked = TrackedSession(
+            session_id="t1", file_path=str(session_file), last_byte_offset=0
+        )
+        with patch(
+            "ccgram.transcript_reader.asyncio.to_thread", wraps=asyncio.to_thread
+        ) as to_thread:
+            entries = await monitor._read_new_lines(tracked, session_file)
+        to_thread.assert_called_once()
+        assert (
+            to_thread.call_args.args[0] == monitor._transcript_reader._pread_and_parse
+        )
+        assert len(entries) == 200
+        assert tracked.last_byte_offset == len(body.encode())
+
+    async def test_fd_reused_across_reads_and_closed_on_clear(self, tmp_path) -> None:
+        session_file = tmp_path / "test.jsonl"
+        line = (
+            '{"type":"assistant","message":{"content":[{"type":"text","text":"a"}]}}\n'
+        )
+        session_file.write_text(line)
+
+        monitor = SessionMonitor(
+            projects_path=tmp_path,
+            state_file=tmp_path / "ms.json",
+        )
+        reader = monitor._transcript_reader
+        tracked = TrackedSession(
+            session_id="t1", file_path=str(session_file), last_byte_offset=0
+        )
+        assert len(await monitor._read_new_lines(tracked, session_file)) == 1
+        fd = reader._fds["t1"][0]
+
+        with session_file.open("a") as f:
+            f.write(line)
+        assert len(await monitor._read_new_lines(tracked, session_file)) == 1
+        assert reader._fds["t1"][0] == fd
+
+        reader.clear_session("t1")
+        assert "t1" not in reader._fds
+        with pytest.raises(OSError):
+            os.fstat(fd)
+
+    async def test_read_buffer_reused_across_reads(self, tmp_path) -> None:
+        session_file = tmp_path / "test.jsonl"
+        line = (
+            '{"type":"assistant","message":{"content":[{"type":"text","text":"a"}]}}\n'
+        )
+        session_file.write_text(line)
+
+        monitor = SessionMonitor(
+            projects_path=tmp_path,
+            state_file=tmp_path / "ms.json",
+        )
+        reader = monitor._transcript_reader
+        tracked = TrackedSession(
+            session_id="t1", file_path=str(session_file), last_byte_offset=0
+        )
+        await monitor._read_new_lines(tracked, session_file)
+        buf = reader._read_bufs["t1"]
+
+        with session_file.open("a") as f:
+            f.write(line.replace('"a"', '"b"'))
+        entries = await monitor._read_new_lines(tracked, session_file)
+        assert entries[0]["message"]["content"][0]["text"] == "b"
+        assert reader._read_bufs["t1"] is buf
+
+        reader.clear_session("t1")
+        assert "t1" not in reader._read_bufs
+
+    async def test_replaced_file_is_reopened(self, tmp_path) -> None:
+        session_file = tmp_path / "test.jsonl"
+        line = (
+            '{"type":"assistant","message":{"content":[{"type":"text","text":"a"}]}}\n'
+        )
+        session_file.write_text(line)
+
+        monitor = SessionMonitor(
+            projects_path=tmp_path,
+            state_file=tmp_path / "ms.json",
+        )
+        tracked = TrackedSession(
+            session_id="t1", file_path=str(session_file), last_byte_offset=0
+        )
+        monitor.state.update_session(tracked)
+        await monitor._process_session_file("t1", session_file, [])
+        old_ino = monitor._transcript_reader._fds["t1"][2]
+
+        replacement = tmp_path / "new.jsonl"
+        replacement.write_text(line.replace('"a"', '"b"') * 2)
+        os.replace(replacement, session_file)
+        tracked.last_byte_offset = len(line)
+
+        new_messages = []
+        await monitor._process_session_file("t1", session_file, new_messages)
+        assert monitor._transcript_reader._fds["t1"][2] != old_ino
+        assert [m.text for m in new_messages] == ["b"]
+
 
 class TestCorruptedOffset:
     async def test_corrupted_offset_recovers(self, tmp_path) -> None:
@@ -520,6 +698,92 @@ class TestCheckForUpdates:
         assert msgs[0].session_id == "sess-d"
         assert "hello" in msgs[0].text
 
+    async def test_messages_keep_session_order_across_batch(self, tmp_path) -> None:
+        monitor = SessionMonitor(
+            projects_path=tmp_path / "projects",
+            state_file=tmp_path / "ms.json",
+        )
+        current_map = {}
+        for i in range(6):
+            session_file = tmp_path / f"t{i}.jsonl"
+            session_file.write_text(
+                '{"type":"assistant","message":{"content":'
+                f'[{{"type":"text","text":"msg-{i}"}}]}}}}\n'
+            )
+            monitor.state.update_session(
+                TrackedSession(session_id=f"s{i}", file_path=str(session_file))
+            )
+            current_map[f"@{i}"] = {
+                "session_id": f"s{i}",
+                "cwd": "/proj",
+                "window_name": f"w{i}",
+                "transcript_path": str(session_file),
+            }
+
+        msgs = await monitor.check_for_updates(current_map)
+
+        assert [m.session_id for m in msgs] == [f"s{i}" for i in range(6)]
+
+    async def test_slow_session_does_not_hold_back_the_rest(self, tmp_path) -> None:
+        monitor = SessionMonitor(
+            projects_path=tmp_path / "projects",
+            state_file=tmp_path / "ms.json",
+        )
+        sessions = [(f"s{i}", tmp_path / f"t{i}.jsonl") for i in range(9)]
+        last_started = asyncio.Event()
+
+        async def fake_process(session_id, file_path, new_messages, window_id=""):
+            if session_id == "s0":
+                await last_started.wait()
+            elif session_id == "s8":
+                last_started.set()
+
+        with patch.object(monitor, "_process_session_file", side_effect=fake_process):
+            await asyncio.wait_for(monitor._process_sessions(sessions, {}, []), 2.0)
+
+        assert last_started.is_set()
+
+    async def test_duplicate_session_processed_once(self, tmp_path) -> None:
+        session_file = tmp_path / "transcript.jsonl"
+        session_file.write_text(
+            '{"type":"assistant","message":{"content":[{"type":"text","text":"hi"}]}}\n'
+        )
+        monitor = SessionMonitor(
+            projects_path=tmp_path / "projects",
+            state_file=tmp_path / "ms.json",
+        )
+        monitor.state.update_session(
+            TrackedSession(session_id="sess-dup", file_path=str(session_file))
+        )
+        details = {
+            "session_id": "sess-dup",
+            "cwd": "/proj",
+            "window_name": "proj",
+            "transcript_path": str(session_file),
+        }
+
+        msgs = await monitor.check_for_updates({"@1": details, "@2": dict(details)})
+
+        assert len(msgs) == 1
+
+    async def test_primed_stat_replaces_restat(self, tmp_path) -> None:
+        session_file = tmp_path / "transcript.jsonl"
+        session_file.write_text('{"type":"summary"}\n')
+
+        monitor = SessionMonitor(
+            projects_path=tmp_path / "projects",
+            state_file=tmp_path / "ms.json",
+        )
+        primed = os.stat_result((0o100644, 0, 0, 1, 0, 0, 12345, 0, 0, 0))
+        monitor._transcript_reader.prime_stats({str(session_file): primed})
+
+        await monitor._process_session_file("sess-p", session_file, [])
+
+        tracked = monitor.state.get_session("sess-p")
+        assert tracked is not None
+        assert tracked.last_byte_offset == 12345
+        assert monitor._transcript_reader._poll_stats == {}
+
 
 class TestCheckForUpdatesExceptionResilience:
     async def test_error_in_one_session_does_not_block_others(self, tmp_path) -> None:
@@ -632,6 +896,54 @@ class TestActivityTracking:
         assert last is not None
         assert last > 0
 
+    async def test_activity_uses_primed_poll_timestamp(self, tmp_path) -> None:
+        session_file = tmp_path / "transcript.jsonl"
+        session_file.write_text(
+            '{"type":"assistant","message":{"content":[{"type":"text","text":"hi"}]}}\n'
+        )
+
+        monitor = SessionMonitor(
+            projects_path=tmp_path / "projects",
+            state_file=tmp_path / "ms.json",
+        )
+        monitor.state.update_session(
+            TrackedSession(
+                session_id="sess-ts", file_path=str(session_file), last_byte_offset=0
+            )
+        )
+        monitor._transcript_reader.prime_stats({}, now=42.0)
+
+        await monitor._process_session_file("sess-ts", session_file, [])
+
+        assert monitor.get_last_activity("sess-ts") == 42.0
+
+    async def test_poll_timestamp_cleared_after_poll(self, tmp_path) -> None:
+        session_file = tmp_path / "transcript.jsonl"
+        session_file.write_text(
+            '{"type":"assistant","message":{"content":[{"type":"text","text":"hi"}]}}\n'
+        )
+
+        monitor = SessionMonitor(
+            projects_path=tmp_path / "projects",
+            state_file=tmp_path / "ms.json",
+        )
+        await monitor.check_for_updates(
+            {"@0": {"session_id": "sess-a", "transcript_path": str(session_file)}}
+        )
+        assert monitor._transcript_reader._poll_now is None
+
+        monitor.state.update_session(
+            TrackedSession(
+                session_id="sess-b", file_path=str(session_file), last_byte_offset=0
+            )
+        )
+        monitor._transcript_reader.prime_stats({}, now=42.0)
+        monitor._transcript_reader.end_poll()
+
+        await monitor._process_session_file("sess-b", session_file, [])
+
+        assert monitor.get_last_activity("sess-b") != 42.0
+
     async def test_get_last_activity_not_updated_without_entries(
         self, tmp_path
     ) -> None:
@@ -772,6 +1084,49 @@ class TestScanProjects:
         result = monitor._scan_projects_sync({"/tmp/something"})
         assert result == []
 
+    def test_scan_projects_sync_reuses_index_until_changed(self, tmp_path) -> None:
+        projects_path = tmp_path / "projects"
+        work_dir = tmp_path / "myproject"
+        work_dir.mkdir()
+        resolved_cwd = str(work_dir.resolve())
+        proj_dir = projects_path / "-tmp-myproject"
+        proj_dir.mkdir(parents=True)
+        for sid in ("sess-a", "sess-b"):
+            (proj_dir / f"{sid}.jsonl").write_text('{"type":"summary"}\n')
+
+        index_file = proj_dir / "sessions-index.json"
+
+        def write_index(*sids: str) -> None:
+            entries = [
+                {
+                    "sessionId": sid,
+                    "fullPath": str(proj_dir / f"{sid}.jsonl"),
+                    "projectPath": resolved_cwd,
+                }
+                for sid in sids
+            ]
+            index_file.write_text(
+                json.dumps({"originalPath": resolved_cwd, "entries": entries})
+            )
+
+        write_index("sess-a")
+        monitor = SessionMonitor(
+            projects_path=projects_path,
+            state_file=tmp_path / "ms.json",
+        )
+        monitor._scan_projects_sync({resolved_cwd})
+
+        with patch(
+            "ccgram.transcript_reader.fast_json.loads", wraps=fast_json.loads
+        ) as loads:
+            monitor._scan_projects_sync({resolved_cwd})
+            assert loads.call_count == 0
+
+            write_index("sess-a", "sess-b")
+            result = monitor._scan_projects_sync({resolved_cwd})
+            assert loads.call_count == 1
+        assert sorted(info.session_id for info in result) == ["sess-a", "sess-b"]
+
 
 class TestGeminiTranscriptReading:
     """Test _read_new_lines delegation for Gemini with supports_incremental_read=True."""
@@ -872,3 +1227,101 @@ def _make_gemini_provider():
     from ccgram.providers.gemini import GeminiProvider
 
     return GeminiProvider()
+
+
+class _WakingWatcher:
+    def __init__(self, monitor: SessionMonitor, wakes: int) -> None:
+        self.monitor = monitor
+        self.wakes = wakes
+        self.watched: list[set[str]] = []
+
+    def start(self) -> bool:
+        return True
+
+    def watch(self, files) -> None:
+        self.watched.append(set(files))
+
+    async def wait(self, _timeout: float) -> bool:
+        self.wakes -= 1
+        if self.wakes < 0:
+            self.monitor._running = False
+        return True
+
+    def close(self) -> None:
+        pass
+
+
+class TestMonitorLoop:
+    async def test_file_wake_skips_tmux_reconciliation(
+        self, monitor: SessionMonitor, tmp_path, monkeypatch
+    ) -> None:
+        transcript = str(tmp_path / "t.jsonl")
+        current_map = {"@0": {"session_id": "s1", "transcript_path": transcript}}
+        watcher = _WakingWatcher(monitor, wakes=2)
+        reconcile = AsyncMock(return_value=current_map)
+        check = AsyncMock(return_value=[])
+        read_events = AsyncMock()
+        monkeypatch.setattr(monitor, "_dir_watcher", watcher)
+        monkeypatch.setattr(monitor, "_cleanup_all_stale_sessions", AsyncMock())
+        monkeypatch.setattr(monitor, "_load_current_session_map", AsyncMock())
+        monkeypatch.setattr(monitor, "_reconcile_windows", reconcile)
+        monkeypatch.setattr(monitor, "check_for_updates", check)
+        monkeypatch.setattr(monitor, "_read_hook_events", read_events)
+        monkeypatch.setattr(
+            "ccgram.session_monitor.session_lifecycle.initialize", lambda _m: None
+        )
+        monitor.poll_interval = 60.0
+        monitor._running = True
+
+        await monitor._monitor_loop()
+
+        reconcile.assert_awaited_once()
+        assert read_events.await_count == 3
+        assert [c.kwargs for c in check.await_args_list] == [
+            {},
+            {"include_fallback": False},
+            {"include_fallback": False},
+        ]
+        assert all(c.args == (current_map,) for c in check.await_args_list)
+        assert watcher.watched == [{transcript, str(config.events_file)}]
+
+    async def test_fallback_sessions_skipped_when_excluded(
+        self, monitor: SessionMonitor, monkeypatch
+    ) -> None:
+        active_cwds = AsyncMock(return_value={"/tmp"})
+        monkeypatch.setattr(monitor, "_get_active_cwds", active_cwds)
+
+        await monitor.check_for_updates(
+            {"@0": {"session_id": "s1", "transcript_path": ""}},
+            include_fallback=False,
+        )
+
+        active_cwds.assert_not_awaited()
+
+
+class TestStop:
+    async def test_readers_closed_after_loop_exits(
+        self, monitor: SessionMonitor, monkeypatch
+    ) -> None:
+        order: list[str] = []
+
+        async def loop() -> None:
+            try:
+                await asyncio.Event().wait()
+            finally:
+                order.append("loop")
+
+        monkeypatch.setattr(monitor, "_monitor_loop", loop)
+        monkeypatch.setattr(
+            monitor._transcript_reader, "close", lambda: order.append("reader")
+        )
+        monkeypatch.setattr(monitor._event_log, "close", lambda: order.append("events"))
+        monkeypatch.setattr(
+            monitor._dir_watcher, "close", lambda: order.append("watcher")
+        )
+        monitor.start()
+        await asyncio.sleep(0)
+
+        await monitor.stop()
+
+        assert order == ["loop", "reader", "events", "watcher"]
@@ -173,3 +173,16 @@ class TestRecordHookActivity:
         monitor._last_session_map = {}
         monitor.record_hook_activity("@99")
         assert len(monitor._last_activity) == 0
+
+    def test_resolves_full_key_and_suffix(self, monitor: SessionMonitor) -> None:
+        monitor._last_session_map = {
+            "ccgram:@0": {"session_id": "s1", "cwd": "/tmp"},
+            "@0": {"session_id": "s2", "cwd": "/tmp"},
+            "@1": {"session_id": "s3", "cwd": "/tmp"},
+        }
+        monitor.record_hook_activity("ccgram:@0")
+        monitor.record_hook_activity("@1")
+        assert set(monitor._last_activity) == {"s1", "s3"}
+        monitor._last_activity.clear()
+        monitor.record_hook_activity("@0")
+        assert set(monitor._last_activity) == {"s1"}
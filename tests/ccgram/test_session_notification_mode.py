@@ -11,6 +11,8 @@ from ccgram.handlers.callback_data import (
 from ccgram.session import NOTIFICATION_MODES, SessionManager, WindowState
 from ccgram.window_state_store import window_store
 
+pytestmark = pytest.mark.session
+
 
 @pytest.fixture
 def mgr(monkeypatch) -> SessionManager:
@@ -1,23 +1,19 @@
 """Tests for state file backward compatibility."""
 
+import pytest
+
 from ccgram.session import WindowState
 from ccgram.session_map import parse_session_map
 
+pytestmark = pytest.mark.session
+
 
 class TestWindowStateSerialization:
     def test_minimal_state_round_trip(self) -> None:
         data = {"session_id": "abc", "cwd": "/tmp"}
         ws = WindowState.from_dict(data)
-        assert ws.session_id == "abc"
-        assert ws.cwd == "/tmp"
-        assert ws.notification_mode == "all"
-
-    def test_sparse_serialization_omits_defaults(self) -> None:
-        ws = WindowState(session_id="abc", cwd="/tmp")
-        d = ws.to_dict()
-        assert "notification_mode" not in d
-        assert "window_name" not in d
-        assert "transcript_path" not in d
+        assert (ws.session_id, ws.cwd, ws.notification_mode) == ("abc", "/tmp", "all")
+        assert ws.to_dict() == data
 
 
 class TestSessionMapParsing:
@@ -10,6 +10,8 @@ import pytest
 
 from ccgram.state_persistence import StatePersistence
 
+pytestmark = pytest.mark.session
+
 
 class TestScheduleSaveNoLoop:
     def test_saves_immediately_without_event_loop(self, tmp_path: Path) -> None:
@@ -4,10 +4,17 @@ import logging
 import pytest
 import structlog
 
+from ccgram.handlers.polling.polling_coordinator import (
+    _BACKOFF_MAX as _SP_MAX,
+    _BACKOFF_MIN as _SP_MIN,
+)
+from ccgram.session_monitor import _BACKOFF_MAX as _SM_MAX, _BACKOFF_MIN as _SM_MIN
 from ccgram.utils import task_done_callback
 
+_EXPECTED_DELAYS = (2.0, 4.0, 8.0, 16.0, 30.0, 30.0, 30.0, 30.0, 30.0, 30.0)
 
-@pytest.fixture(autouse=True)
+
+@pytest.fixture(scope="module", autouse=True)
 def _configure_structlog_for_caplog():
     """Configure structlog to route through stdlib logging so caplog works."""
     structlog.configure(
@@ -44,7 +51,7 @@ async def test_task_done_callback_logs_exception(
 
 async def test_task_done_callback_ignores_cancelled() -> None:
     async def _forever() -> None:
-        await asyncio.sleep(999)
+        await asyncio.get_running_loop().create_future()
 
     task = asyncio.create_task(_forever())
     task.add_done_callback(task_done_callback)
@@ -67,30 +74,17 @@ async def test_task_done_callback_ignores_success(
 
 
 async def test_backoff_constants_session_monitor() -> None:
-    from ccgram.session_monitor import _BACKOFF_MAX, _BACKOFF_MIN
-
-    assert _BACKOFF_MIN == 2.0
-    assert _BACKOFF_MAX == 30.0
-    for streak in range(10):
-        delay = min(_BACKOFF_MAX, _BACKOFF_MIN * (2**streak))
-        assert delay <= _BACKOFF_MAX
+    assert _SM_MIN == 2.0
+    assert _SM_MAX == 30.0
+    delays = tuple(min(_SM_MAX, _SM_MIN * (2**s)) for s in range(10))
+    assert delays == _EXPECTED_DELAYS
 
 
 async def test_backoff_constants_status_polling() -> None:
-    from ccgram.handlers.polling.polling_coordinator import _BACKOFF_MAX, _BACKOFF_MIN
-
-    assert _BACKOFF_MIN == 2.0
-    assert _BACKOFF_MAX == 30.0
+    assert _SP_MIN == 2.0
+    assert _SP_MAX == 30.0
 
 
 async def test_backoff_doubles_on_consecutive_errors() -> None:
-    from ccgram.session_monitor import _BACKOFF_MAX, _BACKOFF_MIN
-
-    delays = []
-    for streak in range(5):
-        delays.append(min(_BACKOFF_MAX, _BACKOFF_MIN * (2**streak)))
-    assert delays[0] == 2.0
-    assert delays[1] == 4.0
-    assert delays[2] == 8.0
-    assert delays[3] == 16.0
-    assert delays[4] == 30.0
+    delays = [min(_SM_MAX, _SM_MIN * (2**s)) for s in range(5)]
+    assert delays == list(_EXPECTED_DELAYS[:5])
@@ -1,6 +1,8 @@
+from functools import cache
 from typing import TYPE_CHECKING
 
 import pytest
+from _helpers import SEPARATOR
 
 if TYPE_CHECKING:
     from ccgram.screen_buffer import ScreenBuffer
@@ -18,74 +20,36 @@ from ccgram.terminal_parser import (
 )
 
 
-class TestIsLikelySpinner:
-    @pytest.mark.parametrize(
-        "char",
-        ["·", "✻", "✽", "✶", "✳", "✢"],
-        ids=[
-            "middle_dot",
-            "heavy_asterisk",
-            "heavy_teardrop",
-            "six_star",
-            "eight_star",
-            "cross",
-        ],
-    )
-    def test_known_spinners(self, char: str):
-        assert is_likely_spinner(char) is True
+_SPINNERS = (
+    "·", "✻", "✽", "✶", "✳", "✢",
+    "⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏",
+    "∑", "⚡",
+)  # fmt: skip
+_NON_SPINNERS = (
+    "─", "│", "┌", "┐", ">", "|",
+    "A", "z", "0", " ", "",
+    "!", "#", "%", "@", "*", "/", "\\", "~", "?", ",", ".",
+)  # fmt: skip
 
-    @pytest.mark.parametrize(
-        "char",
-        ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"],
-        ids=[f"braille_{i}" for i in range(10)],
-    )
-    def test_braille_spinners(self, char: str):
-        assert is_likely_spinner(char) is True
 
-    @pytest.mark.parametrize(
-        "char",
-        ["─", "│", "┌", "┐", ">", "|"],
-        ids=["h_line", "v_line", "corner_tl", "corner_tr", "gt", "pipe"],
-    )
-    def test_non_spinners_box_drawing(self, char: str):
-        assert is_likely_spinner(char) is False
+class TestIsLikelySpinner:
+    def test_spinners(self):
+        assert [char for char in _SPINNERS if is_likely_spinner(char) is not True] == []
 
-    @pytest.mark.parametrize(
-        "char",
-        ["A", "z", "0", " ", ""],
-        ids=["upper_a", "lower_z", "digit", "space", "empty"],
-    )
-    def test_non_spinners_common(self, char: str):
-        assert is_likely_spinner(char) is False
+    def test_non_spinners(self):
+        assert [
+            char for char in _NON_SPINNERS if is_likely_spinner(char) is not False
+        ] == []
 
-    def test_math_symbol_detected(self):
-        assert is_likely_spinner("∑") is True
 
-    def test_other_symbol_detected(self):
-        assert is_likely_spinner("⚡") is True
+_DISTANT_PANE = f"✻ Doing work\n{SEPARATOR}\n" + "trailing\n" * 16
+_CHROME = (SEPARATOR, "❯ ", SEPARATOR, "  ⎇ main  ✱ Opus 4.6")
 
-    @pytest.mark.parametrize(
-        "char",
-        ["!", "#", "%", "@", "*", "/", "\\", "~", "?", ",", "."],
-        ids=[
-            "bang",
-            "hash",
-            "pct",
-            "at",
-            "star",
-            "slash",
-            "bslash",
-            "tilde",
-            "qmark",
-            "comma",
-            "dot",
-        ],
-    )
-    def test_ascii_punctuation_rejected(self, char: str):
-        assert is_likely_spinner(char) is False
 
-
-_SEPARATOR = "─" * 30
+@cache
+def _build_pane(content_lines: int) -> str:
+    content = [f"line {i}" for i in range(content_lines)]
+    return "\n".join([*content, "✻ Working on task", *_CHROME])
 
 
 class TestParseStatusLine:
@@ -101,7 +65,7 @@ class TestParseStatusLine:
         ],
     )
     def test_spinner_chars(self, spinner: str, rest: str, expected: str):
-        pane = f"some output\n{spinner}{rest}\n{_SEPARATOR}\n"
+        pane = f"some output\n{spinner}{rest}\n{SEPARATOR}\n"
         assert parse_status_line(pane) == expected
 
     @pytest.mark.parametrize(
@@ -113,7 +77,7 @@ class TestParseStatusLine:
         ],
     )
     def test_braille_spinners_detected(self, spinner: str, text: str):
-        pane = f"some output\n{spinner} {text}\n{_SEPARATOR}\n"
+        pane = f"some output\n{spinner} {text}\n{SEPARATOR}\n"
         assert parse_status_line(pane) == text
 
     @pytest.mark.parametrize(
@@ -122,7 +86,7 @@ class TestParseStatusLine:
             pytest.param("just normal text\nno spinners here\n", id="no_spinner"),
             pytest.param("", id="empty"),
             pytest.param(
-                f"some output\n· bullet point\nmore text\n{_SEPARATOR}\n",
+                f"some output\n· bullet point\nmore text\n{SEPARATOR}\n",
                 id="spinner_not_above_separator",
             ),
         ],
@@ -131,8 +95,7 @@ class TestParseStatusLine:
         assert parse_status_line(pane) is None
 
     def test_adaptive_scan_finds_distant_separator(self):
-        pane = f"✻ Doing work\n{_SEPARATOR}\n" + "trailing\n" * 16
-        assert parse_status_line(pane) == "Doing work"
+        assert parse_status_line(_DISTANT_PANE) == "Doing work"
 
     def test_ignores_bullet_points(self):
         pane = (
@@ -140,12 +103,12 @@ class TestParseStatusLine:
             "· first item\n"
             "· second item\n"
             "normal line\n"
-            f"{_SEPARATOR}\n"
+            f"{SEPARATOR}\n"
         )
         assert parse_status_line(pane) is None
 
     def test_bottom_up_scan_with_chrome(self):
-        pane = f"output\n✻ Doing work\n{_SEPARATOR}\n❯\n"
+        pane = f"output\n✻ Doing work\n{SEPARATOR}\n❯\n"
         assert parse_status_line(pane) == "Doing work"
 
     def test_two_separator_layout(self):
@@ -153,9 +116,9 @@ class TestParseStatusLine:
             "output\n"
             "✶ Perusing… (3m 35s)\n"
             "\n"
-            f"{_SEPARATOR}\n"
+            f"{SEPARATOR}\n"
             "❯ \n"
-            f"{_SEPARATOR}\n"
+            f"{SEPARATOR}\n"
             "   ⎇ main  ~/Workspace/proj  ✱ Opus 4.6\n"
         )
         assert parse_status_line(pane) == "Perusing… (3m 35s)"
@@ -164,9 +127,9 @@ class TestParseStatusLine:
         pane = (
             "output\n"
             "✶ Working hard\n"
-            f"{_SEPARATOR}\n"
+            f"{SEPARATOR}\n"
             "❯ \n"
-            f"{_SEPARATOR}\n"
+            f"{SEPARATOR}\n"
             "   ⎇ main  ✱ Opus 4.6\n"
         )
         assert parse_status_line(pane) == "Working hard"
@@ -181,9 +144,9 @@ class TestParseStatusLine:
             "◼ Spawn review agents\n"
             "◻ Collect agent results\n"
             "✽ Running py-idioms review…\n"
-            f"{_SEPARATOR}\n"
+            f"{SEPARATOR}\n"
             "❯ \n"
-            f"{_SEPARATOR}\n"
+            f"{SEPARATOR}\n"
             "   ⎇ main  ✱ Opus 4.6\n"
         )
 
@@ -195,13 +158,41 @@ class TestParseStatusLine:
         )
 
 
+@pytest.mark.slow
 class TestExtractInteractiveContent:
-    def test_exit_plan_mode(self, sample_pane_exit_plan: str):
-        result = extract_interactive_content(sample_pane_exit_plan)
-        assert result is not None
-        assert result.name == "ExitPlanMode"
-        assert "Would you like to proceed?" in result.content
-        assert "ctrl-g to edit in" in result.content
+    @pytest.mark.parametrize(
+        ("pane_fixture", "name", "needles"),
+        [
+            (
+                "sample_pane_exit_plan",
+                "ExitPlanMode",
+                ("Would you like to proceed?", "ctrl-g to edit in"),
+            ),
+            ("sample_pane_ask_user_multi_tab", "AskUserQuestion", ("←",)),
+            (
+                "sample_pane_ask_user_single_tab",
+                "AskUserQuestion",
+                ("Enter to select",),
+            ),
+            (
+                "sample_pane_permission",
+                "PermissionPrompt",
+                ("Do you want to proceed?",),
+            ),
+        ],
+        ids=["exit_plan", "ask_multi_tab", "ask_single_tab", "permission"],
+    )
+    def test_sample_panes(
+        self,
+        request: pytest.FixtureRequest,
+        pane_fixture: str,
+        name: str,
+        needles: tuple[str, ...],
+    ):
+        result = extract_interactive_content(request.getfixturevalue(pane_fixture))
+        assert result is not None
+        assert result.name == name
+        assert [n for n in needles if n not in result.content] == []
 
     def test_exit_plan_mode_variant(self):
         pane = (
@@ -212,24 +203,6 @@ class TestExtractInteractiveContent:
         assert result.name == "ExitPlanMode"
         assert "Claude has written up a plan" in result.content
 
-    def test_ask_user_multi_tab(self, sample_pane_ask_user_multi_tab: str):
-        result = extract_interactive_content(sample_pane_ask_user_multi_tab)
-        assert result is not None
-        assert result.name == "AskUserQuestion"
-        assert "←" in result.content
-
-    def test_ask_user_single_tab(self, sample_pane_ask_user_single_tab: str):
-        result = extract_interactive_content(sample_pane_ask_user_single_tab)
-        assert result is not None
-        assert result.name == "AskUserQuestion"
-        assert "Enter to select" in result.content
-
-    def test_permission_prompt(self, sample_pane_permission: str):
-        result = extract_interactive_content(sample_pane_permission)
-        assert result is not None
-        assert result.name == "PermissionPrompt"
-        assert "Do you want to proceed?" in result.content
-
     def test_edit_permission_prompt_structural(self):
         pane = (
             "  Do you want to make this edit to status_polling.py?\n"
@@ -484,9 +457,9 @@ class TestStripPaneChrome:
         lines = [
             "some output",
             "more output",
-            "─" * 30,
+            SEPARATOR,
             "❯",
-            "─" * 30,
+            SEPARATOR,
             "  [Opus 4.6] Context: 34%",
         ]
         assert strip_pane_chrome(lines) == ["some output", "more output"]
@@ -500,16 +473,22 @@ class TestStripPaneChrome:
         assert strip_pane_chrome(lines) == lines
 
     def test_adaptive_scan_finds_distant_separator(self):
-        lines = ["─" * 30] + [f"line {i}" for i in range(14)]
+        lines = [SEPARATOR] + [f"line {i}" for i in range(14)]
         assert strip_pane_chrome(lines) == []
 
     def test_content_above_separator_preserved(self):
         content = [f"line {i}" for i in range(20)]
-        chrome = ["─" * 30, "❯", "─" * 30, "  [Opus 4.6] Context: 34%"]
+        chrome = [SEPARATOR, "❯", SEPARATOR, "  [Opus 4.6] Context: 34%"]
         lines = content + chrome
         assert strip_pane_chrome(lines) == content
 
 
+_BASH_CHROME_PANE = (
+    f"some context\n! ls\n⎿ file.txt\n{SEPARATOR}\n❯\n{SEPARATOR}\n"
+    "  [Opus 4.6] Context: 34%\n"
+)
+
+
 class TestExtractBashOutput:
     def test_extracts_command_output(self):
         pane = "some context\n! echo hello\n⎿ hello\n"
@@ -523,18 +502,7 @@ class TestExtractBashOutput:
         assert extract_bash_output(pane, "echo hello") is None
 
     def test_chrome_stripped(self):
-        pane = (
-            "some context\n"
-            "! ls\n"
-            "⎿ file.txt\n"
-            + "─" * 30
-            + "\n"
-            + "❯\n"
-            + "─" * 30
-            + "\n"
-            + "  [Opus 4.6] Context: 34%\n"
-        )
-        result = extract_bash_output(pane, "ls")
+        result = extract_bash_output(_BASH_CHROME_PANE, "ls")
         assert result is not None
         assert "file.txt" in result
         assert "Opus" not in result
@@ -552,48 +520,52 @@ class TestExtractBashOutput:
         assert not result.endswith("\n")
 
 
+_STATUS_CASES = (
+    ("Reading src/foo.py", "\U0001f4d6 reading\u2026"),
+    ("Thinking about the problem", "\U0001f9e0 thinking\u2026"),
+    ("Reasoning through options", "\U0001f9e0 thinking\u2026"),
+    ("Editing main.py line 42", "\u270f\ufe0f editing\u2026"),
+    ("Writing to file", "\U0001f4dd writing\u2026"),
+    ("Running bash command", "\u26a1 running\u2026"),
+    ("Searching for pattern", "\U0001f50d searching\u2026"),
+    ("grep -r foo .", "\U0001f50d searching\u2026"),
+    ("glob **/*.py", "\U0001f4c2 searching\u2026"),
+    ("Building the project", "\U0001f3d7\ufe0f building\u2026"),
+    ("compiling module", "\U0001f3d7\ufe0f building\u2026"),
+    ("Installing dependencies", "\U0001f4e6 installing\u2026"),
+    ("Fetching remote refs", "\U0001f310 fetching\u2026"),
+    ("git push origin main", "\u2b06\ufe0f pushing\u2026"),
+    ("git pull --rebase", "\u2b07\ufe0f pulling\u2026"),
+    ("git clone https://repo", "\U0001f4cb cloning\u2026"),
+    ("git commit -m msg", "\U0001f4be committing\u2026"),
+    ("Deploying to prod", "\U0001f680 deploying\u2026"),
+    ("Debugging crash", "\U0001f41b debugging\u2026"),
+    ("Formatting code", "\U0001f9f9 formatting\u2026"),
+    ("Linting files", "\U0001f9f9 linting\u2026"),
+    ("Downloading artifact", "\u2b07\ufe0f downloading\u2026"),
+    ("Uploading results", "\u2b06\ufe0f uploading\u2026"),
+    ("Testing connection", "\U0001f9ea testing\u2026"),
+    ("Deleting old files", "\U0001f5d1\ufe0f deleting\u2026"),
+    ("Creating new module", "\u2728 creating\u2026"),
+    ("Checking types", "\u2705 checking\u2026"),
+    ("Updating dependencies", "\U0001f504 updating\u2026"),
+    ("Analyzing output", "\U0001f52c analyzing\u2026"),
+    ("Parsing JSON", "\U0001f50d parsing\u2026"),
+    ("Verifying results", "\u2705 verifying\u2026"),
+    ("esc to interrupt \u00b7 working", "\u2699\ufe0f working\u2026"),
+    ("Something completely novel", "\u2699\ufe0f working\u2026"),
+    ("", "\u2699\ufe0f working\u2026"),
+)
+
+
 class TestFormatStatusDisplay:
-    @pytest.mark.parametrize(
-        ("raw", "expected"),
-        [
-            ("Reading src/foo.py", "\U0001f4d6 reading\u2026"),
-            ("Thinking about the problem", "\U0001f9e0 thinking\u2026"),
-            ("Reasoning through options", "\U0001f9e0 thinking\u2026"),
-            ("Editing main.py line 42", "\u270f\ufe0f editing\u2026"),
-            ("Writing to file", "\U0001f4dd writing\u2026"),
-            ("Running bash command", "\u26a1 running\u2026"),
-            ("Searching for pattern", "\U0001f50d searching\u2026"),
-            ("grep -r foo .", "\U0001f50d searching\u2026"),
-            ("glob **/*.py", "\U0001f4c2 searching\u2026"),
-            ("Building the project", "\U0001f3d7\ufe0f building\u2026"),
-            ("compiling module", "\U0001f3d7\ufe0f building\u2026"),
-            ("Installing dependencies", "\U0001f4e6 installing\u2026"),
-            ("Fetching remote refs", "\U0001f310 fetching\u2026"),
-            ("git push origin main", "\u2b06\ufe0f pushing\u2026"),
-            ("git pull --rebase", "\u2b07\ufe0f pulling\u2026"),
-            ("git clone https://repo", "\U0001f4cb cloning\u2026"),
-            ("git commit -m msg", "\U0001f4be committing\u2026"),
-            ("Deploying to prod", "\U0001f680 deploying\u2026"),
-            ("Debugging crash", "\U0001f41b debugging\u2026"),
-            ("Formatting code", "\U0001f9f9 formatting\u2026"),
-            ("Linting files", "\U0001f9f9 linting\u2026"),
-            ("Downloading artifact", "\u2b07\ufe0f downloading\u2026"),
-            ("Uploading results", "\u2b06\ufe0f uploading\u2026"),
-            ("Testing connection", "\U0001f9ea testing\u2026"),
-            ("Deleting old files", "\U0001f5d1\ufe0f deleting\u2026"),
-            ("Creating new module", "\u2728 creating\u2026"),
-            ("Checking types", "\u2705 checking\u2026"),
-            ("Updating dependencies", "\U0001f504 updating\u2026"),
-            ("Analyzing output", "\U0001f52c analyzing\u2026"),
-            ("Parsing JSON", "\U0001f50d parsing\u2026"),
-            ("Verifying results", "\u2705 verifying\u2026"),
-            ("esc to interrupt \u00b7 working", "\u2699\ufe0f working\u2026"),
-            ("Something completely novel", "\u2699\ufe0f working\u2026"),
-            ("", "\u2699\ufe0f working\u2026"),
-        ],
-    )
-    def test_known_patterns(self, raw: str, expected: str) -> None:
-        assert format_status_display(raw) == expected
+    def test_known_patterns(self) -> None:
+        mismatches = [
+            (raw, expected, actual)
+            for raw, expected in _STATUS_CASES
+            if (actual := format_status_display(raw)) != expected
+        ]
+        assert mismatches == []
 
     def test_case_insensitive(self) -> None:
         assert format_status_display("READING file") == "\U0001f4d6 reading\u2026"
@@ -647,66 +619,58 @@ class TestFindChromeBoundary:
         assert find_chrome_boundary(["line 1", "line 2"]) is None
 
     def test_single_separator(self):
-        lines = ["output", "more output", "─" * 30, "❯"]
+        lines = ["output", "more output", SEPARATOR, "❯"]
         assert find_chrome_boundary(lines) == 2
 
     def test_two_separators(self):
         lines = [
             "output",
-            "─" * 30,
+            SEPARATOR,
             "❯ ",
-            "─" * 30,
+            SEPARATOR,
             "  [Opus 4.6] Context: 34%",
         ]
         assert find_chrome_boundary(lines) == 1
 
     def test_separator_far_from_bottom(self):
-        lines = ["output"] * 50 + ["─" * 30, "❯", "─" * 30, "  status"]
+        lines = ["output"] * 50 + [SEPARATOR, "❯", SEPARATOR, "  status"]
         assert find_chrome_boundary(lines) == 50
 
     def test_content_separator_not_chrome(self):
         lines = [
-            "─" * 30,
+            SEPARATOR,
             "x" * 260,
-            "─" * 30,
+            SEPARATOR,
             "❯",
         ]
         assert find_chrome_boundary(lines) == 2
 
 
+@pytest.mark.slow
 class TestVariableTerminalSizes:
-    def _build_pane(self, content_lines: int) -> str:
-        content = [f"line {i}" for i in range(content_lines)]
-        status = "✻ Working on task"
-        sep = "─" * 30
-        chrome = [sep, "❯ ", sep, "  ⎇ main  ✱ Opus 4.6"]
-        return "\n".join(content + [status] + chrome)
-
     @pytest.mark.parametrize("rows", [24, 50, 100], ids=["24row", "50row", "100row"])
     def test_status_detected_any_size(self, rows: int):
-        pane = self._build_pane(content_lines=rows - 5)
+        pane = _build_pane(content_lines=rows - 5)
         assert parse_status_line(pane) == "Working on task"
 
     @pytest.mark.parametrize("rows", [24, 50, 100], ids=["24row", "50row", "100row"])
     def test_chrome_stripped_any_size(self, rows: int):
         content = [f"line {i}" for i in range(rows - 5)]
         status = "✻ Working on task"
-        sep = "─" * 30
-        chrome = [sep, "❯ ", sep, "  ⎇ main  ✱ Opus 4.6"]
-        lines = content + [status] + chrome
+        lines = [*content, status, *_CHROME]
         result = strip_pane_chrome(lines)
         assert result == content + [status]
 
     def test_pane_rows_optimization(self):
-        pane = self._build_pane(content_lines=80)
+        pane = _build_pane(content_lines=80)
         assert parse_status_line(pane, pane_rows=100) == "Working on task"
 
     def test_extra_padding_below_separator(self):
         lines = [
             "output",
-            "─" * 30,
+            SEPARATOR,
             "❯ ",
-            "─" * 30,
+            SEPARATOR,
             "  status bar",
             "",
             "",
@@ -925,13 +889,12 @@ class TestParseStatusFromScreen:
         return buf
 
     def test_detects_spinner_status(self):
-        sep = "─" * 30
         raw = (
             "some output\r\n"
             "\x1b[36m✻ Reading file\x1b[0m\r\n"
-            f"{sep}\r\n"
+            f"{SEPARATOR}\r\n"
             "❯ \r\n"
-            f"{sep}\r\n"
+            f"{SEPARATOR}\r\n"
             "  \x1b[90m[Opus 4.6]\x1b[0m Context: 34%"
         )
         from ccgram.terminal_parser import parse_status_from_screen
@@ -941,8 +904,7 @@ class TestParseStatusFromScreen:
         assert result == "Reading file"
 
     def test_braille_spinner_via_screen(self):
-        sep = "─" * 30
-        raw = f"output\r\n⠋ Loading modules\r\n{sep}\r\n❯ "
+        raw = f"output\r\n⠋ Loading modules\r\n{SEPARATOR}\r\n❯ "
         from ccgram.terminal_parser import parse_status_from_screen
 
         screen = self._make_screen(raw)
@@ -964,14 +926,13 @@ class TestParseStatusFromScreen:
         assert parse_status_from_screen(screen) is None
 
     def test_matches_regex_result(self):
-        sep = "─" * 30
-        plain = f"output\n✻ Working on task\n{sep}\n❯ \n{sep}\n  status"
+        plain = f"output\n✻ Working on task\n{SEPARATOR}\n❯ \n{SEPARATOR}\n  status"
         ansi = (
             "output\r\n"
             "\x1b[36m✻ Working on task\x1b[0m\r\n"
-            f"{sep}\r\n"
+            f"{SEPARATOR}\r\n"
             "❯ \r\n"
-            f"{sep}\r\n"
+            f"{SEPARATOR}\r\n"
             "  \x1b[90mstatus\x1b[0m"
         )
         from ccgram.terminal_parser import parse_status_from_screen
@@ -984,14 +945,13 @@ class TestParseStatusFromScreen:
 
 class TestDetectRemoteControl:
     def _build_lines(self, *, rc: bool = True) -> list[str]:
-        sep = "─" * 30
         status_bar = "  ● Remote Control active" if rc else "  [Opus 4.6] Context: 34%"
         return [
             "output line 1",
             "output line 2",
-            sep,
+            SEPARATOR,
             "❯ ",
-            sep,
+            SEPARATOR,
             status_bar,
         ]
 
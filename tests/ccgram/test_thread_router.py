@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 
 from ccgram.thread_router import ThreadRouter
@@ -35,6 +37,13 @@ class TestBindThread:
         router.bind_thread(100, 1, "@2")
         assert router.get_window_for_thread(100, 1) == "@2"
 
+    def test_bind_interns_window_id(self, router: ThreadRouter) -> None:
+        wid = "".join(["@", "77"])
+        router.bind_thread(100, 1, wid, window_name="proj")
+        bound = router.get_window_for_thread(100, 1)
+        assert bound is sys.intern("@77")
+        assert next(iter(router.window_display_names)) is bound
+
 
 class TestUnbindThread:
     def test_unbind_returns_window_id(self, router: ThreadRouter) -> None:
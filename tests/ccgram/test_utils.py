@@ -1,4 +1,6 @@
+import asyncio
 import json
+import threading
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
@@ -20,8 +22,15 @@ from ccgram.utils import (
     read_cwd_from_jsonl,
     read_session_metadata_from_jsonl,
     shorten_path,
+    to_thread_settled,
 )
 
+_PAST_SCAN_LIMIT = (
+    (json.dumps({"type": "init"}) + "\n") * _SCAN_LINES
+    + json.dumps({"cwd": "/too/late"})
+    + "\n"
+).encode()
+
 
 class TestCcgramDir:
     def test_returns_env_var_path(self, monkeypatch: pytest.MonkeyPatch):
@@ -130,9 +139,7 @@ class TestReadCwdFromJsonl:
 
     def test_scan_limit_stops_reading(self, tmp_path: Path):
         f = tmp_path / "session.jsonl"
-        filler = [json.dumps({"type": "init"}) for _ in range(_SCAN_LINES)]
-        filler.append(json.dumps({"cwd": "/too/late"}))
-        f.write_text("\n".join(filler) + "\n")
+        f.write_bytes(_PAST_SCAN_LIMIT)
         assert read_cwd_from_jsonl(f) == ""
 
     def test_malformed_json_lines_skipped(self, tmp_path: Path):
@@ -209,9 +216,7 @@ class TestReadSessionMetadataFromJsonl:
 
     def test_scan_limit_stops_reading(self, tmp_path: Path):
         f = tmp_path / "session.jsonl"
-        filler = [json.dumps({"type": "init"}) for _ in range(_SCAN_LINES)]
-        filler.append(json.dumps({"cwd": "/too/late"}))
-        f.write_text("\n".join(filler) + "\n")
+        f.write_bytes(_PAST_SCAN_LIMIT)
         cwd, summary = read_session_metadata_from_jsonl(f)
         assert cwd == ""
         assert summary == ""
@@ -616,3 +621,29 @@ class TestIsGeneralTopic:
         message.chat = None
         message.message_thread_id = None
         assert is_general_topic(message) is False
+
+
+class TestToThreadSettled:
+    async def test_returns_result(self) -> None:
+        assert await to_thread_settled(sum, [1, 2]) == 3
+
+    async def test_cancel_waits_for_worker(self) -> None:
+        started = threading.Event()
+        release = threading.Event()
+        finished: list[bool] = []
+
+        def work() -> None:
+            started.set()
+            release.wait(5)
+            finished.append(True)
+
+        task = asyncio.create_task(to_thread_settled(work))
+        await asyncio.to_thread(started.wait, 5)
+        task.cancel()
+        await asyncio.sleep(0.05)
+        assert not task.done()
+
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert finished == [True]
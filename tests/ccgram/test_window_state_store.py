@@ -15,6 +15,8 @@ from ccgram.window_state_store import (
     window_store,
 )
 
+pytestmark = pytest.mark.session
+
 
 @pytest.fixture
 def store() -> WindowStateStore:
@@ -105,6 +107,13 @@ class TestWindowStatePanes:
         assert "%5" not in ws.panes
         assert ws.panes["%6"].pane_id == "%6"
 
+    def test_instances_are_slotted(self) -> None:
+        ws = WindowState()
+        assert not hasattr(ws, "__dict__")
+        assert not hasattr(PaneInfo(pane_id="%5"), "__dict__")
+        with pytest.raises(AttributeError):
+            ws.not_a_field = 1  # type: ignore[attr-defined]
+
 
 class TestStoreCRUD:
     def test_get_pane_returns_none_for_missing_window(
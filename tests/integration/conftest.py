@@ -11,6 +11,8 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+_encode_compact = json.JSONEncoder(separators=(",", ":")).encode
+
 
 @pytest.fixture(autouse=True)
 def _default_replace_prompt_mode():
@@ -66,15 +68,14 @@ def append_event(state_dir):
         data: dict | None = None,
         timestamp: float | None = None,
     ) -> None:
-        line = json.dumps(
+        line = _encode_compact(
             {
                 "ts": timestamp or time.time(),
                 "event": event_type,
                 "window_key": window_key,
                 "session_id": session_id,
                 "data": data or {},
-            },
-            separators=(",", ":"),
+            }
         )
         events_file = state_dir / "events.jsonl"
         with open(events_file, "a") as f:
@@ -11,6 +11,7 @@ from ccgram.utils import check_duplicate_ccgram, detect_tmux_context
 
 pytestmark = [
     pytest.mark.integration,
+    pytest.mark.tmux,
     pytest.mark.skipif(shutil.which("tmux") is None, reason="tmux not installed"),
 ]
 
@@ -7,17 +7,22 @@ external dependencies (Bot API, TmuxManager, SessionManager).
 
 import os
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from telegram import Chat, Message, MessageEntity, Update, User
 from telegram.ext import Application
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.ptb]
 
 TEST_USER_ID = 12345
 TEST_CHAT_ID = -100999
 TEST_THREAD_ID = 42
+_TEST_USER = User(id=TEST_USER_ID, first_name="Test", is_bot=False)
+_TEST_CHAT = Chat(id=TEST_CHAT_ID, type="supergroup")
+_BOT_ME = {"id": 1, "first_name": "Bot", "is_bot": True, "username": "testbot"}
+_FAKE_WINDOW = SimpleNamespace(window_id="@0")
 
 
 def _make_update(
@@ -29,11 +34,21 @@ def _make_update(
     user_id=TEST_USER_ID,
     chat_type="supergroup",
 ):
-    user = User(id=user_id, first_name="Test", is_bot=False)
-    chat = Chat(id=TEST_CHAT_ID, type=chat_type)
+    user = (
+        _TEST_USER
+        if user_id == TEST_USER_ID
+        else User(id=user_id, first_name="Test", is_bot=False)
+    )
+    chat = (
+        _TEST_CHAT
+        if chat_type == "supergroup"
+        else Chat(id=TEST_CHAT_ID, type=chat_type)
+    )
     entities = None
     if text and text.startswith("/"):
-        cmd_end = text.index(" ") if " " in text else len(text)
+        cmd_end = text.find(" ")
+        if cmd_end < 0:
+            cmd_end = len(text)
         entities = [
             MessageEntity(type=MessageEntity.BOT_COMMAND, offset=0, length=cmd_end)
         ]
@@ -55,9 +70,9 @@ def _make_update(
     return update
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 async def app():
-    """Real PTB Application with ccgram handlers registered."""
+    """Real PTB Application with ccgram handlers registered, shared per module."""
     token = os.environ["TELEGRAM_BOT_TOKEN"]
     application = Application.builder().token(token).build()
 
@@ -95,19 +110,21 @@ async def app():
         MessageHandler(filters.TEXT & ~filters.COMMAND, text_handler)
     )
 
-    mock_post = AsyncMock(
-        return_value={
-            "id": 1,
-            "first_name": "Bot",
-            "is_bot": True,
-            "username": "testbot",
-        }
-    )
+    mock_post = AsyncMock(return_value=_BOT_ME)
     with patch.object(type(application.bot), "_do_post", mock_post):
         async with application:
             yield application
 
 
+@pytest.fixture(autouse=True)
+def _reset_app_data(app):
+    yield
+    for user_id in list(app.user_data):
+        app.drop_user_data(user_id)
+    for chat_id in list(app.chat_data):
+        app.drop_chat_data(chat_id)
+
+
 async def test_text_routed_to_text_handler(app) -> None:
     update = _make_update("hello world", bot=app.bot)
 
@@ -178,36 +195,26 @@ async def test_history_command_dispatched(app) -> None:
         mock_reply.assert_awaited_once()
 
 
-async def test_unknown_command_forwarded(app) -> None:
+async def test_unknown_command_forwarded(app, monkeypatch) -> None:
     update = _make_update("/sometool", bot=app.bot)
+    fwd = "ccgram.handlers.commands.forward"
+    send = AsyncMock(return_value=(True, "Sent"))
+    monkeypatch.setattr(f"{fwd}.config.is_user_allowed", lambda _uid: True)
+    monkeypatch.setattr(
+        f"{fwd}.thread_router.resolve_window_for_thread", lambda *_a, **_k: "@0"
+    )
+    monkeypatch.setattr(f"{fwd}.thread_router.get_display_name", lambda _w: "test-win")
+    monkeypatch.setattr(
+        f"{fwd}.tmux_manager.find_window_by_id",
+        AsyncMock(return_value=_FAKE_WINDOW),
+    )
+    monkeypatch.setattr(f"{fwd}.send_to_window", send)
+    monkeypatch.setattr(f"{fwd}.safe_reply", AsyncMock())
+    monkeypatch.setattr(Chat, "send_action", AsyncMock())
 
-    with (
-        patch(
-            "ccgram.handlers.commands.forward.config.is_user_allowed",
-            return_value=True,
-        ),
-        patch(
-            "ccgram.handlers.commands.forward.thread_router.resolve_window_for_thread",
-            return_value="@0",
-        ),
-        patch(
-            "ccgram.handlers.commands.forward.tmux_manager.find_window_by_id",
-            new_callable=AsyncMock,
-            return_value=MagicMock(window_id="@0"),
-        ),
-        patch(
-            "ccgram.handlers.commands.forward.send_to_window",
-            new_callable=AsyncMock,
-            return_value=(True, "Sent"),
-        ),
-        patch(
-            "ccgram.handlers.commands.forward.thread_router.get_display_name",
-            return_value="test-win",
-        ),
-        patch("ccgram.handlers.commands.forward.safe_reply", new_callable=AsyncMock),
-        patch.object(Chat, "send_action", new_callable=AsyncMock),
-    ):
-        await app.process_update(update)
+    await app.process_update(update)
+
+    send.assert_awaited_once()
 
 
 async def test_command_priority_over_text(app) -> None:
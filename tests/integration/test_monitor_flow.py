@@ -16,7 +16,7 @@ from ccgram.claude_task_state import get_claude_task_snapshot
 from ccgram.session_monitor import SessionMonitor
 from ccgram.window_state_store import WindowState, window_store
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.monitor]
 
 TEST_SESSION_ID = "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee"
 
@@ -79,22 +79,30 @@ def _make_task_create_entry(
     ]
 
 
+def _jsonl(entries):
+    return "".join(json.dumps(entry) + "\n" for entry in entries)
+
+
 def _write_jsonl(path, entries):
-    with open(path, "w") as f:
-        for entry in entries:
-            f.write(json.dumps(entry) + "\n")
+    path.write_text(_jsonl(entries))
 
 
 def _append_jsonl(path, entries):
     with open(path, "a") as f:
-        for entry in entries:
-            f.write(json.dumps(entry) + "\n")
+        f.write(_jsonl(entries))
+
+
+def _write_session_map(state_dir, session_map):
+    path = state_dir / "session_map.json"
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_bytes(json.dumps(session_map).encode())
+    os.replace(tmp, path)
 
 
 def _bump_mtime(path):
     """Advance file mtime by 2 seconds to ensure change detection."""
     st = os.stat(path)
-    os.utime(path, (st.st_atime, st.st_mtime + 2))
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
 
 
 @pytest.fixture
@@ -111,13 +119,14 @@ def session_map_with_transcript(state_dir):
                 "provider_name": "claude",
             }
         }
-        (state_dir / "session_map.json").write_text(json.dumps(session_map))
+        _write_session_map(state_dir, session_map)
         return session_map
 
     return _setup
 
 
-def _make_monitor(state_dir):
+@pytest.fixture
+def monitor(state_dir):
     return SessionMonitor(
         projects_path=state_dir / "projects",
         poll_interval=0.1,
@@ -126,13 +135,12 @@ def _make_monitor(state_dir):
 
 
 async def test_new_session_initializes_offset(
-    state_dir, session_map_with_transcript
+    state_dir, session_map_with_transcript, monitor
 ) -> None:
     transcript = state_dir / "transcript.jsonl"
     _write_jsonl(transcript, [_make_assistant_entry("old message")])
     session_map = session_map_with_transcript(transcript)
 
-    monitor = _make_monitor(state_dir)
     initial = await monitor.check_for_updates({"@0": session_map["ccgram:@0"]})
     assert len(initial) == 0
 
@@ -142,13 +150,12 @@ async def test_new_session_initializes_offset(
 
 
 async def test_new_session_seeds_claude_task_snapshot(
-    state_dir, session_map_with_transcript
+    state_dir, session_map_with_transcript, monitor
 ) -> None:
     transcript = state_dir / "transcript.jsonl"
     _write_jsonl(transcript, _make_task_create_entry("1", "Review architecture"))
     session_map = session_map_with_transcript(transcript)
 
-    monitor = _make_monitor(state_dir)
     current = {"@0": session_map["ccgram:@0"]}
     assert await monitor.check_for_updates(current) == []
 
@@ -158,48 +165,44 @@ async def test_new_session_seeds_claude_task_snapshot(
     assert snapshot.items[0].subject == "Review architecture"
 
 
-async def test_incremental_read_picks_up_new_messages(
-    state_dir, session_map_with_transcript
-) -> None:
-    transcript = state_dir / "transcript.jsonl"
-    _write_jsonl(transcript, [_make_assistant_entry("old")])
-    session_map = session_map_with_transcript(transcript)
+def _append_new_message(path):
+    _append_jsonl(path, [_make_assistant_entry("new message")])
 
-    monitor = _make_monitor(state_dir)
-    current = {"@0": session_map["ccgram:@0"]}
-    assert await monitor.check_for_updates(current) == []
 
-    _append_jsonl(transcript, [_make_assistant_entry("new message")])
-    _bump_mtime(transcript)
-    new_messages = await monitor.check_for_updates(current)
-    assert len(new_messages) == 1
-    assert new_messages[0].text == "new message"
-    assert new_messages[0].session_id == TEST_SESSION_ID
+def _truncate_and_rewrite(path):
+    path.write_text("")
+    _write_jsonl(path, [_make_assistant_entry("after truncation")])
 
 
-async def test_file_truncation_resets_offset(
-    state_dir, session_map_with_transcript
+@pytest.mark.parametrize(
+    ("initial", "mutate", "expected"),
+    [
+        (["old"], _append_new_message, "new message"),
+        (["msg1", "msg2"], _truncate_and_rewrite, "after truncation"),
+    ],
+    ids=["incremental_read", "truncation_resets_offset"],
+)
+async def test_transcript_change_delivers_new_message(
+    state_dir, session_map_with_transcript, monitor, initial, mutate, expected
 ) -> None:
     transcript = state_dir / "transcript.jsonl"
-    _write_jsonl(
-        transcript,
-        [_make_assistant_entry("msg1"), _make_assistant_entry("msg2")],
-    )
+    _write_jsonl(transcript, [_make_assistant_entry(text) for text in initial])
     session_map = session_map_with_transcript(transcript)
 
-    monitor = _make_monitor(state_dir)
     current = {"@0": session_map["ccgram:@0"]}
     assert await monitor.check_for_updates(current) == []
 
-    transcript.write_text("")
-    _write_jsonl(transcript, [_make_assistant_entry("after truncation")])
+    mutate(transcript)
     _bump_mtime(transcript)
     new_messages = await monitor.check_for_updates(current)
     assert len(new_messages) == 1
-    assert new_messages[0].text == "after truncation"
+    assert new_messages[0].text == expected
+    assert new_messages[0].session_id == TEST_SESSION_ID
 
 
-async def test_nested_session_start_does_not_steal_forwarding(state_dir) -> None:
+async def test_nested_session_start_does_not_steal_forwarding(
+    state_dir, monitor
+) -> None:
     parent_id = TEST_SESSION_ID
     child_id = "11111111-2222-3333-4444-555555555555"
     parent_transcript = state_dir / "parent.jsonl"
@@ -215,21 +218,19 @@ async def test_nested_session_start_does_not_steal_forwarding(state_dir) -> None
         transcript_path=str(parent_transcript),
         provider_name="claude",
     )
-    (state_dir / "session_map.json").write_text(
-        json.dumps(
-            {
-                "ccgram:@0": {
-                    "session_id": child_id,
-                    "cwd": "/tmp/test",
-                    "window_name": "test",
-                    "transcript_path": str(child_transcript),
-                    "provider_name": "claude",
-                }
+    _write_session_map(
+        state_dir,
+        {
+            "ccgram:@0": {
+                "session_id": child_id,
+                "cwd": "/tmp/test",
+                "window_name": "test",
+                "transcript_path": str(child_transcript),
+                "provider_name": "claude",
             }
-        )
+        },
     )
 
-    monitor = _make_monitor(state_dir)
     current = await monitor._load_current_session_map()
     assert current["@0"]["session_id"] == parent_id
     assert await monitor.check_for_updates(current) == []
@@ -246,12 +247,13 @@ async def test_nested_session_start_does_not_steal_forwarding(state_dir) -> None
     assert monitor.state.get_session(child_id) is None
 
 
-async def test_session_change_cleanup(state_dir, session_map_with_transcript) -> None:
+async def test_session_change_cleanup(
+    state_dir, session_map_with_transcript, monitor
+) -> None:
     transcript = state_dir / "transcript.jsonl"
     _write_jsonl(transcript, _make_task_create_entry("1", "Old task"))
     session_map_with_transcript(transcript)
 
-    monitor = _make_monitor(state_dir)
     old_map = {
         "@0": {
             "session_id": TEST_SESSION_ID,
@@ -273,9 +275,7 @@ async def test_session_change_cleanup(state_dir, session_map_with_transcript) ->
             "transcript_path": str(transcript),
         }
     }
-    (state_dir / "session_map.json").write_text(
-        json.dumps({"ccgram:@0": new_map["@0"]})
-    )
+    _write_session_map(state_dir, {"ccgram:@0": new_map["@0"]})
     await monitor._detect_and_cleanup_changes()
 
     assert monitor.state.get_session(TEST_SESSION_ID) is None
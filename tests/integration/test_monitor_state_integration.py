@@ -4,7 +4,7 @@ import pytest
 
 from ccgram.monitor_state import MonitorState, TrackedSession
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.monitor]
 
 
 class TestMonitorStateIntegration:
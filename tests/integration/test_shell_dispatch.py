@@ -19,7 +19,7 @@ from telegram import (
 )
 from telegram.ext import Application
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.ptb]
 
 TEST_USER_ID = 12345
 TEST_CHAT_ID = -100999
@@ -111,7 +111,6 @@ async def app():
             yield application
 
 
-@pytest.mark.asyncio()
 async def test_text_in_shell_topic_reaches_text_handler(app) -> None:
     update = _make_text_update("list files", bot=app.bot)
 
@@ -133,7 +132,6 @@ async def test_text_in_shell_topic_reaches_text_handler(app) -> None:
         assert call_args[0].message.message_thread_id == TEST_THREAD_ID
 
 
-@pytest.mark.asyncio()
 async def test_bang_prefix_reaches_text_handler(app) -> None:
     update = _make_text_update("!ls -la", bot=app.bot)
 
@@ -154,7 +152,6 @@ async def test_bang_prefix_reaches_text_handler(app) -> None:
         assert call_args[0].message.text == "!ls -la"
 
 
-@pytest.mark.asyncio()
 async def test_shell_callback_dispatches_to_shell_handler(app) -> None:
     from ccgram.handlers.callback_data import CB_SHELL_RUN
 
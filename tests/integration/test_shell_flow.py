@@ -42,7 +42,6 @@ def _clean_state():
 
 
 class TestRawCommandFlow:
-    @pytest.mark.asyncio()
     async def test_bang_prefix_sends_to_tmux_and_marks_command(self) -> None:
         bot = AsyncMock(spec=Bot)
         message = AsyncMock(spec=Message)
@@ -85,7 +84,6 @@ class TestRawCommandFlow:
                 TEST_THREAD_ID,
             )
 
-    @pytest.mark.asyncio()
     async def test_raw_command_output_relayed_via_passive_monitor(self) -> None:
         from ccgram.handlers.shell.shell_capture import (
             _shell_monitor_state,
@@ -127,7 +125,6 @@ class TestRawCommandFlow:
         assert state.msg_id == 99
         assert state.last_command_echo == "ccgram:0❯ ls -la"
 
-    @pytest.mark.asyncio()
     async def test_raw_command_error_shows_exit_indicator(self) -> None:
         from ccgram.handlers.shell.shell_capture import (
             _shell_monitor_state,
@@ -169,7 +166,6 @@ class TestRawCommandFlow:
 
 
 class TestLlmCommandFlow:
-    @pytest.mark.asyncio()
     async def test_nl_generates_command_and_shows_approval(self) -> None:
         bot = AsyncMock(spec=Bot)
         message = AsyncMock(spec=Message)
@@ -217,7 +213,6 @@ class TestLlmCommandFlow:
         assert pending[0] == "ls -la"
         assert pending[1] == TEST_USER_ID
 
-    @pytest.mark.asyncio()
     async def test_no_llm_falls_back_to_raw(self) -> None:
         bot = AsyncMock(spec=Bot)
         message = AsyncMock(spec=Message)
@@ -255,7 +250,6 @@ class TestLlmCommandFlow:
 
 
 class TestErrorRecovery:
-    @pytest.mark.asyncio()
     async def test_telegram_command_error_triggers_fix_suggestion(self) -> None:
         from ccgram.handlers.shell.shell_capture import (
             _shell_monitor_state,
@@ -317,7 +311,6 @@ class TestErrorRecovery:
         state = _shell_monitor_state[TEST_WINDOW_ID]
         assert state.telegram_command == ""
 
-    @pytest.mark.asyncio()
     async def test_fix_suggestion_skipped_when_no_llm(self) -> None:
         from ccgram.handlers.shell.shell_capture import (
             check_passive_shell_output,
@@ -361,7 +354,6 @@ class TestErrorRecovery:
 
 
 class TestPassiveMonitoringRoundTrip:
-    @pytest.mark.asyncio()
     async def test_in_progress_then_completed_edits_message(self) -> None:
         from ccgram.handlers.shell.shell_capture import (
             _shell_monitor_state,
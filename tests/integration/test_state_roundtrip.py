@@ -18,6 +18,17 @@ from ccgram.window_state_store import window_store
 
 pytestmark = pytest.mark.integration
 
+_DUP_BINDINGS_STATE = json.dumps(
+    {
+        "window_states": {},
+        "user_window_offsets": {},
+        "thread_bindings": {"1": {"10": "@0", "20": "@0"}},
+        "group_chat_ids": {},
+        "window_display_names": {},
+        "user_dir_favorites": {},
+    }
+)
+
 
 @pytest.fixture
 def make_session_manager(tmp_path, monkeypatch):
@@ -131,16 +142,8 @@ async def test_window_state_survives_reload(make_session_manager) -> None:
 
 async def test_duplicate_bindings_deduped_on_load(tmp_path, monkeypatch) -> None:
     """Old state with duplicate bindings — loader keeps highest thread_id."""
-    state = {
-        "window_states": {},
-        "user_window_offsets": {},
-        "thread_bindings": {"1": {"10": "@0", "20": "@0"}},
-        "group_chat_ids": {},
-        "window_display_names": {},
-        "user_dir_favorites": {},
-    }
     sf = tmp_path / "state.json"
-    sf.write_text(json.dumps(state))
+    sf.write_text(_DUP_BINDINGS_STATE)
     monkeypatch.setattr("ccgram.config.config.state_file", sf)
     monkeypatch.setattr(
         "ccgram.config.config.session_map_file", tmp_path / "session_map.json"
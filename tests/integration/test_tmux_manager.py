@@ -1,7 +1,9 @@
 """Integration tests for TmuxManager with a real tmux server."""
 
 import asyncio
+import os
 import shutil
+from collections.abc import Awaitable, Callable
 
 import pytest
 
@@ -9,14 +11,30 @@ from ccgram.tmux_manager import TmuxManager
 
 pytestmark = [
     pytest.mark.integration,
+    pytest.mark.tmux,
     pytest.mark.skipif(shutil.which("tmux") is None, reason="tmux not installed"),
 ]
 
-TEST_SESSION = "ccgram-test-integration"
+TEST_SESSION = (
+    f"ccgram-test-integration-{os.environ.get('PYTEST_XDIST_WORKER', 'main')}"
+)
 
 
-@pytest.fixture()
-async def tmux(tmp_path):
+async def _wait_for_output(
+    capture: Callable[[], Awaitable[str | None]], needle: str, timeout: float = 5.0
+) -> str:
+    async def _poll() -> str:
+        while True:
+            output = await capture()
+            if output and needle in output:
+                return output
+            await asyncio.sleep(0.02)
+
+    return await asyncio.wait_for(_poll(), timeout=timeout)
+
+
+@pytest.fixture(scope="module")
+def tmux_server():
     mgr = TmuxManager(session_name=TEST_SESSION)
     mgr.get_or_create_session()
     yield mgr
@@ -25,6 +43,26 @@ async def tmux(tmp_path):
         session.kill()
 
 
+@pytest.fixture()
+async def tmux(tmux_server):
+    existing = {w.window_id for w in await tmux_server.list_windows()}
+    yield tmux_server
+    for w in await tmux_server.list_windows():
+        if w.window_id not in existing:
+            await tmux_server.kill_window(w.window_id)
+
+
+@pytest.fixture(scope="module")
+async def shared_window(tmux_server, tmp_path_factory) -> str:
+    ok, _msg, _name, window_id = await tmux_server.create_window(
+        str(tmp_path_factory.mktemp("shared")),
+        window_name="shared-ro",
+        start_agent=False,
+    )
+    assert ok
+    return window_id
+
+
 async def test_create_and_list_windows(tmux, tmp_path) -> None:
     ok, _msg, name, window_id = await tmux.create_window(
         str(tmp_path), window_name="test-win", start_agent=False
@@ -63,10 +101,9 @@ async def test_send_keys_and_capture_pane(tmux, tmp_path) -> None:
 
     await tmux.send_keys(window_id, "echo hello-integration")
 
-    await asyncio.sleep(0.5)
-
-    output = await tmux.capture_pane(window_id)
-    assert output is not None
+    output = await _wait_for_output(
+        lambda: tmux.capture_pane(window_id), "hello-integration"
+    )
     assert "hello-integration" in output
 
 
@@ -124,8 +161,7 @@ async def test_capture_pane_raw_returns_tuple(tmux, tmp_path) -> None:
 
     # Send something so pane has content (empty panes return None)
     await tmux.send_keys(window_id, "echo raw-test-output")
-
-    await asyncio.sleep(0.5)
+    await _wait_for_output(lambda: tmux.capture_pane(window_id), "raw-test-output")
 
     result = await tmux.capture_pane_raw(window_id)
     assert result is not None
@@ -136,26 +172,16 @@ async def test_capture_pane_raw_returns_tuple(tmux, tmp_path) -> None:
     assert rows > 0
 
 
-async def test_get_pane_title(tmux, tmp_path) -> None:
-    ok, _msg, _name, window_id = await tmux.create_window(
-        str(tmp_path), window_name="title-test", start_agent=False
-    )
-    assert ok
-
-    title = await tmux.get_pane_title(window_id)
+async def test_get_pane_title(tmux_server, shared_window) -> None:
+    title = await tmux_server.get_pane_title(shared_window)
     assert isinstance(title, str)
 
 
 # ── Pane-level operations ────────────────────────────────────────────
 
 
-async def test_list_panes_single(tmux, tmp_path) -> None:
-    ok, _msg, _name, window_id = await tmux.create_window(
-        str(tmp_path), window_name="pane-list", start_agent=False
-    )
-    assert ok
-
-    panes = await tmux.list_panes(window_id)
+async def test_list_panes_single(tmux_server, shared_window) -> None:
+    panes = await tmux_server.list_panes(shared_window)
     assert len(panes) == 1
     assert panes[0].active is True
     assert panes[0].pane_id.startswith("%")
@@ -198,10 +224,10 @@ async def test_capture_pane_by_id(tmux, tmp_path) -> None:
     pane_id = panes[0].pane_id
 
     await tmux.send_keys(window_id, "echo pane-capture-test")
-    await asyncio.sleep(0.5)
 
-    output = await tmux.capture_pane_by_id(pane_id)
-    assert output is not None
+    output = await _wait_for_output(
+        lambda: tmux.capture_pane_by_id(pane_id), "pane-capture-test"
+    )
     assert "pane-capture-test" in output
 
 
@@ -229,10 +255,10 @@ async def test_send_keys_to_pane(tmux, tmp_path) -> None:
     inactive = next(p for p in panes if not p.active)
     sent = await tmux.send_keys_to_pane(inactive.pane_id, "echo pane-target-test")
     assert sent is True
-    await asyncio.sleep(0.5)
 
-    output = await tmux.capture_pane_by_id(inactive.pane_id)
-    assert output is not None
+    output = await _wait_for_output(
+        lambda: tmux.capture_pane_by_id(inactive.pane_id), "pane-target-test"
+    )
     assert "pane-target-test" in output
 
 
@@ -33,7 +33,7 @@ from ccgram.toolbar_config import (
     ToolbarLayout,
 )
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.ptb]
 
 TEST_USER_ID = 12345
 TEST_CHAT_ID = -100999
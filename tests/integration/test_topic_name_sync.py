@@ -8,7 +8,7 @@ from telegram.ext import Application
 
 from ccgram.session import AuditResult
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.ptb]
 
 TEST_USER_ID = 12345
 TEST_CHAT_ID = -100999